@@ -0,0 +1,167 @@
+# VibeStation Backend - Native asyncio transport for ytmusicapi
+import copy
+import json
+import logging
+
+from ytmusicapi.constants import YTM_BASE_API
+from ytmusicapi.exceptions import YTMusicServerError
+
+logger = logging.getLogger(__name__)
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Requests one call may issue natively before it is finished in a thread instead;
+# each extra request re-runs the (cheap) ytmusicapi parsing of the earlier ones
+MAX_NATIVE_ROUNDS = 6
+
+
+class _PendingRequest(BaseException):
+    """Raised out of ytmusicapi code when a response has not been fetched yet.
+
+    BaseException so ytmusicapi's own `except Exception` blocks do not swallow it.
+    """
+
+    def __init__(self, fingerprint: str, endpoint: str, body: dict, additional_params: str):
+        super().__init__(endpoint)
+        self.fingerprint = fingerprint
+        self.endpoint = endpoint
+        self.body = body
+        self.additional_params = additional_params
+
+
+class _NeedsThread(BaseException):
+    """Raised when ytmusicapi wants a plain GET (e.g. player base.js); finish in a thread"""
+
+
+def _fingerprint(endpoint: str, body: dict, additional_params: str) -> str:
+    return endpoint + additional_params + json.dumps(body, sort_keys=True, separators=(",", ":"))
+
+
+class AsyncYTMusicTransport:
+    """Issues ytmusicapi's InnerTube POSTs on the event loop over a pooled httpx client.
+
+    ytmusicapi methods are run against a shallow copy of the client whose
+    _send_request serves recorded responses. The first unrecorded request aborts the
+    run, is fetched with `await`, and the method is replayed, so ytmusicapi's parsers
+    are reused unchanged and no thread is held while waiting on the network.
+    """
+
+    def __init__(self, max_connections: int = 100, http2: bool = True):
+        try:
+            self._client = self._new_client(max_connections, http2)
+            self.http2 = http2
+        except ImportError:
+            # http2=True needs the h2 package
+            self._client = self._new_client(max_connections, False)
+            self.http2 = False
+        self.native_calls = 0
+        self.thread_fallbacks = 0
+        self.requests = 0
+
+    @staticmethod
+    def _new_client(max_connections: int, http2: bool):
+        return httpx.AsyncClient(
+            http2=http2,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+
+    async def call(self, ytmusic, method, *args, run_in_thread, **kwargs):
+        """Run `ytmusic.<method>(*args)` (or `method(ytmusic, *args)`) with native I/O.
+
+        run_in_thread is used for clients that still need a blocking visitor-id fetch
+        and for calls that exceed MAX_NATIVE_ROUNDS or need a non-InnerTube GET.
+        """
+        if "base_headers" not in ytmusic.__dict__:
+            await run_in_thread(lambda: ytmusic.base_headers)
+
+        responses: dict[str, bytes] = {}
+        replay = copy.copy(ytmusic)
+
+        def send_request(endpoint: str, body: dict, additionalParams: str = "") -> dict:
+            body.update(ytmusic.context)
+            fingerprint = _fingerprint(endpoint, body, additionalParams)
+            if fingerprint in responses:
+                # Fresh dict per replay: some parsers pop items out of the response
+                return json.loads(responses[fingerprint])
+            raise _PendingRequest(fingerprint, endpoint, body, additionalParams)
+
+        def send_get_request(*_args, **_kwargs):
+            raise _NeedsThread()
+
+        replay._send_request = send_request
+        replay._send_get_request = send_get_request
+        bound = self._bind(replay, method)
+
+        for _ in range(MAX_NATIVE_ROUNDS):
+            try:
+                result = bound(*args, **kwargs)
+                self.native_calls += 1
+                return result
+            except _PendingRequest as pending:
+                responses[pending.fingerprint] = await self._post(ytmusic, pending)
+            except _NeedsThread:
+                break
+
+        self.thread_fallbacks += 1
+        return await run_in_thread(self._finish_in_thread, ytmusic, method, responses, args, kwargs)
+
+    @staticmethod
+    def _bind(ytmusic, method):
+        if callable(method):
+            return lambda *a, **kw: method(ytmusic, *a, **kw)
+        return getattr(ytmusic, method)
+
+    def _finish_in_thread(self, ytmusic, method, responses: dict, args, kwargs):
+        """Blocking completion that still reuses every response fetched natively"""
+        replay = copy.copy(ytmusic)
+
+        def send_request(endpoint: str, body: dict, additionalParams: str = "") -> dict:
+            body.update(ytmusic.context)
+            fingerprint = _fingerprint(endpoint, body, additionalParams)
+            if fingerprint in responses:
+                return json.loads(responses[fingerprint])
+            return ytmusic._send_request(endpoint, body, additionalParams)
+
+        replay._send_request = send_request
+        return self._bind(replay, method)(*args, **kwargs)
+
+    async def _post(self, ytmusic, pending: _PendingRequest) -> bytes:
+        self.requests += 1
+        response = await self._client.post(
+            YTM_BASE_API + pending.endpoint + ytmusic.params + pending.additional_params,
+            json=pending.body,
+            headers=dict(ytmusic.headers),
+            cookies=ytmusic.cookies,
+        )
+        if response.status_code >= 400:
+            message = f"Server returned HTTP {response.status_code}: {response.reason_phrase}.\n"
+            try:
+                error = response.json().get("error", {}).get("message", "")
+            except ValueError:
+                error = ""
+            raise YTMusicServerError(message + error)
+        return response.content
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    def stats(self) -> dict:
+        return {
+            "http2": self.http2,
+            "native_calls": self.native_calls,
+            "thread_fallbacks": self.thread_fallbacks,
+            "requests": self.requests,
+        }
+
+
+def create_transport(enabled: bool, max_connections: int = 100) -> AsyncYTMusicTransport | None:
+    if not enabled:
+        return None
+    if httpx is None:
+        logger.warning("httpx not installed, ytmusicapi calls stay on the thread pool")
+        return None
+    return AsyncYTMusicTransport(max_connections=max_connections)
@@ -0,0 +1,131 @@
+# VibeStation Backend - Chunked multi-row upserts for catalog persistence
+#
+# Saving a discography one upsert per track costs one HTTP round trip per row.
+# BulkWriter buffers rows per (table, on_conflict) and sends them as multi-row
+# upserts of up to chunk_size rows:
+#
+#   with BulkWriter(supabase_client) as writer:
+#       for track in tracks:
+#           writer.add("music_tracks", row, on_conflict="video_id")
+#   # flushed on exit
+import logging
+import threading
+import time
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+
+class BulkWriter:
+    """Buffers upsert rows and flushes them in chunks.
+
+    A buffer is flushed when it reaches chunk_size rows, when its oldest row is
+    older than max_delay seconds (checked on add), and on flush()/close().
+    Rows in one statement must share their columns and may not repeat a conflict
+    key, so buffers are split by column set and a repeated key keeps the last row.
+    on_flush(table, rows) receives the rows returned by each successful upsert;
+    rows that could not be written are kept in failed[table].
+    """
+
+    def __init__(self, client, chunk_size: int = 500, max_delay: float = 2.0, on_flush=None):
+        self.client = client
+        self.chunk_size = chunk_size
+        self.max_delay = max_delay
+        self.on_flush = on_flush
+        # (table, on_conflict, columns) -> {conflict key values: row}
+        self._buffers: dict[tuple, dict] = {}
+        self._first_added: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self.rows = 0
+        self.table_rows: dict[str, int] = defaultdict(int)
+        self.statements = 0
+        self.failed_rows = 0
+        self.failed: dict[str, list] = defaultdict(list)
+        self.write_seconds = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add(self, table: str, row: dict, on_conflict: str) -> None:
+        key = (table, on_conflict, tuple(sorted(row)))
+        conflict_values = tuple(row.get(column.strip()) for column in on_conflict.split(","))
+        with self._lock:
+            buffer = self._buffers.setdefault(key, {})
+            buffer[conflict_values] = row
+            first_added = self._first_added.setdefault(key, time.monotonic())
+            due = len(buffer) >= self.chunk_size or time.monotonic() - first_added >= self.max_delay
+            rows = self._take(key) if due else None
+        if rows:
+            self._write(table, on_conflict, rows)
+
+    def add_many(self, table: str, rows, on_conflict: str) -> None:
+        for row in rows:
+            self.add(table, row, on_conflict)
+
+    def _take(self, key: tuple) -> list:
+        self._first_added.pop(key, None)
+        return list(self._buffers.pop(key, {}).values())
+
+    def flush(self) -> None:
+        with self._lock:
+            pending = [(key, self._take(key)) for key in list(self._buffers)]
+        for (table, on_conflict, _), rows in pending:
+            if rows:
+                self._write(table, on_conflict, rows)
+
+    def _write(self, table: str, on_conflict: str, rows: list) -> None:
+        for start in range(0, len(rows), self.chunk_size):
+            chunk = rows[start:start + self.chunk_size]
+            started = time.monotonic()
+            try:
+                saved = self._upsert(table, chunk, on_conflict)
+                written = len(chunk)
+            except Exception as e:
+                # One bad row fails the whole statement: retry row by row
+                logger.warning(f"Bulk upsert into {table} failed ({len(chunk)} rows), retrying per row: {e}")
+                saved, written = [], 0
+                for row in chunk:
+                    try:
+                        saved += self._upsert(table, [row], on_conflict)
+                        written += 1
+                    except Exception as row_error:
+                        self.failed_rows += 1
+                        self.failed[table].append(row)
+                        logger.warning(f"Upsert into {table} failed: {row_error}")
+            self.write_seconds += time.monotonic() - started
+            self.rows += written
+            self.table_rows[table] += written
+            if saved and self.on_flush:
+                try:
+                    self.on_flush(table, saved)
+                except Exception as e:
+                    logger.warning(f"Bulk upsert on_flush error: {e}")
+
+    def _upsert(self, table: str, rows: list, on_conflict: str) -> list:
+        self.statements += 1
+        result = self.client.table(table).upsert(rows, on_conflict=on_conflict).execute()
+        return result.data or []
+
+    def close(self) -> dict:
+        self.flush()
+        stats = self.stats()
+        if stats["rows"] or stats["failed_rows"]:
+            logger.info(
+                f"Bulk upsert: {stats['rows']} rows in {stats['statements']} statements, "
+                f"{stats['rows_per_sec']} rows/s ({stats['failed_rows']} failed)"
+            )
+        return stats
+
+    def stats(self) -> dict:
+        return {
+            "rows": self.rows,
+            "statements": self.statements,
+            "failed_rows": self.failed_rows,
+            "write_seconds": round(self.write_seconds, 3),
+            "rows_per_sec": round(self.rows / self.write_seconds) if self.write_seconds else 0,
+            "elapsed_seconds": round(time.monotonic() - self._started, 3),
+        }
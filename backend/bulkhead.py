@@ -0,0 +1,97 @@
+# VibeStation Backend - Per-endpoint-class bulkheads and load shedding
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+
+class BulkheadFull(Exception):
+    def __init__(self, bulkhead: "Bulkhead"):
+        super().__init__(f"{bulkhead.name} queue full")
+        self.bulkhead = bulkhead
+
+
+class Bulkhead:
+    """Bounded concurrency + bounded wait queue + a dedicated thread pool for one endpoint class.
+
+    Requests beyond max_concurrent wait in the queue; once max_queue are waiting, new
+    requests are rejected immediately (BulkheadFull) instead of piling up.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int, workers: int, retry_after: int):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"bulkhead-{name}")
+        self.workers = workers
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self.active = 0
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.completed = 0
+        self.rejected = 0
+
+    @asynccontextmanager
+    async def slot(self):
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                self.rejected += 1
+                raise BulkheadFull(self)
+            self.waiting += 1
+            self.peak_waiting = max(self.peak_waiting, self.waiting)
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        self.active += 1
+        try:
+            yield self
+        finally:
+            self.active -= 1
+            self.completed += 1
+            self._semaphore.release()
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "active": self.active,
+            "queue_depth": self.waiting,
+            "peak_queue_depth": self.peak_waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+def create_bulkheads() -> dict[str, Bulkhead]:
+    """interactive / heavy / background classes, sized from the CPU count unless
+    overridden with BULKHEAD_<CLASS>_{CONCURRENCY,QUEUE,WORKERS}"""
+    cpus = os.cpu_count() or 1
+    defaults = {
+        # name: (max_concurrent, max_queue, workers, retry_after)
+        "interactive": (64, 128, max(4, cpus * 2), 1),
+        "heavy": (8, 16, max(2, cpus // 2), 5),
+        "background": (2, 256, 1, 30),
+    }
+    bulkheads = {}
+    for name, (concurrency, queue, workers, retry_after) in defaults.items():
+        prefix = f"BULKHEAD_{name.upper()}_"
+        bulkheads[name] = Bulkhead(
+            name,
+            max_concurrent=_env_int(prefix + "CONCURRENCY", concurrency),
+            max_queue=_env_int(prefix + "QUEUE", queue),
+            workers=_env_int(prefix + "WORKERS", workers),
+            retry_after=retry_after,
+        )
+    return bulkheads
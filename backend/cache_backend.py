@@ -0,0 +1,199 @@
+# VibeStation Backend - Shared cache backends (in-memory / Redis protocol)
+import json
+import logging
+import zlib
+from abc import ABC, abstractmethod
+
+from response_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+KEY_PREFIX = "vibestation"
+
+# Bump an endpoint's version to invalidate every shared entry it wrote (unlisted: v1)
+CACHE_VERSIONS = {
+    "artist": 1,
+    "artist_albums": 2,  # v2: merged albums + singles
+    "album": 1,
+    "playlist": 1,
+}
+
+# Payloads smaller than this are stored uncompressed
+COMPRESS_MIN_BYTES = 1024
+
+# One-byte headers: serialization format + compression flag
+_FORMAT_JSON = b"j"
+_FORMAT_MSGPACK = b"m"
+_RAW = b"-"
+_ZLIB = b"z"
+
+
+def namespaced_key(endpoint: str, key: str) -> str:
+    """vibestation:<endpoint>:v<version>:<key>"""
+    return f"{KEY_PREFIX}:{endpoint}:v{CACHE_VERSIONS.get(endpoint, 1)}:{key}"
+
+
+def encode(value) -> bytes:
+    if msgpack is not None:
+        fmt, body = _FORMAT_MSGPACK, msgpack.packb(value, default=str)
+    else:
+        fmt, body = _FORMAT_JSON, json.dumps(value, ensure_ascii=False, default=str).encode()
+    if len(body) >= COMPRESS_MIN_BYTES:
+        return fmt + _ZLIB + zlib.compress(body, 6)
+    return fmt + _RAW + body
+
+
+def decode(data: bytes):
+    fmt, flag, body = data[:1], data[1:2], data[2:]
+    if flag == _ZLIB:
+        body = zlib.decompress(body)
+    if fmt == _FORMAT_MSGPACK:
+        if msgpack is None:
+            raise ValueError("msgpack payload but msgpack is not installed")
+        return msgpack.unpackb(body)
+    return json.loads(body)
+
+
+class CacheBackend(ABC):
+    """Shared byte cache. Failures are counted and treated as misses, never raised.
+
+    Subclasses implement the raw byte operations _get/_set/_delete.
+    """
+
+    name = "base"
+    # True when other instances read what this one writes (entries must be portable)
+    shared = False
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @abstractmethod
+    async def _get(self, key: str) -> bytes | None:
+        ...
+
+    @abstractmethod
+    async def _set(self, key: str, data: bytes, ttl: int) -> None:
+        ...
+
+    @abstractmethod
+    async def _delete(self, key: str) -> None:
+        ...
+
+    async def get(self, endpoint: str, key: str):
+        try:
+            data = await self._get(namespaced_key(endpoint, key))
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return decode(data)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Shared cache get failed ({self.name}): {e}")
+            return None
+
+    async def set(self, endpoint: str, key: str, value, ttl: int) -> None:
+        try:
+            await self._set(namespaced_key(endpoint, key), encode(value), ttl)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Shared cache set failed ({self.name}): {e}")
+
+    async def delete(self, endpoint: str, key: str) -> None:
+        try:
+            await self._delete(namespaced_key(endpoint, key))
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Shared cache delete failed ({self.name}): {e}")
+
+    async def close(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        return {
+            "backend": self.name,
+            "serializer": "msgpack" if msgpack is not None else "json",
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+        }
+
+
+class MemoryBackend(CacheBackend):
+    """Local stand-in with the same encode/namespace path as Redis"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 4096):
+        super().__init__()
+        self._cache = TTLCache(max_entries=max_entries)
+
+    async def _get(self, key: str) -> bytes | None:
+        return self._cache.get(key)
+
+    async def _set(self, key: str, data: bytes, ttl: int) -> None:
+        self._cache.set(key, data, ttl, size=len(data))
+
+    async def _delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+
+class RedisBackend(CacheBackend):
+    """Any client speaking the redis.asyncio API (Redis, Valkey, fakeredis)"""
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, client):
+        super().__init__()
+        self._client = client
+
+    async def _get(self, key: str) -> bytes | None:
+        return await self._client.get(key)
+
+    async def _set(self, key: str, data: bytes, ttl: int) -> None:
+        await self._client.set(key, data, ex=ttl)
+
+    async def _delete(self, key: str) -> None:
+        await self._client.delete(key)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+def create_backend(kind: str | None, redis_url: str | None = None) -> CacheBackend | None:
+    """Build the backend named by CACHE_BACKEND: memory, redis, fakeredis (or none)"""
+    kind = (kind or "").lower()
+    if kind in ("", "none"):
+        return None
+    if kind == "memory":
+        return MemoryBackend()
+    if kind == "fakeredis":
+        try:
+            from fakeredis import aioredis as fake_aioredis
+            backend = RedisBackend(fake_aioredis.FakeRedis())
+            backend.name = "fakeredis"
+            backend.shared = False  # in-process only
+            return backend
+        except ImportError:
+            logger.warning("fakeredis not installed, shared cache disabled")
+            return None
+    if kind == "redis":
+        if not redis_url:
+            logger.warning("CACHE_BACKEND=redis but REDIS_URL is not set, shared cache disabled")
+            return None
+        try:
+            import redis.asyncio as aioredis
+            return RedisBackend(aioredis.from_url(redis_url, socket_timeout=0.5))
+        except ImportError:
+            logger.warning("redis not installed, shared cache disabled")
+            return None
+    logger.warning(f"Unknown CACHE_BACKEND '{kind}', shared cache disabled")
+    return None
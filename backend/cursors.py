@@ -0,0 +1,63 @@
+# VibeStation Backend - Opaque, HMAC-signed pagination cursors
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import secrets
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+class CursorCodec:
+    """Signs paging states so clients can pass them back but not forge or edit them.
+
+    A cursor is base64url(json state + scope + issue time) "." base64url(HMAC-SHA256).
+    The scope (e.g. "playlist:PL...") ties a cursor to the resource it was issued for.
+    """
+
+    def __init__(self, secret: str | None, max_age: int = 86400):
+        if not secret:
+            # Cursors then only validate on this instance until it restarts
+            logger.warning("CURSOR_SECRET not set, using a random per-process key")
+            secret = secrets.token_hex(32)
+        self._key = secret.encode()
+        self.max_age = max_age
+
+    def _sign(self, body: bytes) -> bytes:
+        return hmac.new(self._key, body, hashlib.sha256).digest()[:16]
+
+    def encode(self, scope: str, state: dict | None) -> str | None:
+        if state is None:
+            return None
+        body = json.dumps({"s": scope, "t": int(time.time()), "p": state}, separators=(",", ":")).encode()
+        return f"{_b64encode(body)}.{_b64encode(self._sign(body))}"
+
+    def decode(self, scope: str, cursor: str) -> dict:
+        try:
+            body_text, signature = cursor.split(".", 1)
+            body = _b64decode(body_text)
+            valid = hmac.compare_digest(_b64decode(signature), self._sign(body))
+        except (ValueError, TypeError):
+            raise InvalidCursor("Malformed cursor")
+        if not valid:
+            raise InvalidCursor("Invalid cursor signature")
+        data = json.loads(body)
+        if data["s"] != scope:
+            raise InvalidCursor("Cursor does not belong to this resource")
+        if time.time() - data["t"] > self.max_age:
+            raise InvalidCursor("Cursor expired")
+        return data["p"]
@@ -0,0 +1,120 @@
+# VibeStation Backend - Artist discography (albums + singles) without re-fetching the artist
+import asyncio
+import hashlib
+import logging
+
+from response_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Artist page sections expanded by get_artist_albums, with the type given to untyped items
+SECTIONS = (("albums", "Album"), ("singles", "Single"))
+
+
+class Discography:
+    """Remembers each artist's section browse params from any get_artist result.
+
+    fetch() then expands the albums and singles sections concurrently; get_artist is
+    only called when no params were seen for the artist within ttl.
+    """
+
+    def __init__(self, ttl: int = 21600, max_artists: int = 8192):
+        self.ttl = ttl
+        self._sections = TTLCache(max_entries=max_artists, stale_grace=0)
+        self.artist_fetches = 0
+
+    def remember(self, artist_id: str, artist: dict | None) -> None:
+        if not isinstance(artist, dict):
+            return
+        sections = {}
+        for name, _ in SECTIONS:
+            section = artist.get(name)
+            if isinstance(section, dict):
+                sections[name] = {
+                    "browseId": section.get("browseId"),
+                    "params": section.get("params"),
+                    "results": section.get("results") or [],
+                }
+        self._sections.set(artist_id, sections, self.ttl)
+
+    async def sections(self, artist_id: str, get_artist) -> dict:
+        """{"albums": {browseId, params, results}, "singles": ...}; get_artist only on a miss"""
+        sections = self._sections.get(artist_id)
+        if sections is None:
+            self.artist_fetches += 1
+            artist = await get_artist(artist_id)
+            if not artist:
+                return {}
+            self.remember(artist_id, artist)
+            sections = self._sections.get(artist_id) or {}
+        return sections
+
+    async def fetch(self, artist_id: str, get_artist, get_section) -> list:
+        """Merged albums + singles, deduplicated by browseId (albums first).
+
+        get_artist(artist_id) and get_section(browse_id, params) are awaitables
+        returning the raw ytmusicapi results.
+        """
+        sections = await self.sections(artist_id, get_artist)
+        expanded = await asyncio.gather(*(
+            self._expand(artist_id, sections.get(name), label, get_section) for name, label in SECTIONS
+        ))
+        return merge_sections(expanded)
+
+    @staticmethod
+    async def _expand(artist_id: str, section: dict | None, label: str, get_section) -> list:
+        if not section:
+            return []
+        items = section["results"]
+        if section["params"]:
+            try:
+                items = await get_section(section["browseId"] or artist_id, section["params"]) or items
+            except Exception as e:
+                # The preview items from the artist page are better than nothing
+                logger.warning(f"Failed to fetch {label}s for {artist_id}: {e}")
+        return [{**item, "type": item.get("type") or label} for item in items if isinstance(item, dict)]
+
+    def stats(self) -> dict:
+        return {"artists": self._sections.stats()["entries"], "artist_fetches": self.artist_fetches}
+
+
+def merge_sections(sections: list[list]) -> list:
+    """Concatenate section item lists, keeping the first item per browseId"""
+    seen = set()
+    merged = []
+    for items in sections:
+        for item in items:
+            browse_id = item.get("browseId")
+            if browse_id in seen:
+                continue
+            if browse_id:
+                seen.add(browse_id)
+            merged.append(item)
+    return merged
+
+
+def section_fingerprint(artist: dict | None) -> str:
+    """Hash of the albums/singles sections of a get_artist result.
+
+    Covers each section's item browseIds, item count and whether it has more pages
+    (params). New releases show up first on the artist page, so an unchanged
+    fingerprint means the discography listing can be assumed unchanged.
+    """
+    parts = []
+    for name, _ in SECTIONS:
+        section = artist.get(name) if isinstance(artist, dict) else None
+        if not isinstance(section, dict):
+            parts.append(f"{name}:-")
+            continue
+        ids = [item.get("browseId") or "" for item in section.get("results") or [] if isinstance(item, dict)]
+        parts.append(f"{name}:{len(ids)}:{int(bool(section.get('params')))}:{','.join(ids)}")
+    return _digest(parts)
+
+
+def album_fingerprint(item: dict) -> str:
+    """Hash of one listed album/single (browseId, title, type, year, explicit flag)"""
+    return _digest([str(item.get(key) or "") for key in ("browseId", "title", "type", "year", "isExplicit")])
+
+
+def _digest(parts: list) -> str:
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()[:16]
@@ -0,0 +1,135 @@
+# VibeStation Backend - Pre-encoded JSON payloads for cached responses
+import gzip
+import hashlib
+import json
+
+from fastapi import Request
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bodies smaller than this are not worth compressing
+COMPRESS_MIN_BYTES = 1024
+
+# Encoded variants (fields projection x envelope) memoized per payload
+MAX_VARIANTS = 8
+
+
+def dumps(value) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False, default=str, separators=(",", ":")).encode()
+
+
+class Payload:
+    """Upstream data encoded once when cached; response bodies memoized per variant.
+
+    A cache hit then only splices the pre-encoded data into the response envelope
+    (and reuses an already compressed body) instead of re-serializing the dict.
+    """
+
+    __slots__ = ("data", "body", "_variants")
+
+    def __init__(self, data):
+        self.data = data
+        self.body = dumps(data)
+        self._variants: dict = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.data)
+
+    def __len__(self) -> int:
+        return len(self.body)
+
+    def variant(self, key, build) -> "EncodedBody":
+        encoded = self._variants.get(key)
+        if encoded is None:
+            encoded = EncodedBody(build())
+            if len(self._variants) < MAX_VARIANTS:
+                self._variants[key] = encoded
+        return encoded
+
+
+class EncodedBody:
+    """One response body with its ETag and lazily compressed encodings"""
+
+    __slots__ = ("etag", "encodings")
+
+    def __init__(self, body: bytes):
+        # Weak: gzip/br bodies of the same data share it
+        self.etag = 'W/"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        self.encodings = {"identity": body}
+
+    def get(self, encoding: str) -> bytes:
+        body = self.encodings.get(encoding)
+        if body is None:
+            body = self.encodings[encoding] = _compress(self.encodings["identity"], encoding)
+        return body
+
+
+def _pick_encoding(accept_encoding: str, size: int) -> str:
+    if size < COMPRESS_MIN_BYTES:
+        return "identity"
+    accepted = {part.split(";")[0].strip() for part in accept_encoding.lower().split(",")}
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return "identity"
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def payload_response(
+    request: Request, payload: Payload, transform=None, variant=(), cache_control: str | None = None, **extra
+) -> Response:
+    """{"success": true, "data": <payload>, **extra} built from pre-encoded bytes.
+
+    transform (e.g. a fields projection) is applied to payload.data before encoding;
+    variant must identify it so the encoded result can be reused. Responds 304 when
+    If-None-Match carries the body's ETag.
+    """
+    def build() -> bytes:
+        data_bytes = payload.body if transform is None else dumps(transform(payload.data))
+        tail = b"".join(b"," + dumps(k) + b":" + dumps(v) for k, v in extra.items())
+        return b'{"success":true,"data":' + data_bytes + tail + b"}"
+
+    encoded = payload.variant((variant, tuple(extra.items())), build)
+    headers = {"ETag": encoded.etag, "Vary": "Accept-Encoding"}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, encoded.etag):
+        return Response(status_code=304, headers=headers)
+
+    encoding = _pick_encoding(request.headers.get("accept-encoding", ""), len(encoded.encodings["identity"]))
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=encoded.get(encoding), media_type="application/json", headers=headers)
+
+
+def payload_line(payload: Payload, transform=None, **head) -> bytes:
+    """One NDJSON line {**head, "success": true, "data": <payload>} from pre-encoded bytes"""
+    data_bytes = payload.body if transform is None else dumps(transform(payload.data))
+    prefix = b"".join(dumps(k) + b":" + dumps(v) + b"," for k, v in head.items())
+    return b"{" + prefix + b'"success":true,"data":' + data_bytes + b"}\n"
@@ -0,0 +1,103 @@
+# VibeStation Backend - Stale-while-revalidate store for country feeds
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class FeedStore:
+    """Per-key store that serves the last good payload and refreshes it in the background.
+
+    - fresh (age < ttl): returned as is
+    - stale (age < ttl + max_stale): returned immediately, one background refresh is started
+    - missing or too old: fetched inline; concurrent callers share the same fetch
+    A failed refresh keeps the previous payload, so callers never see an empty fallback
+    while a good copy exists.
+    """
+
+    def __init__(self, max_stale: int = 86400, max_entries: int = 1024):
+        self.max_stale = max_stale
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.fresh_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    async def get(self, key: str, fetch, ttl: int):
+        value, _ = await self.get_with_source(key, fetch, ttl)
+        return value
+
+    async def get_with_source(self, key: str, fetch, ttl: int) -> tuple[object, str]:
+        """(payload, source): "cache" (fresh copy), "stale" (refresh started), "fresh" (fetched now)
+        or "expired" (fetch failed, older than max_stale)"""
+        entry = self._entries.get(key)
+        age = time.monotonic() - entry[0] if entry else None
+
+        if entry and age < ttl:
+            self.fresh_hits += 1
+            self._entries.move_to_end(key)
+            return entry[1], "cache"
+
+        if entry and age < ttl + self.max_stale:
+            self.stale_hits += 1
+            self._entries.move_to_end(key)
+            self._refresh(key, fetch)
+            return entry[1], "stale"
+
+        self.misses += 1
+        try:
+            return await asyncio.shield(self._refresh(key, fetch)), "fresh"
+        except Exception:
+            if entry:
+                # Older than max_stale, but still better than nothing
+                return entry[1], "expired"
+            raise
+
+    def _refresh(self, key: str, fetch) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run(key, fetch))
+            task.add_done_callback(self._log_failure)
+            self._inflight[key] = task
+        return task
+
+    async def _run(self, key: str, fetch):
+        self.refreshes += 1
+        try:
+            value = await fetch()
+            if not value:
+                raise ValueError("Empty response from upstream")
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return value
+        except Exception:
+            self.refresh_failures += 1
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Feed refresh failed: {task.exception()}")
+
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "refreshing": len(self._inflight),
+            "fresh_hits": self.fresh_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+        }
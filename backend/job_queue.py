@@ -0,0 +1,277 @@
+# VibeStation Backend - Durable local job queue for cron workloads
+#
+# Crons enqueue one job per artist instead of working through the whole list inside
+# one request. Jobs live in SQLite, so a timeout or restart does not lose progress:
+#   - (kind, key) is unique: enqueueing a queued/running job, or one done within
+#     done_ttl, is a no-op (key = browse_id)
+#   - a claimed job is leased and the lease is renewed while its handler runs; if the
+#     worker dies the lease expires and it is retried
+#   - failures (including expired leases) are retried with exponential backoff up to
+#     max_attempts, then the job is marked failed
+# The queue is per instance: keep JOB_QUEUE_PATH on local disk, never on a shared
+# network filesystem (SQLite WAL locking does not work over NFS). Jobs still queued
+# when an instance shuts down are lost; the next cron run enqueues them again.
+# JobWorkerPool runs up to N jobs concurrently; handlers still go through the
+# upstream guard, which keeps the overall request rate within budget.
+import asyncio
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    run_at REAL NOT NULL,
+    lease_until REAL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    UNIQUE (kind, key)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_ready ON jobs (status, run_at);
+"""
+
+
+class JobQueue:
+    """SQLite-backed queue of (kind, key, payload) jobs with leases and retries"""
+
+    def __init__(
+        self,
+        path: str,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 5,
+        backoff_base: float = 30.0,
+        backoff_max: float = 3600.0,
+        done_ttl: float = 3600.0,
+    ):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.done_ttl = done_ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    def _insert(self, kind: str, key: str, payload: dict | None, delay: float, now: float) -> bool:
+        cursor = self._db.execute(
+            """
+            INSERT INTO jobs (kind, key, payload, run_at, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (kind, key) DO UPDATE SET
+                payload = excluded.payload, status = 'queued', attempts = 0,
+                run_at = excluded.run_at, lease_until = NULL, last_error = NULL,
+                updated_at = excluded.updated_at
+            WHERE jobs.status = 'failed' OR (jobs.status = 'done' AND jobs.updated_at < ?)
+            """,
+            (kind, key, json.dumps(payload or {}), now + delay, now, now, now - self.done_ttl),
+        )
+        return cursor.rowcount > 0
+
+    def enqueue(self, kind: str, key: str, payload: dict | None = None, delay: float = 0.0) -> bool:
+        """Add a job; False if the same (kind, key) is already pending or recently done"""
+        with self._lock:
+            return self._insert(kind, key, payload, delay, time.time())
+
+    def enqueue_many(self, kind: str, jobs: list[tuple[str, dict]]) -> int:
+        """enqueue() for (key, payload) pairs in one transaction; returns how many were added"""
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                added = sum(self._insert(kind, key, payload, 0.0, now) for key, payload in jobs)
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return added
+
+    def claim(self, kinds=None) -> dict | None:
+        """Lease the next runnable job (queued and due, or running with an expired lease).
+
+        A job whose lease expired after its last allowed attempt (its worker kept
+        dying) is marked failed instead of being run again.
+        """
+        now = time.time()
+        kind_filter = ""
+        params: list = [now, now, self.max_attempts]
+        if kinds:
+            kind_filter = f"AND kind IN ({','.join('?' * len(kinds))})"
+            params.extend(kinds)
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute(
+                    """
+                    UPDATE jobs SET status = 'failed', lease_until = NULL, updated_at = ?,
+                        last_error = 'lease expired after the last attempt'
+                    WHERE status = 'running' AND lease_until < ? AND attempts >= ?
+                    """,
+                    (now, now, self.max_attempts),
+                )
+                row = self._db.execute(
+                    f"""
+                    SELECT * FROM jobs
+                    WHERE ((status = 'queued' AND run_at <= ?)
+                           OR (status = 'running' AND lease_until < ? AND attempts < ?))
+                    {kind_filter}
+                    ORDER BY run_at LIMIT 1
+                    """,
+                    params,
+                ).fetchone()
+                if row is None:
+                    self._db.execute("COMMIT")
+                    return None
+                self._db.execute(
+                    "UPDATE jobs SET status = 'running', attempts = attempts + 1, lease_until = ?, updated_at = ? WHERE id = ?",
+                    (now + self.lease_seconds, now, row["id"]),
+                )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return {
+            "id": row["id"],
+            "kind": row["kind"],
+            "key": row["key"],
+            "payload": json.loads(row["payload"]),
+            "attempts": row["attempts"] + 1,
+        }
+
+    def renew(self, job_id: int) -> None:
+        """Extend the lease of a running job by lease_seconds (worker heartbeat)"""
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET lease_until = ?, updated_at = ? WHERE id = ? AND status = 'running'",
+                (time.time() + self.lease_seconds, time.time(), job_id),
+            )
+
+    def complete(self, job_id: int) -> None:
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET status = 'done', lease_until = NULL, last_error = NULL, updated_at = ? WHERE id = ?",
+                (time.time(), job_id),
+            )
+
+    def fail(self, job: dict, error: str) -> None:
+        """Retry later with backoff, or mark failed after max_attempts"""
+        now = time.time()
+        if job["attempts"] >= self.max_attempts:
+            status, run_at = "failed", now
+        else:
+            delay = min(self.backoff_base * 2 ** (job["attempts"] - 1), self.backoff_max)
+            status, run_at = "queued", now + delay * random.uniform(0.8, 1.2)
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, run_at = ?, lease_until = NULL, last_error = ?, updated_at = ? WHERE id = ?",
+                (status, run_at, error[:500], now, job["id"]),
+            )
+
+    def purge(self, older_than: float = 7 * 86400) -> int:
+        """Delete done/failed jobs not updated for older_than seconds"""
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM jobs WHERE status IN ('done', 'failed') AND updated_at < ?",
+                (time.time() - older_than,),
+            )
+            return cursor.rowcount
+
+    def stats(self) -> dict:
+        with self._lock:
+            rows = self._db.execute("SELECT kind, status, COUNT(*) AS n FROM jobs GROUP BY kind, status").fetchall()
+        counts: dict = {}
+        for row in rows:
+            counts.setdefault(row["kind"], {})[row["status"]] = row["n"]
+        return counts
+
+
+class JobWorkerPool:
+    """Runs queued jobs with up to `concurrency` handlers in flight.
+
+    handlers maps a job kind to `async def handler(key, payload)`; an exception
+    fails the job (retried with backoff), returning completes it.
+    """
+
+    def __init__(self, queue: JobQueue, handlers: dict, concurrency: int = 4, poll_interval: float = 2.0):
+        self.queue = queue
+        self.handlers = handlers
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._tasks: list[asyncio.Task] = []
+        self._wake = asyncio.Event()
+        self.completed = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.concurrency)]
+
+    def notify(self) -> None:
+        """Wake idle workers (call after enqueueing)"""
+        self._wake.set()
+
+    async def _worker(self, index: int) -> None:
+        kinds = list(self.handlers)
+        while True:
+            try:
+                job = await asyncio.to_thread(self.queue.claim, kinds)
+            except Exception as e:
+                logger.warning(f"Job claim error: {e}")
+                job = None
+            if job is None:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            heartbeat = asyncio.create_task(self._heartbeat(job["id"]))
+            try:
+                await self.handlers[job["kind"]](job["key"], job["payload"])
+                await asyncio.to_thread(self.queue.complete, job["id"])
+                self.completed += 1
+            except asyncio.CancelledError:
+                # Lease expires and the job is picked up again after a restart
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.warning(f"Job {job['kind']}:{job['key']} failed (attempt {job['attempts']}): {e}")
+                await asyncio.to_thread(self.queue.fail, job, str(e))
+            finally:
+                heartbeat.cancel()
+
+    async def _heartbeat(self, job_id: int) -> None:
+        """Renew the job's lease every third of lease_seconds while its handler runs"""
+        while True:
+            await asyncio.sleep(self.queue.lease_seconds / 3)
+            try:
+                await asyncio.to_thread(self.queue.renew, job_id)
+            except Exception as e:
+                logger.warning(f"Job lease renewal error: {e}")
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def stats(self) -> dict:
+        return {
+            "workers": len(self._tasks),
+            "completed": self.completed,
+            "failed": self.failed,
+            "jobs": self.queue.stats(),
+        }
@@ -1,12 +1,83 @@
 # VibeStation Backend API - Minimal ytmusicapi endpoints
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from ytmusicapi import YTMusic
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from contextlib import asynccontextmanager, AsyncExitStack
+import os
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import partial
+from ytmusic_pool import YTMusicRegistry
+from response_cache import TTLCache, CACHE_TTLS, DEFAULT_TTL, make_key, cache_control, normalize_query
+from feed_store import FeedStore
+from singleflight import SingleFlight
+from cache_backend import create_backend
+from async_transport import create_transport
+from bulkhead import create_bulkheads, BulkheadFull
+from upstream_guard import create_upstream_guard, CircuitOpenError
+from shaping import parse_fields, project
+from discography import Discography, SECTIONS as discography_sections
+from cursors import CursorCodec
+import paging
+from fast_json import Payload, payload_response, payload_line, dumps
+
+# Endpoint classes (interactive / heavy / background), each with its own
+# concurrency limit, wait queue and thread pool for blocking ytmusicapi work
+bulkheads = create_bulkheads()
+
+# Bulkhead of the request being served; selects the thread pool in run_in_thread
+current_bulkhead: ContextVar = ContextVar("current_bulkhead", default=bulkheads["interactive"])
+
+# Warmed YTMusic clients, one keep-alive connection pool per (language, location)
+ytmusic_registry = YTMusicRegistry(pool_size=sum(b.workers for b in bulkheads.values()))
+
+# InnerTube requests issued natively on the event loop (httpx, HTTP/2, pooled);
+# the thread pool only handles calls that need a blocking step
+async_transport = create_transport(
+    os.getenv("YTMUSIC_ASYNC_TRANSPORT", "1") == "1",
+    max_connections=int(os.getenv("YTMUSIC_MAX_CONNECTIONS", "100")),
+)
+
+# Global token bucket shared by every ytmusicapi call (interactive lane served
+# before background) plus a circuit breaker on repeated upstream failures
+upstream_guard = create_upstream_guard(
+    rate=float(os.getenv("UPSTREAM_RATE", "20")),
+    burst=int(os.getenv("UPSTREAM_BURST", "40")),
+    failure_threshold=int(os.getenv("UPSTREAM_FAILURE_THRESHOLD", "5")),
+    reset_timeout=float(os.getenv("UPSTREAM_RESET_TIMEOUT", "30")),
+)
+
+# Response cache for read endpoints (LRU bounded by entries and bytes)
+response_cache = TTLCache(
+    max_entries=int(os.getenv("CACHE_MAX_ENTRIES", "2048")),
+    max_bytes=int(os.getenv("CACHE_MAX_BYTES", str(256 * 1024 * 1024))),
+)
+
+# Optional cache shared across instances: CACHE_BACKEND=memory|redis|fakeredis
+shared_cache = create_backend(os.getenv("CACHE_BACKEND"), os.getenv("REDIS_URL"))
+
+# Country feeds (home, charts, explore) served stale-while-revalidate
+feed_store = FeedStore(max_stale=int(os.getenv("FEED_MAX_STALE", "86400")))
 
-# Thread pool for blocking ytmusicapi calls
-executor = ThreadPoolExecutor(max_workers=4)
+# Coalesces concurrent identical upstream calls into one upstream request
+single_flight = SingleFlight()
+
+# Artist section params seen in get_artist results, for /api/artist/{id}/albums
+discography = Discography(ttl=CACHE_TTLS["artist"])
+
+# Signed continuation cursors for paged playlist / artist albums / search. Paged responses,
+# cursors included, are stored in the shared cache, so every instance needs the same key
+if shared_cache is not None and shared_cache.shared and not os.getenv("CURSOR_SECRET"):
+    raise RuntimeError(f"CURSOR_SECRET must be set when CACHE_BACKEND={shared_cache.name} (cursors are shared across instances)")
+cursor_codec = CursorCodec(os.getenv("CURSOR_SECRET"), max_age=int(os.getenv("CURSOR_MAX_AGE", "86400")))
+
+# Countries whose clients are created and connected at startup
+PREWARM_COUNTRIES = [
+    c.strip().upper()
+    for c in os.getenv("YTMUSIC_PREWARM_COUNTRIES", "US,KR,JP,GB,DE,FR,BR,IN,MX,ID").split(",")
+    if c.strip()
+]
 
 def get_country_from_request(request: Request) -> str:
     """Detect user's country from Vercel geo headers"""
@@ -22,13 +93,89 @@ def get_country_from_request(request: Request) -> str:
     return "US"
 
 def get_ytmusic(language="en", location=None):
-    if location:
-        return YTMusic(language=language, location=location)
-    return YTMusic(language=language)
+    return ytmusic_registry.get(language, location)
 
 async def run_in_thread(func, *args, **kwargs):
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(executor, lambda: func(*args, **kwargs))
+    return await loop.run_in_executor(current_bulkhead.get().executor, lambda: func(*args, **kwargs))
+
+def bulkhead(name: str):
+    """Route dependency: run the endpoint inside a bulkhead, shedding load with 503 + Retry-After"""
+    async def acquire():
+        try:
+            async with bulkheads[name].slot() as slot:
+                current_bulkhead.set(slot)
+                yield
+        except BulkheadFull as e:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Server busy ({name}), retry later",
+                headers={"Retry-After": str(e.bulkhead.retry_after)},
+            ) from e
+    return Depends(acquire)
+
+async def ytcall(method, *args, location: str = None, **kwargs):
+    """Call a ytmusicapi method (or func(ytmusic, ...)) without blocking the event loop.
+
+    Uses the async transport when available, otherwise the thread pool. Concurrent
+    calls with the same (method, args, country) share one upstream request, which
+    goes through the global rate limiter and circuit breaker.
+    """
+    ytmusic = get_ytmusic(location=location)
+    if callable(method):
+        name, func = method.__name__, partial(method, ytmusic)
+    else:
+        name, func = method, getattr(ytmusic, method)
+    key = (name, args, tuple(sorted(kwargs.items())), (location or "").upper())
+    lane = "background" if current_bulkhead.get().name == "background" else "interactive"
+
+    if async_transport is not None:
+        fetch = partial(async_transport.call, ytmusic, method, *args, run_in_thread=run_in_thread, **kwargs)
+    else:
+        fetch = partial(run_in_thread, func, *args, **kwargs)
+    return await single_flight.do(key, lambda: upstream_guard.run(fetch, lane))
+
+async def shared_call(endpoint: str, key: str, fetch):
+    """Read through the shared cache backend (when configured) before calling upstream"""
+    if shared_cache is None:
+        return await fetch()
+    data = await shared_cache.get(endpoint, key)
+    if data is not None:
+        return data
+    data = await fetch()
+    if data:
+        await shared_cache.set(endpoint, key, data, CACHE_TTLS.get(endpoint, DEFAULT_TTL))
+    return data
+
+async def cached_call(endpoint: str, fetch, *parts, country: str = None, query: str = None, **params) -> Payload:
+    """Serve from the local cache, then the shared cache, awaiting fetch() only on a miss.
+
+    Results are cached as pre-encoded Payloads so hits skip JSON serialization.
+    """
+    key = make_key(endpoint, *parts, country=country, query=query, **params)
+    payload = response_cache.get(key)
+    if payload is not None:
+        return payload
+    try:
+        payload = Payload(await shared_call(endpoint, key, fetch))
+    except CircuitOpenError:
+        # Upstream is failing: an expired copy beats an error
+        payload = response_cache.get_stale(key)
+        if payload is None:
+            raise
+        return payload
+    if payload:
+        response_cache.set(key, payload, CACHE_TTLS.get(endpoint, DEFAULT_TTL), size=len(payload))
+    return payload
+
+async def feed_call(endpoint: str, fetch, country: str = None, **params) -> Payload:
+    """Serve a country feed from the SWR store (stale copy + one background refresh)"""
+    key = make_key(endpoint, country=country, **params)
+
+    async def encoded():
+        return Payload(await shared_call(endpoint, key, fetch))
+
+    return await feed_store.get(key, encoded, CACHE_TTLS.get(endpoint, DEFAULT_TTL))
 
 def custom_get_mood_playlists(ytmusic, params: str):
     """Custom mood playlists parser that handles different renderer types"""
@@ -148,7 +295,185 @@ def parse_navigation_button(data):
     except Exception:
         return None
 
-app = FastAPI(title="VibeStation API", version="1.0.0")
+# Cached lookups shared by the single-item endpoints and /api/batch
+def load_artist(artist_id: str):
+    async def fetch():
+        artist = await ytcall("get_artist", artist_id)
+        discography.remember(artist_id, artist)
+        return artist
+    return cached_call("artist", fetch, artist_id)
+
+def load_artist_albums(artist_id: str):
+    async def get_artist(artist_id: str):
+        return (await load_artist(artist_id)).data
+
+    return cached_call(
+        "artist_albums",
+        lambda: discography.fetch(artist_id, get_artist, partial(ytcall, "get_artist_albums")),
+        artist_id,
+    )
+
+def load_album(album_id: str):
+    return cached_call("album", lambda: ytcall("get_album", album_id), album_id)
+
+async def fetch_playlist(playlist_id: str):
+    if playlist_id.startswith("MPRE"):
+        album = await ytcall("get_album", playlist_id)
+        # Copy: the album dict may be shared with coalesced /api/album callers
+        return {**album, "trackCount": len(album.get("tracks", []))} if album else album
+
+    if playlist_id.startswith("OLAK"):
+        watch_data = await ytcall("get_watch_playlist", playlistId=playlist_id)
+        if not watch_data:
+            return None
+        tracks = watch_data.get("tracks", [])
+        for track in tracks:
+            if track.get("thumbnail") and not track.get("thumbnails"):
+                track["thumbnails"] = track["thumbnail"]
+            if track.get("length") and not track.get("duration"):
+                track["duration"] = track["length"]
+
+        data = {
+            "title": playlist_id,
+            "tracks": tracks,
+            "trackCount": len(tracks),
+            "thumbnails": tracks[0].get("thumbnails") if tracks else None
+        }
+        if tracks and tracks[0].get("album"):
+            data["title"] = tracks[0]["album"].get("name", "Album")
+        return data
+
+    return await ytcall("get_playlist", playlist_id)
+
+def load_playlist(playlist_id: str):
+    return cached_call("playlist", lambda: fetch_playlist(playlist_id), playlist_id)
+
+def load_song(video_id: str):
+    return cached_call("song", lambda: ytcall("get_song", video_id), video_id)
+
+def load_watch(video_id: str = None, playlist_id: str = None):
+    return cached_call(
+        "watch",
+        lambda: ytcall("get_watch_playlist", videoId=video_id, playlistId=playlist_id),
+        video_id, playlist_id,
+    )
+
+def load_lyrics(browse_id: str):
+    return cached_call("lyrics", lambda: ytcall("get_lyrics", browse_id), browse_id)
+
+def load_related(browse_id: str):
+    return cached_call("related", lambda: ytcall("get_song_related", browse_id), browse_id)
+
+def load_podcast(playlist_id: str):
+    return cached_call("podcast", lambda: ytcall("get_podcast", playlist_id), playlist_id)
+
+def load_episode(video_id: str):
+    return cached_call("episode", lambda: ytcall("get_episode", video_id), video_id)
+
+def load_channel(channel_id: str):
+    return cached_call("channel", lambda: ytcall("get_channel", channel_id), channel_id)
+
+async def paged_call(endpoint: str, scope: str, first_page, cursor: str = None, *parts) -> Payload:
+    """One page of a paged endpoint as {"items": [...], ..., "nextCursor": str | None}.
+
+    Without a cursor first_page() -> (page dict, state) is used; with one, the signed
+    state is verified and only that page is fetched (never pages 1..N again).
+    """
+    if cursor:
+        key = paging.page_key(cursor_codec.decode(scope, cursor))
+        parts = (*parts, key)
+
+        async def fetch_page():
+            items, state = await ytcall(paging.load_page, key)
+            return {"items": items}, state
+    else:
+        fetch_page = first_page
+
+    async def fetch():
+        page, state = await fetch_page()
+        return {**page, "nextCursor": cursor_codec.encode(scope, state)}
+
+    return await cached_call(endpoint, fetch, *parts, paged=1)
+
+def load_playlist_page(playlist_id: str, cursor: str = None):
+    async def first_page():
+        if playlist_id.startswith(("MPRE", "OLAK")):
+            playlist, state = await fetch_playlist(playlist_id), None
+        else:
+            playlist, state = await ytcall(paging.playlist_first_page, playlist_id)
+        header = {k: v for k, v in (playlist or {}).items() if k != "tracks"}
+        return {"playlist": header, "items": (playlist or {}).get("tracks", [])}, state
+    return paged_call("playlist", f"playlist:{playlist_id}", first_page, cursor, playlist_id)
+
+def load_artist_albums_page(artist_id: str, cursor: str = None):
+    async def get_artist(artist_id: str):
+        return (await load_artist(artist_id)).data
+
+    async def first_page():
+        # Sections with params are paged one after another (albums, then singles);
+        # the preview results of sections without params are already complete
+        sections = await discography.sections(artist_id, get_artist)
+        items, chain = [], []
+        for name, label in discography_sections:
+            section = sections.get(name)
+            if not section:
+                continue
+            if section["params"]:
+                browse = {"browseId": section["browseId"] or artist_id, "params": section["params"]}
+                chain.append({"k": "section", "b": browse})
+            else:
+                items.extend({**item, "type": item.get("type") or label} for item in section["results"])
+        state = None
+        for link in reversed(chain[1:]):
+            state = {**link, "then": state}
+        if chain:
+            first = chain[0]["b"]
+            section_items, section_state = await ytcall(
+                paging.artist_section_first_page, first["browseId"], first["params"]
+            )
+            items.extend(section_items)
+            state = {**section_state, "then": state} if section_state else state
+        return {"items": items}, state
+    return paged_call("artist_albums", f"artist_albums:{artist_id}", first_page, cursor, artist_id)
+
+def load_search_page(q: str, filter: str = None, cursor: str = None):
+    async def first_page():
+        items, state = await ytcall(paging.search_first_page, q, filter)
+        return {"items": items}, state
+    query = normalize_query(q)
+    return paged_call("search", f"search:{query}:{filter or ''}", first_page, cursor, query, filter)
+
+# /api/batch lookup types -> loader(key); "fields" applies to the projectable ones
+BATCH_LOADERS = {
+    "artist": load_artist,
+    "artist_albums": load_artist_albums,
+    "album": load_album,
+    "playlist": load_playlist,
+    "song": load_song,
+    "watch": load_watch,
+    "lyrics": load_lyrics,
+    "related": load_related,
+    "podcast": load_podcast,
+    "episode": load_episode,
+    "channel": load_channel,
+}
+
+MAX_BATCH_LOOKUPS = int(os.getenv("MAX_BATCH_LOOKUPS", "50"))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm clients in the background so startup is not blocked on the network
+    loop = asyncio.get_running_loop()
+    loop.run_in_executor(bulkheads["background"].executor, ytmusic_registry.warm, PREWARM_COUNTRIES)
+    yield
+    if shared_cache is not None:
+        await shared_cache.close()
+    if async_transport is not None:
+        await async_transport.aclose()
+    for b in bulkheads.values():
+        b.shutdown()
+
+app = FastAPI(title="VibeStation API", version="1.0.0", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # CORS
 app.add_middleware(
@@ -163,206 +488,274 @@ app.add_middleware(
 def root():
     return {"service": "VibeStation API", "status": "ok"}
 
-@app.get("/api/home")
+@app.get("/api/stats")
+def get_stats():
+    return {
+        "ytmusic": ytmusic_registry.stats(),
+        "cache": response_cache.stats(),
+        "feeds": feed_store.stats(),
+        "single_flight": single_flight.stats(),
+        "discography": discography.stats(),
+        "shared_cache": shared_cache.stats() if shared_cache else None,
+        "async_transport": async_transport.stats() if async_transport else None,
+        "bulkheads": {name: b.stats() for name, b in bulkheads.items()},
+        "upstream": upstream_guard.stats(),
+    }
+
+@app.get("/api/cache/stats")
+def get_cache_stats():
+    return response_cache.stats()
+
+@app.get("/api/home", dependencies=[bulkhead("interactive")])
 async def get_home(request: Request, limit: int = 5, country: str = None):
     location = country or get_country_from_request(request)
-    ytmusic = get_ytmusic(location=location)
     try:
-        data = await run_in_thread(ytmusic.get_home, limit)
-        return {"success": True, "data": data, "country": location}
+        data = await feed_call("home", lambda: ytcall("get_home", limit, location=location), country=location, limit=limit)
+        return payload_response(
+            request, data, country=location, cache_control=cache_control("home", shared=country is not None)
+        )
     except Exception as e:
         return {"success": False, "data": [], "error": str(e)}
 
-@app.get("/api/search")
-async def search(q: str, filter: str = None):
-    ytmusic = get_ytmusic()
+@app.get("/api/search", dependencies=[bulkhead("interactive")])
+async def search(request: Request, q: str, filter: str = None, paged: bool = False, cursor: str = None):
     try:
-        data = await run_in_thread(ytmusic.search, q, filter)
-        return {"success": True, "data": data}
+        if paged or cursor:
+            data = await load_search_page(q, filter, cursor)
+        else:
+            data = await cached_call("search", lambda: ytcall("search", q, filter), query=q, filter=filter)
+        return payload_response(request, data, cache_control=cache_control("search"))
     except Exception as e:
         return {"success": False, "data": [], "error": str(e)}
 
-@app.get("/api/search/suggestions")
-async def get_suggestions(q: str):
-    ytmusic = get_ytmusic()
+@app.get("/api/search/suggestions", dependencies=[bulkhead("interactive")])
+async def get_suggestions(request: Request, q: str):
     try:
-        data = await run_in_thread(ytmusic.get_search_suggestions, q)
-        return {"success": True, "data": data}
+        data = await cached_call("search_suggestions", lambda: ytcall("get_search_suggestions", q), query=q)
+        return payload_response(request, data, cache_control=cache_control("search_suggestions"))
     except Exception as e:
         return {"success": False, "data": [], "error": str(e)}
 
-@app.get("/api/explore")
+@app.get("/api/explore", dependencies=[bulkhead("interactive")])
 async def get_explore(request: Request, country: str = None):
     location = country or get_country_from_request(request)
-    ytmusic = get_ytmusic(location=location)
     try:
-        data = await run_in_thread(ytmusic.get_explore)
-        return {"success": True, "data": data, "country": location}
+        data = await feed_call("explore", lambda: ytcall("get_explore", location=location), country=location)
+        return payload_response(
+            request, data, country=location, cache_control=cache_control("explore", shared=country is not None)
+        )
     except Exception as e:
         return {"success": False, "data": {}, "error": str(e)}
 
-@app.get("/api/charts")
+@app.get("/api/charts", dependencies=[bulkhead("interactive")])
 async def get_charts(request: Request, country: str = None):
     location = country or get_country_from_request(request)
-    ytmusic = get_ytmusic()
     try:
-        data = await run_in_thread(ytmusic.get_charts, location)
-        return {"success": True, "data": data, "country": location}
+        data = await feed_call("charts", lambda: ytcall("get_charts", location), country=location)
+        return payload_response(
+            request, data, country=location, cache_control=cache_control("charts", shared=country is not None)
+        )
     except Exception as e:
         return {"success": False, "data": {}, "error": str(e)}
 
-@app.get("/api/moods")
+@app.get("/api/moods", dependencies=[bulkhead("interactive")])
 async def get_moods(request: Request, country: str = None):
     location = country or get_country_from_request(request)
-    ytmusic = get_ytmusic(location=location)
     try:
-        data = await run_in_thread(ytmusic.get_mood_categories)
-        return {"success": True, "data": data, "country": location}
+        data = await cached_call("moods", lambda: ytcall("get_mood_categories", location=location), country=location)
+        return payload_response(
+            request, data, country=location, cache_control=cache_control("moods", shared=country is not None)
+        )
     except Exception as e:
         return {"success": False, "data": {}, "error": str(e)}
 
-@app.get("/api/mood-playlists")
-async def get_mood_playlists(params: str):
-    ytmusic = get_ytmusic()
+@app.get("/api/mood-playlists", dependencies=[bulkhead("interactive")])
+async def get_mood_playlists(request: Request, params: str):
     try:
-        data = await run_in_thread(custom_get_mood_playlists, ytmusic, params)
-        return {"success": True, "data": data}
+        data = await cached_call("mood_playlists", lambda: ytcall(custom_get_mood_playlists, params), params)
+        return payload_response(request, data, cache_control=cache_control("mood_playlists"))
     except Exception as e:
         return {"success": False, "data": [], "error": str(e)}
 
-@app.get("/api/artist/{artist_id}")
-async def get_artist(artist_id: str):
-    ytmusic = get_ytmusic()
+@app.get("/api/artist/{artist_id}", dependencies=[bulkhead("interactive")])
+async def get_artist(request: Request, artist_id: str, fields: str = None):
     try:
-        data = await run_in_thread(ytmusic.get_artist, artist_id)
-        return {"success": True, "data": data}
+        data = await load_artist(artist_id)
+        tree = parse_fields("artist", fields)
+        return payload_response(
+            request, data, tree and partial(project, tree=tree), variant=fields, cache_control=cache_control("artist")
+        )
     except Exception as e:
         return {"success": False, "data": None, "error": str(e)}
 
-@app.get("/api/artist/{artist_id}/albums")
-async def get_artist_albums(artist_id: str):
-    ytmusic = get_ytmusic()
+@app.get("/api/artist/{artist_id}/albums", dependencies=[bulkhead("heavy")])
+async def get_artist_albums(request: Request, artist_id: str, paged: bool = False, cursor: str = None):
     try:
-        artist = await run_in_thread(ytmusic.get_artist, artist_id)
-        if artist and "albums" in artist and "params" in artist["albums"]:
-            data = await run_in_thread(ytmusic.get_artist_albums, artist_id, artist["albums"]["params"])
-            return {"success": True, "data": data}
-        return {"success": True, "data": []}
+        if paged or cursor:
+            data = await load_artist_albums_page(artist_id, cursor)
+        else:
+            data = await load_artist_albums(artist_id)
+        return payload_response(request, data, cache_control=cache_control("artist_albums"))
     except Exception as e:
         return {"success": False, "data": [], "error": str(e)}
 
-@app.get("/api/album/{album_id}")
-async def get_album(album_id: str):
-    ytmusic = get_ytmusic()
+@app.get("/api/album/{album_id}", dependencies=[bulkhead("interactive")])
+async def get_album(request: Request, album_id: str, fields: str = None):
     try:
-        data = await run_in_thread(ytmusic.get_album, album_id)
-        return {"success": True, "data": data}
+        data = await load_album(album_id)
+        tree = parse_fields("album", fields)
+        return payload_response(
+            request, data, tree and partial(project, tree=tree), variant=fields, cache_control=cache_control("album")
+        )
     except Exception as e:
         return {"success": False, "data": None, "error": str(e)}
 
-@app.get("/api/playlist/{playlist_id}")
-async def get_playlist(playlist_id: str):
-    ytmusic = get_ytmusic()
+@app.get("/api/playlist/{playlist_id}", dependencies=[bulkhead("heavy")])
+async def get_playlist(request: Request, playlist_id: str, paged: bool = False, cursor: str = None):
     try:
-        if playlist_id.startswith("MPRE"):
-            data = await run_in_thread(ytmusic.get_album, playlist_id)
-            if data:
-                data["trackCount"] = len(data.get("tracks", []))
-        elif playlist_id.startswith("OLAK"):
-            watch_data = await run_in_thread(ytmusic.get_watch_playlist, playlistId=playlist_id)
-            if watch_data:
-                tracks = watch_data.get("tracks", [])
-                for track in tracks:
-                    if track.get("thumbnail") and not track.get("thumbnails"):
-                        track["thumbnails"] = track["thumbnail"]
-                    if track.get("length") and not track.get("duration"):
-                        track["duration"] = track["length"]
-
-                data = {
-                    "title": playlist_id,
-                    "tracks": tracks,
-                    "trackCount": len(tracks),
-                    "thumbnails": tracks[0].get("thumbnails") if tracks else None
-                }
-                if tracks and tracks[0].get("album"):
-                    data["title"] = tracks[0]["album"].get("name", "Album")
-            else:
-                data = None
+        if paged or cursor:
+            data = await load_playlist_page(playlist_id, cursor)
         else:
-            data = await run_in_thread(ytmusic.get_playlist, playlist_id)
-        return {"success": True, "data": data}
+            data = await load_playlist(playlist_id)
+        return payload_response(request, data, cache_control=cache_control("playlist"))
     except Exception as e:
         return {"success": False, "data": None, "error": str(e)}
 
-@app.get("/api/song/{video_id}")
-async def get_song(video_id: str):
-    ytmusic = get_ytmusic()
+@app.get("/api/song/{video_id}", dependencies=[bulkhead("interactive")])
+async def get_song(request: Request, video_id: str):
     try:
-        data = await run_in_thread(ytmusic.get_song, video_id)
-        return {"success": True, "data": data}
+        data = await load_song(video_id)
+        return payload_response(request, data, cache_control=cache_control("song"))
     except Exception as e:
         return {"success": False, "data": None, "error": str(e)}
 
-@app.get("/api/watch")
-async def get_watch(videoId: str = None, playlistId: str = None):
-    ytmusic = get_ytmusic()
+@app.get("/api/watch", dependencies=[bulkhead("interactive")])
+async def get_watch(request: Request, videoId: str = None, playlistId: str = None):
     try:
-        data = await run_in_thread(ytmusic.get_watch_playlist, videoId=videoId, playlistId=playlistId)
-        return {"success": True, "data": data}
+        data = await load_watch(videoId, playlistId)
+        return payload_response(request, data, cache_control=cache_control("watch"))
     except Exception as e:
         return {"success": False, "data": None, "error": str(e)}
 
-@app.get("/api/lyrics/{browse_id}")
-async def get_lyrics(browse_id: str):
-    ytmusic = get_ytmusic()
+@app.get("/api/lyrics/{browse_id}", dependencies=[bulkhead("interactive")])
+async def get_lyrics(request: Request, browse_id: str):
     try:
-        data = await run_in_thread(ytmusic.get_lyrics, browse_id)
-        return {"success": True, "data": data}
+        data = await load_lyrics(browse_id)
+        return payload_response(request, data, cache_control=cache_control("lyrics"))
     except Exception as e:
         return {"success": False, "data": None, "error": str(e)}
 
-@app.get("/api/related/{browse_id}")
-async def get_related(browse_id: str):
-    ytmusic = get_ytmusic()
+@app.get("/api/related/{browse_id}", dependencies=[bulkhead("interactive")])
+async def get_related(request: Request, browse_id: str):
     try:
-        data = await run_in_thread(ytmusic.get_song_related, browse_id)
-        return {"success": True, "data": data}
+        data = await load_related(browse_id)
+        return payload_response(request, data, cache_control=cache_control("related"))
     except Exception as e:
         return {"success": False, "data": [], "error": str(e)}
 
-@app.get("/api/podcast/{playlist_id}")
-async def get_podcast(playlist_id: str):
-    ytmusic = get_ytmusic()
+@app.get("/api/podcast/{playlist_id}", dependencies=[bulkhead("heavy")])
+async def get_podcast(request: Request, playlist_id: str):
     try:
-        data = await run_in_thread(ytmusic.get_podcast, playlist_id)
-        return {"success": True, "data": data}
+        data = await load_podcast(playlist_id)
+        return payload_response(request, data, cache_control=cache_control("podcast"))
     except Exception:
         return {"success": True, "data": None}
 
-@app.get("/api/episode/{video_id}")
-async def get_episode(video_id: str):
-    ytmusic = get_ytmusic()
+@app.get("/api/episode/{video_id}", dependencies=[bulkhead("interactive")])
+async def get_episode(request: Request, video_id: str):
     try:
-        data = await run_in_thread(ytmusic.get_episode, video_id)
-        return {"success": True, "data": data}
+        data = await load_episode(video_id)
+        return payload_response(request, data, cache_control=cache_control("episode"))
     except Exception:
         return {"success": True, "data": None}
 
-@app.get("/api/channel/{channel_id}")
-async def get_channel(channel_id: str):
-    ytmusic = get_ytmusic()
+@app.get("/api/channel/{channel_id}", dependencies=[bulkhead("heavy")])
+async def get_channel(request: Request, channel_id: str):
     try:
-        data = await run_in_thread(ytmusic.get_channel, channel_id)
-        return {"success": True, "data": data}
+        data = await load_channel(channel_id)
+        return payload_response(request, data, cache_control=cache_control("channel"))
     except Exception:
         return {"success": True, "data": None}
 
-@app.get("/api/episodes-playlist")
-async def get_episodes_playlist(country: str = None):
-    ytmusic = get_ytmusic(location=country)
+@app.get("/api/episodes-playlist", dependencies=[bulkhead("heavy")])
+async def get_episodes_playlist(request: Request, country: str = None):
     try:
-        explore_data = await run_in_thread(ytmusic.get_explore)
-        episodes = explore_data.get("top_episodes", [])
-        return {"success": True, "data": episodes}
+        explore = await feed_call("explore", lambda: ytcall("get_explore", location=country), country=country)
+        return payload_response(
+            request, explore, lambda data: data.get("top_episodes", []), variant="top_episodes",
+            cache_control=cache_control("explore"),
+        )
     except Exception as e:
         return {"success": False, "data": [], "error": str(e)}
+
+@app.post("/api/batch")
+async def batch(request: Request):
+    """
+    Run many lookups concurrently and stream one NDJSON line per lookup as it completes.
+
+    Request body:
+    - requests: [{"id": "r1", "type": "artist", "key": "UC...", "fields": "card"}, ...]
+      type is one of BATCH_LOADERS; fields only applies to artist and album
+
+    Each line: {"id": "r1", "success": true, "data": ...} or {"id": "r1", "success": false, "error": "..."}.
+    Lookups with the same type and key share one fetch.
+    """
+    try:
+        body = await request.json()
+        lookups = body["requests"]
+        if not isinstance(lookups, list):
+            raise TypeError
+        lookups = [(str(item["id"]), item["type"], str(item["key"]), item.get("fields")) for item in lookups]
+    except Exception:
+        raise HTTPException(status_code=400, detail="requests must be a list of {id, type, key}")
+    if len(lookups) > MAX_BATCH_LOOKUPS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_LOOKUPS} lookups per batch")
+
+    # Hold the bulkhead slot until the stream ends, not just until the handler returns
+    stack = AsyncExitStack()
+    try:
+        slot = await stack.enter_async_context(bulkheads["heavy"].slot())
+    except BulkheadFull as e:
+        raise HTTPException(
+            status_code=503,
+            detail="Server busy (heavy), retry later",
+            headers={"Retry-After": str(e.bulkhead.retry_after)},
+        ) from e
+    current_bulkhead.set(slot)
+
+    tasks: dict[tuple, asyncio.Task] = {}
+    waiters = []
+    errors = []
+    for request_id, kind, key, fields in lookups:
+        loader = BATCH_LOADERS.get(kind)
+        if loader is None:
+            errors.append(dumps({"id": request_id, "success": False, "error": f"Unknown type: {kind}"}) + b"\n")
+            continue
+        task = tasks.get((kind, key))
+        if task is None:
+            task = tasks[(kind, key)] = asyncio.create_task(loader(key))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        tree = parse_fields(kind, fields) if kind in ("artist", "album") else None
+        waiters.append(asyncio.create_task(batch_line(request_id, task, tree)))
+
+    async def stream():
+        for line in errors:
+            yield line
+        for waiter in asyncio.as_completed(waiters):
+            yield await waiter
+
+    async def release():
+        # Runs after the stream finishes or the client disconnects
+        for waiter in waiters:
+            waiter.cancel()
+        await stack.aclose()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson", background=BackgroundTask(release))
+
+async def batch_line(request_id: str, task: asyncio.Task, tree: dict | None) -> bytes:
+    try:
+        # Shield: one waiter going away must not cancel a fetch other lookups share
+        payload = await asyncio.shield(task)
+        return payload_line(payload, tree and partial(project, tree=tree), id=request_id)
+    except Exception as e:
+        return dumps({"id": request_id, "success": False, "error": str(e)}) + b"\n"
@@ -3,6 +3,7 @@
 
 from fastapi import FastAPI, Request, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse, JSONResponse
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 # Trigger CI/CD Test: 2025-12-24 (Retry: Fixed google-generativeai dependency)
@@ -10,6 +11,7 @@ import os
 import json
 import logging
 import asyncio
+from functools import partial
 from concurrent.futures import ThreadPoolExecutor
 from ai_agent import (
     generate_artist_persona, chat_with_artist, generate_artist_post,
@@ -18,6 +20,17 @@ from ai_agent import (
     generate_post_image, check_artist_status,
     gather_artist_context, generate_contextual_post
 )
+from response_cache import TTLCache
+from feed_store import FeedStore
+from upstream_guard import create_upstream_guard, CircuitOpenError
+from discography import Discography, album_fingerprint, section_fingerprint
+from search_index import CatalogIndex
+from search_normalize import alias_table, fold, name_variants
+from popular_queries import PopularQueries
+from bulk_writer import BulkWriter
+from write_behind import WriteBehindQueue
+from job_queue import JobQueue, JobWorkerPool
+from paging import iter_playlist_pages
 import uuid as uuid_lib
 import random
 import secrets
@@ -98,22 +111,91 @@ def get_ytmusic(country: str = "US"):
 
     return ytmusic_instances[country]
 
+# 인스턴스 로컬 캐시 (TTL + LRU, 메모리 상한)
+local_cache = TTLCache(
+    max_entries=int(os.getenv("CACHE_MAX_ENTRIES", "2048")),
+    max_bytes=int(os.getenv("CACHE_MAX_BYTES", str(256 * 1024 * 1024))),
+)
+
+# YouTube Music 호출 전역 rate limit (interactive 우선) + circuit breaker
+upstream_guard = create_upstream_guard(
+    rate=float(os.getenv("UPSTREAM_RATE", "20")),
+    burst=int(os.getenv("UPSTREAM_BURST", "40")),
+    failure_threshold=int(os.getenv("UPSTREAM_FAILURE_THRESHOLD", "5")),
+    reset_timeout=float(os.getenv("UPSTREAM_RESET_TIMEOUT", "30")),
+)
+
+# 국가별 피드 (stale-while-revalidate)
+feed_store = FeedStore(max_stale=int(os.getenv("FEED_MAX_STALE", "86400")))
+
+# 아티스트 앨범/싱글 섹션 params (get_artist 재호출 방지)
+discography = Discography()
+
 def cache_get(key: str):
-    """캐시 비활성화 - 항상 None 반환"""
-    del key  # Intentionally unused - caching disabled
-    return None
+    """로컬 캐시 조회 (만료/미존재 시 None, 업스트림 circuit이 열려 있으면 만료된 사본 반환)"""
+    value = local_cache.get(key)
+    if value is None and upstream_guard.breaker.state == "open":
+        value = local_cache.get_stale(key)
+    return value
 
 def cache_set(key: str, value, ttl: int = 3600):
-    """캐시 비활성화 - 아무 동작 안함"""
-    del key, value, ttl  # Intentionally unused - caching disabled
+    """로컬 캐시 저장 (ttl 초 후 만료)"""
+    local_cache.set(key, value, ttl)
 
 # =============================================================================
 # Helper: Run sync code in thread
 # =============================================================================
 
+# 스레드 풀 분리 (bulkhead.py와 같은 방식): 사용자 요청 / 백그라운드 동기화 / 크론 작업("jobs", 아래 작업 큐 설정)
+# 백그라운드 작업이 사용자 요청용 풀을 점유하지 않도록, 풀 이름은 upstream_guard lane과 같음
+executors = {
+    "interactive": ThreadPoolExecutor(
+        max_workers=int(os.getenv("INTERACTIVE_WORKERS", str(min(32, (os.cpu_count() or 1) + 4)))),
+        thread_name_prefix="interactive",
+    ),
+    "background": ThreadPoolExecutor(
+        max_workers=int(os.getenv("BACKGROUND_WORKERS", "8")),
+        thread_name_prefix="background",
+    ),
+}
+
+async def run_in_pool(pool: str, func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executors[pool], lambda: func(*args, **kwargs))
+
 async def run_in_thread(func, *args, **kwargs):
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
+    """사용자 요청 경로의 동기 코드 실행 (interactive 풀)"""
+    return await run_in_pool("interactive", func, *args, **kwargs)
+
+# lifespan에서 설정 (스레드의 동기 코드가 upstream_guard를 쓰기 위한 이벤트 루프)
+_main_loop: asyncio.AbstractEventLoop | None = None
+
+async def yt_call(func, *args, lane: str = "interactive", **kwargs):
+    """YouTube Music 호출 (upstream_guard: 전역 rate limit + circuit breaker)"""
+    return await upstream_guard.run(lambda: run_in_pool(lane, func, *args, **kwargs), lane=lane)
+
+# yt_call_sync 결과 대기 상한 (초, rate limit 대기 포함), 초과 시 호출 취소 후 TimeoutError
+UPSTREAM_SYNC_TIMEOUT = float(os.getenv("UPSTREAM_SYNC_TIMEOUT", "60"))
+
+def yt_call_sync(func, *args, lane: str = "background", **kwargs):
+    """스레드에서 실행되는 동기 코드용 yt_call (메인 이벤트 루프의 upstream_guard 사용)"""
+    name = getattr(func, "__name__", repr(func))
+    if _main_loop is None or not _main_loop.is_running():
+        logger.warning(f"yt_call_sync({name}): no running event loop, calling without upstream guard")
+        return func(*args, **kwargs)
+    try:
+        asyncio.get_running_loop()
+        # 이벤트 루프 스레드에서는 결과를 기다릴 수 없음 (교착 방지)
+        logger.warning(f"yt_call_sync({name}) on the event loop thread, calling without upstream guard")
+        return func(*args, **kwargs)
+    except RuntimeError:
+        pass
+    future = asyncio.run_coroutine_threadsafe(yt_call(func, *args, lane=lane, **kwargs), _main_loop)
+    try:
+        return future.result(timeout=UPSTREAM_SYNC_TIMEOUT)
+    except TimeoutError:
+        future.cancel()
+        raise
 
 # Error message constants
 ERROR_ACCESS_TOKEN_REQUIRED = "access_token required"
@@ -135,6 +217,53 @@ KPOP_GROUPS = {
     "RIIZE", "TWS", "QWER", "H1-KEY", "Billlie", "CLASS:y", "Weeekly"
 }
 
+# 한글 표기 (검색 별칭: "방탄소년단" -> BTS, "블랙핑크" -> BLACKPINK)
+KPOP_HANGUL_NAMES = {
+    "BTS": ["방탄소년단", "비티에스"], "BLACKPINK": ["블랙핑크"], "LE SSERAFIM": ["르세라핌"],
+    "NewJeans": ["뉴진스"], "STAYC": ["스테이씨"], "IVE": ["아이브"], "aespa": ["에스파"],
+    "TWICE": ["트와이스"], "EXO": ["엑소"], "NCT": ["엔시티"], "ENHYPEN": ["엔하이픈"],
+    "TXT": ["투모로우바이투게더"], "ITZY": ["있지"], "NMIXX": ["엔믹스"], "(G)I-DLE": ["여자아이들"],
+    "Red Velvet": ["레드벨벳"], "SEVENTEEN": ["세븐틴"], "Stray Kids": ["스트레이키즈"],
+    "ATEEZ": ["에이티즈"], "THE BOYZ": ["더보이즈"], "Kep1er": ["케플러"], "fromis_9": ["프로미스나인"],
+    "MAMAMOO": ["마마무"], "Oh My Girl": ["오마이걸"], "GFRIEND": ["여자친구"], "MONSTA X": ["몬스타엑스"],
+    "TREASURE": ["트레저"], "iKON": ["아이콘"], "WINNER": ["위너"], "2NE1": ["투애니원"],
+    "BIGBANG": ["빅뱅", "Big Bang"], "Girls' Generation": ["소녀시대", "SNSD"], "SHINee": ["샤이니"],
+    "Super Junior": ["슈퍼주니어"], "Wonder Girls": ["원더걸스"], "GOT7": ["갓세븐"], "DAY6": ["데이식스"],
+    "ILLIT": ["아일릿"], "KISS OF LIFE": ["키스오브라이프"], "BABYMONSTER": ["베이비몬스터"],
+    "ZEROBASEONE": ["제로베이스원"], "BOYNEXTDOOR": ["보이넥스트도어"], "RIIZE": ["라이즈"],
+    "TWS": ["투어스"], "QWER": ["큐더블유이알"], "IU": ["아이유"],
+}
+
+# 카탈로그 검색 인덱스 (자동완성/스마트 검색, ilike 스캔 대체)
+# 이름은 fold()로 정규화 (전각/대소문자/가타카나/자모), 별칭·로마자 표기로도 색인
+catalog_index = CatalogIndex(
+    normalize=fold,
+    variants=partial(name_variants, aliases=alias_table([name, *hangul] for name, hangul in KPOP_HANGUL_NAMES.items())),
+)
+
+# DB 쓰기 지연 큐 (검색/아티스트 요청에서 DB 저장을 응답 이후로)
+write_queue = WriteBehindQueue(max_pending=int(os.getenv("WRITE_QUEUE_SIZE", "2000")))
+WRITE_QUEUE_DRAIN_TIMEOUT = float(os.getenv("WRITE_QUEUE_DRAIN_TIMEOUT", "30"))
+
+# 크론 작업 큐 (SQLite, 아티스트 단위 작업 + 임대/재시도, 워커는 lifespan에서 시작)
+# 인스턴스별 로컬 디스크 전용 (NFS 등 공유 볼륨 금지, DEPLOY.md 참고), 종료 시 남은 작업은 다음 크론이 다시 등록
+JOB_QUEUE_PATH = os.getenv("JOB_QUEUE_PATH", "/tmp/vibestation_jobs.sqlite3")
+job_queue = JobQueue(JOB_QUEUE_PATH)
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+# 작업 핸들러의 동기 저장 코드 전용 풀 (업스트림 호출은 yt_call_sync로 background 풀에서 실행)
+executors["jobs"] = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="jobs")
+
+# 일괄 upsert 크기 / 최대 대기 시간 (초)
+BULK_UPSERT_CHUNK = int(os.getenv("BULK_UPSERT_CHUNK", "500"))
+BULK_UPSERT_MAX_DELAY = float(os.getenv("BULK_UPSERT_MAX_DELAY", "2"))
+
+# 검색 요약 저장 기간 (music_search_cache.result_json, 아티스트 재동기화 시 즉시 무효화)
+SEARCH_SUMMARY_TTL = int(os.getenv("SEARCH_SUMMARY_TTL", "86400"))
+
+# 국가별 인기 검색어 자동완성 (search_keywords 집계, 주기적으로 갱신)
+popular_queries = PopularQueries()
+POPULAR_QUERIES_REFRESH = int(os.getenv("POPULAR_QUERIES_REFRESH", "600"))
+
 def detect_artist_language(name: str, description: str = "") -> str:
     """
     아티스트 이름/설명에서 주요 언어 감지
@@ -193,39 +322,61 @@ def _try_create_virtual_member(browse_id: str, artist_name: str, thumbnail_url:
         logger.warning(f"Virtual member auto-creation skipped: {vm_error}")
 
 
+def _create_missing_virtual_members(artist_rows: list, failed_rows: list = ()) -> None:
+    """가상회원이 없는 아티스트만 생성 (profiles 조회 1회, 저장 실패한 아티스트 제외)"""
+    failed_ids = {row.get("browse_id") for row in failed_rows}
+    rows_by_id = {row["browse_id"]: row for row in artist_rows if row["browse_id"] not in failed_ids}
+    if not supabase_client or not rows_by_id:
+        return
+    try:
+        existing = supabase_client.table("profiles").select("artist_browse_id").in_(
+            "artist_browse_id", list(rows_by_id)
+        ).execute()
+        has_member = {row.get("artist_browse_id") for row in existing.data or []}
+        for browse_id, row in rows_by_id.items():
+            if browse_id not in has_member:
+                create_virtual_member_sync(browse_id, row["name"], row["thumbnail_url"])
+    except Exception as e:
+        logger.warning(f"Virtual member batch creation error: {e}")
+
+def _artist_row(artist_data: dict) -> dict | None:
+    """music_artists 행 생성 (언어 자동 감지)"""
+    browse_id = artist_data.get("browseId") or artist_data.get("browse_id")
+    if not browse_id:
+        return None
+
+    thumbnails = artist_data.get("thumbnails") or []
+    artist_name = artist_data.get("name") or artist_data.get("artist") or ""
+    description = artist_data.get("description") or ""
+
+    return {
+        "browse_id": browse_id,
+        "name": artist_name,
+        "thumbnails": json.dumps(thumbnails),
+        "thumbnail_url": get_best_thumbnail(thumbnails),
+        "description": description,
+        "subscribers": artist_data.get("subscribers") or "",
+        "primary_language": detect_artist_language(artist_name, description),
+        "last_updated": datetime.now(timezone.utc).isoformat()
+    }
+
 def db_save_artist(artist_data: dict) -> str | None:
     """아티스트를 DB에 저장 (upsert) + 자동 가상회원 생성 + 언어 자동 감지"""
     if not supabase_client:
         return None
 
     try:
-        browse_id = artist_data.get("browseId") or artist_data.get("browse_id")
-        if not browse_id:
+        data = _artist_row(artist_data)
+        if not data:
             return None
 
-        thumbnails = artist_data.get("thumbnails") or []
-        artist_name = artist_data.get("name") or artist_data.get("artist") or ""
-        description = artist_data.get("description") or ""
-        thumbnail_url = get_best_thumbnail(thumbnails)
-        primary_language = detect_artist_language(artist_name, description)
-
-        data = {
-            "browse_id": browse_id,
-            "name": artist_name,
-            "thumbnails": json.dumps(thumbnails),
-            "thumbnail_url": thumbnail_url,
-            "description": description,
-            "subscribers": artist_data.get("subscribers") or "",
-            "primary_language": primary_language,
-            "last_updated": datetime.now(timezone.utc).isoformat()
-        }
-
         result = supabase_client.table("music_artists").upsert(
             data, on_conflict="browse_id"
         ).execute()
 
         if result.data:
-            _try_create_virtual_member(browse_id, artist_name, thumbnail_url)
+            _try_create_virtual_member(data["browse_id"], data["name"], data["thumbnail_url"])
+            catalog_index.add_artist_row(result.data[0])
 
         if result.data and len(result.data) > 0:
             return result.data[0].get("id")
@@ -511,6 +662,16 @@ def db_get_artist_by_browse_id(browse_id: str) -> dict | None:
         logger.warning(f"DB get artist error: {e}")
         return None
 
+def _is_sync_due(last_synced: str | None, days: int = 7) -> bool:
+    """last_synced_at 값이 없거나 N일 초과인지"""
+    if not last_synced:
+        return True
+    try:
+        last_time = datetime.fromisoformat(last_synced.replace("Z", TIMEZONE_SUFFIX))
+    except ValueError:
+        return True
+    return datetime.now(timezone.utc) - last_time > timedelta(days=days)
+
 def db_check_artist_needs_sync(browse_id: str, days: int = 7) -> bool:
     """아티스트가 동기화 필요한지 확인 (last_synced_at이 N일 초과)"""
     if not supabase_client or not browse_id:
@@ -520,12 +681,9 @@ def db_check_artist_needs_sync(browse_id: str, days: int = 7) -> bool:
             "last_synced_at"
         ).eq("browse_id", browse_id).single().execute()
 
-        if not result.data or not result.data.get("last_synced_at"):
+        if not result.data:
             return True
-
-        last_synced = result.data.get("last_synced_at")
-        last_time = datetime.fromisoformat(last_synced.replace("Z", TIMEZONE_SUFFIX))
-        return datetime.now(timezone.utc) - last_time > timedelta(days=days)
+        return _is_sync_due(result.data.get("last_synced_at"), days)
     except Exception:
         return True
 
@@ -560,11 +718,14 @@ def db_save_artist_full(artist_data: dict) -> bool:
             "last_synced_at": datetime.now(timezone.utc).isoformat()
         }
 
-        supabase_client.table("music_artists").upsert(
+        result = supabase_client.table("music_artists").upsert(
             data, on_conflict="browse_id"
         ).execute()
+        for row in result.data or []:
+            catalog_index.add_artist_row(row)
 
         logger.info(f"Artist saved: {data['name']} ({browse_id}) lang: {primary_language}")
+        db_invalidate_search_summaries(browse_id)
 
         # 자동 가상회원 생성 (비동기 백그라운드)
         try:
@@ -579,74 +740,107 @@ def db_save_artist_full(artist_data: dict) -> bool:
         logger.warning(f"DB save artist error: {e}")
         return False
 
+def _album_row(album_data: dict, artist_browse_id: str) -> dict | None:
+    """music_albums 행 생성"""
+    browse_id = album_data.get("browseId")
+    if not browse_id:
+        return None
+    return {
+        "browse_id": browse_id,
+        "artist_browse_id": artist_browse_id,
+        "title": album_data.get("title") or "",
+        "type": album_data.get("type") or "Album",
+        "year": album_data.get("year") or "",
+        "thumbnail_url": get_best_thumbnail(album_data.get("thumbnails", [])),
+        "track_count": len(album_data.get("tracks", []))
+    }
+
 def db_save_album(album_data: dict, artist_browse_id: str) -> bool:
     """앨범 정보 저장"""
     if not supabase_client or not album_data or not artist_browse_id:
         return False
     try:
-        browse_id = album_data.get("browseId")
-        if not browse_id:
+        data = _album_row(album_data, artist_browse_id)
+        if not data:
             return False
 
-        data = {
-            "browse_id": browse_id,
-            "artist_browse_id": artist_browse_id,
-            "title": album_data.get("title") or "",
-            "type": album_data.get("type") or "Album",
-            "year": album_data.get("year") or "",
-            "thumbnail_url": get_best_thumbnail(album_data.get("thumbnails", [])),
-            "track_count": len(album_data.get("tracks", []))
-        }
-
-        supabase_client.table("music_albums").upsert(
+        result = supabase_client.table("music_albums").upsert(
             data, on_conflict="browse_id"
         ).execute()
+        for row in result.data or []:
+            catalog_index.add_album_row(row)
         return True
     except Exception as e:
         logger.warning(f"DB save album error: {e}")
         return False
 
+def _track_row(track_data: dict, album_browse_id: str, artist_browse_id: str, track_number: int = 0) -> dict | None:
+    """music_tracks 행 생성"""
+    video_id = track_data.get("videoId")
+    if not video_id:
+        return None
+
+    # duration을 초 단위로 변환
+    duration = track_data.get("duration") or ""
+    duration_seconds = 0
+    if duration:
+        parts = duration.split(":")
+        if len(parts) == 2:
+            duration_seconds = int(parts[0]) * 60 + int(parts[1])
+        elif len(parts) == 3:
+            duration_seconds = int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
+
+    return {
+        "video_id": video_id,
+        "album_browse_id": album_browse_id,
+        "artist_browse_id": artist_browse_id,
+        "title": track_data.get("title") or "",
+        "duration": duration,
+        "duration_seconds": duration_seconds,
+        "track_number": track_number,
+        "thumbnail_url": get_best_thumbnail(track_data.get("thumbnails", [])),
+        "is_explicit": track_data.get("isExplicit", False)
+    }
+
 def db_save_track(track_data: dict, album_browse_id: str, artist_browse_id: str, track_number: int = 0) -> bool:
     """트랙 정보 저장"""
     if not supabase_client or not track_data or not artist_browse_id:
         return False
     try:
-        video_id = track_data.get("videoId")
-        if not video_id:
+        data = _track_row(track_data, album_browse_id, artist_browse_id, track_number)
+        if not data:
             return False
 
-        # duration을 초 단위로 변환
-        duration = track_data.get("duration") or ""
-        duration_seconds = 0
-        if duration:
-            parts = duration.split(":")
-            if len(parts) == 2:
-                duration_seconds = int(parts[0]) * 60 + int(parts[1])
-            elif len(parts) == 3:
-                duration_seconds = int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-
-        data = {
-            "video_id": video_id,
-            "album_browse_id": album_browse_id,
-            "artist_browse_id": artist_browse_id,
-            "title": track_data.get("title") or "",
-            "duration": duration,
-            "duration_seconds": duration_seconds,
-            "track_number": track_number,
-            "thumbnail_url": get_best_thumbnail(track_data.get("thumbnails", [])),
-            "is_explicit": track_data.get("isExplicit", False)
-        }
-
-        supabase_client.table("music_tracks").upsert(
+        result = supabase_client.table("music_tracks").upsert(
             data, on_conflict="video_id"
         ).execute()
+        for row in result.data or []:
+            catalog_index.add_track_row(row)
         return True
     except Exception as e:
         logger.warning(f"DB save track error: {e}")
         return False
 
+def _index_saved_rows(table: str, rows: list) -> None:
+    """일괄 저장된 행을 카탈로그 인덱스에 반영"""
+    add_row = {
+        "music_artists": catalog_index.add_artist_row,
+        "music_albums": catalog_index.add_album_row,
+        "music_tracks": catalog_index.add_track_row,
+    }.get(table)
+    if add_row:
+        for row in rows:
+            add_row(row)
+
+def bulk_writer() -> BulkWriter:
+    """행을 모아 여러 행 단위 upsert로 저장 (with 블록 종료 시 flush)"""
+    return BulkWriter(
+        supabase_client, chunk_size=BULK_UPSERT_CHUNK, max_delay=BULK_UPSERT_MAX_DELAY,
+        on_flush=_index_saved_rows
+    )
+
 def db_save_search_keyword(keyword: str, country: str, artist_browse_id: str):
-    """검색어-아티스트 매핑 저장"""
+    """검색어-아티스트 매핑 저장 (새 매핑만 추가, 기존 search_count 유지)"""
     if not supabase_client or not keyword or not artist_browse_id:
         return
     try:
@@ -660,13 +854,13 @@ def db_save_search_keyword(keyword: str, country: str, artist_browse_id: str):
         }
 
         supabase_client.table("search_keywords").upsert(
-            data, on_conflict="keyword_normalized,country,artist_browse_id"
+            data, on_conflict="keyword_normalized,country,artist_browse_id", ignore_duplicates=True
         ).execute()
     except Exception as e:
         logger.warning(f"DB save search keyword error: {e}")
 
 def db_increment_search_count(keyword: str, country: str):
-    """검색 횟수 증가"""
+    """검색 횟수 증가 (검색어의 모든 아티스트 매핑)"""
     if not supabase_client:
         return
     try:
@@ -675,8 +869,8 @@ def db_increment_search_count(keyword: str, country: str):
             "p_keyword": keyword_normalized,
             "p_country": country
         }).execute()
-    except Exception:
-        pass  # 실패해도 무시
+    except Exception as e:
+        logger.warning(f"DB increment search count error: {e}")
 
 def db_get_artists_by_keyword(keyword: str, country: str) -> list:
     """검색어로 매핑된 아티스트 목록 조회"""
@@ -699,63 +893,89 @@ def db_get_artists_by_keyword(keyword: str, country: str) -> list:
         logger.warning(f"DB get artists by keyword error: {e}")
         return []
 
-def db_get_full_artist_data(browse_id: str) -> dict | None:
-    """아티스트의 전체 데이터 조회 (앨범, 트랙 포함)"""
-    if not supabase_client or not browse_id:
-        return None
-    try:
-        # 아티스트 기본 정보
-        artist_result = supabase_client.table("music_artists").select("*").eq(
-            "browse_id", browse_id
-        ).single().execute()
-
-        if not artist_result.data:
-            return None
-
-        artist = artist_result.data
-
-        # 앨범 목록
-        albums_result = supabase_client.table("music_albums").select("*").eq(
-            "artist_browse_id", browse_id
-        ).order("year", desc=True).execute()
+DB_PAGE_SIZE = 1000  # PostgREST 기본 최대 행 수
 
-        albums = albums_result.data or []
+def _db_fetch_all(build_query) -> list:
+    """range() 페이지 단위로 모든 행 조회 (build_query: 매번 새 쿼리 생성)"""
+    rows = []
+    while True:
+        page = build_query().range(len(rows), len(rows) + DB_PAGE_SIZE - 1).execute().data or []
+        rows.extend(page)
+        if len(page) < DB_PAGE_SIZE:
+            return rows
 
-        # 전체 트랙 목록
-        tracks_result = supabase_client.table("music_tracks").select("*").eq(
-            "artist_browse_id", browse_id
-        ).order("created_at", desc=True).execute()
+def _build_full_artist_data(artist: dict, albums: list, all_tracks: list) -> dict:
+    """DB 행(아티스트/앨범/트랙)을 API 응답 형식으로 변환"""
+    album_tracks_map = _group_tracks_by_album(all_tracks)
+    albums_with_tracks = [_transform_db_album(album, album_tracks_map) for album in albums]
+    album_titles = {album.get("browse_id"): album.get("title") for album in albums}
 
-        all_tracks = tracks_result.data or []
+    return {
+        "browseId": artist.get("browse_id"),
+        "artist": artist.get("name"),
+        "name": artist.get("name"),
+        "thumbnails": [{"url": artist.get("thumbnail_url")}] if artist.get("thumbnail_url") else [],
+        "subscribers": artist.get("subscribers"),
+        "description": artist.get("description"),
+        "topSongs": artist.get("top_songs_json") or [],
+        "related": artist.get("related_artists_json") or [],
+        "albums": albums_with_tracks,
+        "allTracks": [{
+            "videoId": t.get("video_id"),
+            "title": t.get("title"),
+            "duration": t.get("duration"),
+            "albumTitle": album_titles.get(t.get("album_browse_id")) or "",
+            "thumbnails": [{"url": t.get("thumbnail_url")}] if t.get("thumbnail_url") else []
+        } for t in all_tracks],
+        "last_synced_at": artist.get("last_synced_at"),
+        # 인기곡 플레이리스트 ID만 반환 (YouTube IFrame API용)
+        "songsPlaylistId": artist.get("songs_playlist_id")
+    }
 
-        # Group tracks by album and transform albums
-        album_tracks_map = _group_tracks_by_album(all_tracks)
-        albums_with_tracks = [_transform_db_album(album, album_tracks_map) for album in albums]
+def db_get_full_artists_data(browse_ids: list) -> dict:
+    """여러 아티스트의 전체 데이터를 한 번에 조회 (테이블당 쿼리 1회) -> {browse_id: data}"""
+    browse_ids = list(dict.fromkeys(bid for bid in browse_ids if bid))
+    if not supabase_client or not browse_ids:
+        return {}
+    try:
+        artists = supabase_client.table("music_artists").select("*").in_(
+            "browse_id", browse_ids
+        ).execute().data or []
+        if not artists:
+            return {}
+
+        # 앨범/트랙 목록 (아티스트별 정렬 유지)
+        albums = _db_fetch_all(lambda: supabase_client.table("music_albums").select("*").in_(
+            "artist_browse_id", browse_ids
+        ).order("year", desc=True).order("browse_id"))
+        all_tracks = _db_fetch_all(lambda: supabase_client.table("music_tracks").select("*").in_(
+            "artist_browse_id", browse_ids
+        ).order("created_at", desc=True).order("video_id"))
+
+        albums_by_artist = {}
+        for album in albums:
+            albums_by_artist.setdefault(album.get("artist_browse_id"), []).append(album)
+        tracks_by_artist = {}
+        for track in all_tracks:
+            tracks_by_artist.setdefault(track.get("artist_browse_id"), []).append(track)
 
         return {
-            "browseId": artist.get("browse_id"),
-            "artist": artist.get("name"),
-            "name": artist.get("name"),
-            "thumbnails": [{"url": artist.get("thumbnail_url")}] if artist.get("thumbnail_url") else [],
-            "subscribers": artist.get("subscribers"),
-            "description": artist.get("description"),
-            "topSongs": artist.get("top_songs_json") or [],
-            "related": artist.get("related_artists_json") or [],
-            "albums": albums_with_tracks,
-            "allTracks": [{
-                "videoId": t.get("video_id"),
-                "title": t.get("title"),
-                "duration": t.get("duration"),
-                "albumTitle": next((a.get("title") for a in albums if a.get("browse_id") == t.get("album_browse_id")), ""),
-                "thumbnails": [{"url": t.get("thumbnail_url")}] if t.get("thumbnail_url") else []
-            } for t in all_tracks],
-            "last_synced_at": artist.get("last_synced_at"),
-            # 인기곡 플레이리스트 ID만 반환 (YouTube IFrame API용)
-            "songsPlaylistId": artist.get("songs_playlist_id")
+            artist["browse_id"]: _build_full_artist_data(
+                artist,
+                albums_by_artist.get(artist["browse_id"], []),
+                tracks_by_artist.get(artist["browse_id"], [])
+            )
+            for artist in artists
         }
     except Exception as e:
-        logger.warning(f"DB get full artist data error: {e}")
+        logger.warning(f"DB get full artists data error: {e}")
+        return {}
+
+def db_get_full_artist_data(browse_id: str) -> dict | None:
+    """아티스트의 전체 데이터 조회 (앨범, 트랙 포함)"""
+    if not browse_id:
         return None
+    return db_get_full_artists_data([browse_id]).get(browse_id)
 
 def upscale_thumbnail_url(url: str, size: int = 544) -> str:
     """
@@ -811,8 +1031,8 @@ def get_best_thumbnail(thumbnails: list, size: int = 544) -> str:
 
 
 def _process_album_tracks(album_detail: dict, album_browse_id: str,
-                          artist_browse_id: str, existing_video_ids: set) -> int:
-    """Process and save tracks from an album. Returns count of new tracks."""
+                          artist_browse_id: str, existing_video_ids: set, writer: BulkWriter) -> int:
+    """Queue new tracks from an album for saving. Returns count of new tracks."""
     new_tracks = 0
     for idx, track in enumerate(album_detail.get("tracks") or []):
         video_id = track.get("videoId")
@@ -825,22 +1045,26 @@ def _process_album_tracks(album_detail: dict, album_browse_id: str,
             "thumbnails": track.get("thumbnails") or [],
             "isExplicit": track.get("isExplicit", False)
         }
-        db_save_track(track_data, album_browse_id, artist_browse_id, idx + 1)
+        try:
+            row = _track_row(track_data, album_browse_id, artist_browse_id, idx + 1)
+        except ValueError as e:
+            # 잘못된 duration 등: 해당 트랙만 건너뜀
+            logger.warning(f"Skipping track {video_id}: {e}")
+            continue
+        writer.add("music_tracks", row, on_conflict="video_id")
         new_tracks += 1
     return new_tracks
 
 
 def _process_single_album(ytmusic, album: dict, artist_browse_id: str,
-                          existing_album_ids: set, existing_video_ids: set) -> tuple[int, int]:
-    """Process a single album and its tracks. Returns (album_count, track_count)."""
+                          existing_video_ids: set, writer: BulkWriter) -> int | None:
+    """Fetch a single album and queue it with its new tracks. Returns new track count, None on failure."""
     album_browse_id = album.get("browseId")
-    if not album_browse_id or album_browse_id in existing_album_ids:
-        return 0, 0
 
     try:
-        album_detail = ytmusic.get_album(album_browse_id)
+        album_detail = yt_call_sync(ytmusic.get_album, album_browse_id)
         if not album_detail:
-            return 0, 0
+            return None
 
         album_data = {
             "browseId": album_browse_id,
@@ -849,42 +1073,60 @@ def _process_single_album(ytmusic, album: dict, artist_browse_id: str,
             "year": album_detail.get("year") or "",
             "thumbnails": album_detail.get("thumbnails") or []
         }
-        db_save_album(album_data, artist_browse_id)
-        new_tracks = _process_album_tracks(album_detail, album_browse_id, artist_browse_id, existing_video_ids)
-        return 1, new_tracks
+        row = _album_row(album_data, artist_browse_id)
+        row["content_fingerprint"] = album_fingerprint(album)
+        writer.add("music_albums", row, on_conflict="browse_id")
+        return _process_album_tracks(album_detail, album_browse_id, artist_browse_id, existing_video_ids, writer)
     except Exception as e:
         logger.warning(f"Background album fetch error: {e}")
-        return 0, 0
+        return None
+
+
+def _album_changed(album: dict, album_fingerprints: dict) -> bool:
+    """
+    목록 항목의 fingerprint가 저장된 값과 다른지 확인
+    - DB에 없는 앨범: 변경됨
+    - fingerprint 없이 저장된 기존 앨범: 변경 없음으로 간주 (기존 동작 유지)
+    """
+    browse_id = album.get("browseId")
+    if browse_id not in album_fingerprints:
+        return True
+    stored = album_fingerprints[browse_id]
+    return stored is not None and stored != album_fingerprint(album)
 
 
-def _process_album_list(ytmusic, album_list: list, existing_album_ids: set,
-                        existing_video_ids: set, artist_browse_id: str) -> tuple[int, int]:
-    """Process album list and save new albums/tracks. Returns (new_albums, new_tracks)."""
-    new_albums = 0
+def _process_album_list(ytmusic, album_list: list, album_fingerprints: dict,
+                        existing_video_ids: set, artist_browse_id: str, writer: BulkWriter) -> tuple[int, int, int]:
+    """Fetch albums whose fingerprint changed and queue them with new tracks. Returns (albums, new_tracks, failed)."""
+    albums = 0
     new_tracks = 0
+    failed = 0
     for album in album_list:
-        a_count, t_count = _process_single_album(
-            ytmusic, album, artist_browse_id, existing_album_ids, existing_video_ids
-        )
-        new_albums += a_count
+        if not album.get("browseId") or not _album_changed(album, album_fingerprints):
+            continue
+        t_count = _process_single_album(ytmusic, album, artist_browse_id, existing_video_ids, writer)
+        if t_count is None:
+            failed += 1
+            continue
+        albums += 1
         new_tracks += t_count
-    return new_albums, new_tracks
+    return albums, new_tracks, failed
 
 
-def _get_section_list(ytmusic, section: dict) -> list:
-    """Get album/single list from section with proper API call."""
+def _get_section_list(ytmusic, section: dict) -> tuple[list, bool]:
+    """Get album/single list from section with proper API call. Returns (items, complete)."""
     if not section or not isinstance(section, dict):
-        return []
+        return [], True
 
     params = section.get("params")
     browse_id = section.get("browseId")
 
     if params and browse_id:
         try:
-            return ytmusic.get_artist_albums(browse_id, params) or []
+            return yt_call_sync(ytmusic.get_artist_albums, browse_id, params) or [], True
         except Exception:
-            return section.get("results") or []
-    return section.get("results") or []
+            return section.get("results") or [], False
+    return section.get("results") or [], True
 
 
 def _extract_top_songs(songs_section: dict) -> list:
@@ -924,7 +1166,8 @@ def _extract_related_artists(related_section: dict) -> list:
 def background_update_artist(artist_browse_id: str, country: str):
     """
     백그라운드에서 아티스트 데이터 업데이트 (7일 경과 시 호출)
-    - 새 앨범/싱글 확인
+    - 앨범/싱글 섹션 fingerprint가 같으면 목록/앨범 조회 생략
+    - fingerprint가 바뀐 앨범만 다시 가져옴
     - 새 트랙만 DB에 추가 (기존 데이터 유지)
     """
     try:
@@ -932,48 +1175,57 @@ def background_update_artist(artist_browse_id: str, country: str):
 
         logger.info(f"Background update started: {artist_browse_id}")
 
-        existing_album_ids = db_get_existing_album_ids(artist_browse_id)
-        existing_video_ids = db_get_existing_video_ids(artist_browse_id)
-
         lang = COUNTRY_LANGUAGE_MAP.get(country.upper(), 'en')
         ytmusic = YTMusic(language=lang, location=country.upper())
 
-        artist_info = ytmusic.get_artist(artist_browse_id)
+        artist_info = yt_call_sync(ytmusic.get_artist, artist_browse_id)
         if not artist_info:
             logger.warning(f"Background update: Artist not found {artist_browse_id}")
             return
 
-        # Process albums
-        album_list = _get_section_list(ytmusic, artist_info.get("albums"))
-        albums_count, tracks_from_albums = _process_album_list(
-            ytmusic, album_list, existing_album_ids, existing_video_ids, artist_browse_id
-        )
-
-        # Process singles
-        singles_list = _get_section_list(ytmusic, artist_info.get("singles"))
-        singles_count, tracks_from_singles = _process_album_list(
-            ytmusic, singles_list, existing_album_ids, existing_video_ids, artist_browse_id
-        )
+        fingerprint = section_fingerprint(artist_info)
+        changed_albums_count = 0
+        new_tracks_count = 0
+        complete = True
 
-        new_albums_count = albums_count + singles_count
-        new_tracks_count = tracks_from_albums + tracks_from_singles
+        if fingerprint == db_get_artist_fingerprint(artist_browse_id):
+            logger.info(f"Background update: discography unchanged {artist_browse_id}")
+        else:
+            album_fingerprints = db_get_album_fingerprints(artist_browse_id)
+            existing_video_ids = db_get_existing_video_ids(artist_browse_id)
+
+            with bulk_writer() as writer:
+                # Process albums, then singles
+                for section_name in ("albums", "singles"):
+                    album_list, listed = _get_section_list(ytmusic, artist_info.get(section_name))
+                    a_count, t_count, failed = _process_album_list(
+                        ytmusic, album_list, album_fingerprints, existing_video_ids, artist_browse_id, writer
+                    )
+                    changed_albums_count += a_count
+                    new_tracks_count += t_count
+                    complete = complete and listed and not failed
+            complete = complete and not writer.failed_rows
 
         # Extract metadata
         top_songs = _extract_top_songs(artist_info.get("songs"))
         related_artists = _extract_related_artists(artist_info.get("related"))
 
-        # Update last_synced_at
+        # Update last_synced_at (+ fingerprint, 모든 변경 앨범 저장에 성공한 경우만)
         if supabase_client:
+            update = {
+                "top_songs_json": top_songs,
+                "related_artists_json": related_artists,
+                "last_synced_at": datetime.now(timezone.utc).isoformat()
+            }
+            if complete:
+                update["content_fingerprint"] = fingerprint
             try:
-                supabase_client.table("music_artists").update({
-                    "top_songs_json": top_songs,
-                    "related_artists_json": related_artists,
-                    "last_synced_at": datetime.now(timezone.utc).isoformat()
-                }).eq("browse_id", artist_browse_id).execute()
+                supabase_client.table("music_artists").update(update).eq("browse_id", artist_browse_id).execute()
             except Exception as e:
                 logger.warning(f"Background update artist error: {e}")
+        db_invalidate_search_summaries(artist_browse_id)
 
-        logger.info(f"Background update completed: {artist_browse_id} - {new_albums_count} new albums, {new_tracks_count} new tracks")
+        logger.info(f"Background update completed: {artist_browse_id} - {changed_albums_count} changed albums, {new_tracks_count} new tracks")
 
     except Exception as e:
         logger.error(f"Background update error: {e}")
@@ -994,20 +1246,35 @@ def db_get_existing_video_ids(artist_browse_id: str) -> set:
         logger.warning(f"DB get existing video_ids error: {e}")
         return set()
 
-def db_get_existing_album_ids(artist_browse_id: str) -> set:
-    """아티스트의 기존 album browse_id 목록 조회 (중복 방지용)"""
+def db_get_album_fingerprints(artist_browse_id: str) -> dict:
+    """아티스트의 기존 앨범 {browse_id: content_fingerprint} 조회 (변경 감지용)"""
     if not supabase_client or not artist_browse_id:
-        return set()
+        return {}
 
     try:
-        result = supabase_client.table("music_albums").select("browse_id").eq(
-            "artist_browse_id", artist_browse_id
-        ).execute()
+        rows = _db_fetch_all(lambda: supabase_client.table("music_albums").select(
+            "browse_id, content_fingerprint"
+        ).eq("artist_browse_id", artist_browse_id).order("browse_id"))
 
-        return {r.get("browse_id") for r in (result.data or []) if r.get("browse_id")}
+        return {r["browse_id"]: r.get("content_fingerprint") for r in rows if r.get("browse_id")}
     except Exception as e:
-        logger.warning(f"DB get existing album_ids error: {e}")
-        return set()
+        logger.warning(f"DB get album fingerprints error: {e}")
+        return {}
+
+def db_get_artist_fingerprint(browse_id: str) -> str | None:
+    """아티스트의 저장된 앨범/싱글 섹션 fingerprint 조회"""
+    if not supabase_client or not browse_id:
+        return None
+
+    try:
+        result = supabase_client.table("music_artists").select("content_fingerprint").eq(
+            "browse_id", browse_id
+        ).limit(1).execute()
+
+        return result.data[0].get("content_fingerprint") if result.data else None
+    except Exception as e:
+        logger.warning(f"DB get artist fingerprint error: {e}")
+        return None
 
 def db_artist_needs_update(browse_id: str, hours: int = 6) -> bool:
     """아티스트가 업데이트 필요한지 확인 (마지막 업데이트 후 N시간 경과)"""
@@ -1038,25 +1305,20 @@ def db_save_related_artists(main_artist_browse_id: str, related_artists: list):
         return
 
     try:
-        for related in related_artists:
-            related_browse_id = related.get("browseId")
-            if not related_browse_id:
-                continue
-
-            # 먼저 관련 아티스트도 music_artists 테이블에 저장
-            db_save_artist(related)
-
-            # 관계 저장
-            data = {
-                "main_artist_browse_id": main_artist_browse_id,
-                "related_artist_browse_id": related_browse_id,
-                "relation_type": "similar"
-            }
-
-            supabase_client.table("artist_relations").upsert(
-                data, on_conflict="main_artist_browse_id,related_artist_browse_id"
-            ).execute()
-
+        artist_rows = [row for row in map(_artist_row, related_artists) if row]
+        with bulk_writer() as writer:
+            for row in artist_rows:
+                # 먼저 관련 아티스트도 music_artists 테이블에 저장
+                writer.add("music_artists", row, on_conflict="browse_id")
+
+                # 관계 저장
+                writer.add("artist_relations", {
+                    "main_artist_browse_id": main_artist_browse_id,
+                    "related_artist_browse_id": row["browse_id"],
+                    "relation_type": "similar"
+                }, on_conflict="main_artist_browse_id,related_artist_browse_id")
+
+        _create_missing_virtual_members(artist_rows, writer.failed["music_artists"])
         logger.info(f"Saved {len(related_artists)} related artists for {main_artist_browse_id}")
     except Exception as e:
         logger.warning(f"DB save related artists error: {e}")
@@ -1083,11 +1345,90 @@ def db_save_search_cache(keyword: str, country: str, artist_ids: list):
     except Exception as e:
         logger.warning(f"DB save search cache error: {e}")
 
+def db_get_search_summary(keyword: str, country: str) -> dict | None:
+    """저장된 검색 요약(result_json) 조회 (만료 시 None)"""
+    if not supabase_client:
+        return None
+    try:
+        result = supabase_client.table("music_search_cache").select(
+            "result_json, expires_at"
+        ).eq("keyword_normalized", keyword.lower()).eq("country", country).limit(1).execute()
+
+        row = result.data[0] if result.data else None
+        if not row or not row.get("result_json") or not row.get("expires_at"):
+            return None
+
+        expires_at = datetime.fromisoformat(row["expires_at"].replace("Z", TIMEZONE_SUFFIX))
+        if expires_at <= datetime.now(timezone.utc):
+            return None
+        return row["result_json"]
+    except Exception as e:
+        logger.warning(f"DB get search summary error: {e}")
+        return None
+
+def db_save_search_summary(keyword: str, country: str, artist_browse_ids: list, summary: dict):
+    """검색 요약 전체를 result_json으로 저장 (조인 없이 바로 응답)"""
+    if not supabase_client or not artist_browse_ids:
+        return
+    try:
+        now = datetime.now(timezone.utc)
+        supabase_client.table("music_search_cache").upsert({
+            "keyword": keyword,
+            "keyword_normalized": keyword.lower(),
+            "country": country,
+            "artist_browse_ids": artist_browse_ids,
+            "result_count": len(artist_browse_ids),
+            "result_json": summary,
+            "expires_at": (now + timedelta(seconds=SEARCH_SUMMARY_TTL)).isoformat(),
+            "last_searched": now.isoformat()
+        }, on_conflict="keyword_normalized,country").execute()
+    except Exception as e:
+        logger.warning(f"DB save search summary error: {e}")
+
+def db_invalidate_search_summaries(artist_browse_id: str):
+    """아티스트 재동기화 시 해당 아티스트가 포함된 검색 요약 무효화"""
+    if not supabase_client or not artist_browse_id:
+        return
+    try:
+        supabase_client.table("music_search_cache").update({
+            "result_json": None,
+            "expires_at": None
+        }).contains("artist_browse_ids", [artist_browse_id]).execute()
+    except Exception as e:
+        logger.warning(f"DB invalidate search summaries error: {e}")
+
+async def refresh_popular_queries():
+    """인기 검색어 테이블 주기적 재구성"""
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            await loop.run_in_executor(executors["background"], popular_queries.load, supabase_client)
+        except Exception as e:
+            logger.warning(f"Popular queries refresh error: {e}")
+        await asyncio.sleep(POPULAR_QUERIES_REFRESH)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 시작 시
     logger.info("🚀 MusicGram API starting...")
+    global _main_loop
+    _main_loop = asyncio.get_running_loop()
+    popular_task = None
+    write_queue.start()
+    if supabase_client:
+        job_queue.purge()
+        job_workers.start()
+        # 카탈로그 인덱스는 백그라운드로 로드 (완료 전에는 ilike 검색 사용)
+        asyncio.get_running_loop().run_in_executor(executors["background"], catalog_index.load, supabase_client)
+        popular_task = asyncio.create_task(refresh_popular_queries())
     yield
+    if popular_task:
+        popular_task.cancel()
+    await job_workers.stop()
+    # 대기 중인 DB 쓰기 마무리
+    await asyncio.get_running_loop().run_in_executor(executors["background"], write_queue.close, WRITE_QUEUE_DRAIN_TIMEOUT)
+    for executor in executors.values():
+        executor.shutdown(wait=False)
     # 종료 시
     logger.info("👋 MusicGram API shutting down...")
 
@@ -1099,6 +1440,15 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request: Request, exc: CircuitOpenError):
+    """업스트림 circuit이 열려 있고 캐시된 사본도 없을 때"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(int(exc.retry_in) + 1)},
+    )
+
 # CORS 설정 (모든 origin 허용)
 app.add_middleware(
     CORSMiddleware,
@@ -1124,7 +1474,13 @@ def root():
 def health():
     return {
         "status": "healthy",
-        "database": "connected" if supabase_client else "not configured"
+        "database": "connected" if supabase_client else "not configured",
+        "cache": local_cache.stats(),
+        "upstream": upstream_guard.stats(),
+        "catalog_index": catalog_index.stats(),
+        "popular_queries": popular_queries.stats(),
+        "write_queue": write_queue.stats(),
+        "jobs": job_workers.stats()
     }
 
 # =============================================================================
@@ -1156,7 +1512,7 @@ def search_music(
     # API 호출
     try:
         ytmusic = get_ytmusic(country)
-        results = ytmusic.search(q, filter=filter, limit=limit)
+        results = yt_call_sync(ytmusic.search, q, filter=filter, limit=limit, lane="interactive")
 
         # 캐시 저장 (30분)
         cache_set(cache_key, results, ttl=1800)
@@ -1171,16 +1527,37 @@ def search_music(
 
 
 @app.get("/api/search/suggestions")
-async def get_search_suggestions(q: str, limit: int = 10):
+async def get_search_suggestions(request: Request, q: str, limit: int = 10, country: str = None):
     """검색 자동완성 - Supabase 우선, YouTube 보조"""
     if not q or len(q.strip()) < 1:
         return {"suggestions": []}
-    
+
+    if not country:
+        country = request.headers.get("CF-IPCountry", "US")
+
     query = q.strip().lower()
     suggestions = []
     
-    # 1. Supabase에서 아티스트/트랙 검색 (빠름)
-    if supabase_client:
+    # 1. 카탈로그 인덱스 검색 (로드 완료 시, 수 ms 이내)
+    if catalog_index.ready:
+        for artist in catalog_index.search(q, 5, kinds=("artist",)):
+            suggestions.append({
+                "type": "artist",
+                "text": artist.get("artist"),
+                "browseId": artist.get("browseId"),
+                "thumbnail": artist.get("thumbnail")
+            })
+        for track in catalog_index.search(q, 5, kinds=("song",)):
+            artist_name = track["artists"][0]["name"] if track.get("artists") else ""
+            suggestions.append({
+                "type": "song",
+                "text": f"{track.get('title')} - {artist_name}",
+                "videoId": track.get("videoId"),
+                "thumbnail": track["thumbnails"][0]["url"] if track.get("thumbnails") else None
+            })
+
+    # 1-1. 인덱스 로드 전에는 Supabase에서 아티스트/트랙 검색
+    elif supabase_client:
         try:
             # 아티스트 검색
             artists = supabase_client.table("music_artists").select(
@@ -1211,11 +1588,16 @@ async def get_search_suggestions(q: str, limit: int = 10):
         except Exception as e:
             logger.warning(f"Supabase suggestions error: {e}")
     
-    # 2. Supabase 결과가 부족하면 YouTube API 호출
+    # 2. 인기 검색어 (국가별 검색 횟수 순)
+    for text in popular_queries.top(q, country, limit=5):
+        if not any(s["text"].lower() == text.lower() for s in suggestions):
+            suggestions.append({"type": "query", "text": text})
+
+    # 3. 결과가 부족하면 YouTube API 호출
     if len(suggestions) < 5:
         try:
             ytmusic = get_ytmusic("US")
-            yt_suggestions = ytmusic.get_search_suggestions(q)
+            yt_suggestions = await yt_call(ytmusic.get_search_suggestions, q)
             for text in yt_suggestions[:limit - len(suggestions)]:
                 if not any(s["text"].lower() == text.lower() for s in suggestions):
                     suggestions.append({"type": "query", "text": text})
@@ -1242,8 +1624,14 @@ async def smart_search(request: Request, q: str, country: str = None, limit: int
     source = "supabase"
     top_artist = None
     
-    # 1. Supabase에서 먼저 검색 (빠름: ~0.1초)
-    if supabase_client:
+    # 1. 카탈로그 인덱스에서 먼저 검색 (로드 완료 시)
+    if catalog_index.ready:
+        artists = catalog_index.search(q, 10, kinds=("artist",))
+        songs = catalog_index.search(q, limit, kinds=("song",))
+        albums = catalog_index.search(q, 10, kinds=("album",))
+
+    # 1-1. 인덱스 로드 전에는 Supabase에서 검색 (~0.1초)
+    elif supabase_client:
         try:
             # 아티스트 검색
             artist_results = supabase_client.table("music_artists").select(
@@ -1309,7 +1697,7 @@ async def smart_search(request: Request, q: str, country: str = None, limit: int
         ytmusic = get_ytmusic(country)
         
         # ★ 핵심: filter 없이 검색하면 모든 타입을 한번에 반환!
-        all_results = await run_in_thread(ytmusic.search, q.strip(), limit=50)
+        all_results = await yt_call(ytmusic.search, q.strip(), limit=50)
         
         # 결과를 타입별로 분류
         for item in (all_results or []):
@@ -1324,8 +1712,8 @@ async def smart_search(request: Request, q: str, country: str = None, limit: int
                 }
                 if artist_data["browseId"] and not any(x.get("browseId") == artist_data["browseId"] for x in artists):
                     artists.append(artist_data)
-                    # 가상회원 자동 생성!
-                    _save_artist_to_supabase(artist_data)
+                    # 가상회원 자동 생성! (응답 후 저장)
+                    write_queue.submit(("artist", artist_data["browseId"]), _save_artist_to_supabase, artist_data)
             
             elif result_type == "song":
                 song_data = {
@@ -1338,7 +1726,7 @@ async def smart_search(request: Request, q: str, country: str = None, limit: int
                 }
                 if song_data["videoId"] and not any(x.get("videoId") == song_data["videoId"] for x in songs):
                     songs.append(song_data)
-                    _save_track_to_supabase(song_data)
+                    write_queue.submit(("track", song_data["videoId"]), _save_track_to_supabase, song_data)
             
             elif result_type == "album":
                 album_data = {
@@ -1350,7 +1738,7 @@ async def smart_search(request: Request, q: str, country: str = None, limit: int
                 }
                 if album_data["browseId"] and not any(x.get("browseId") == album_data["browseId"] for x in albums):
                     albums.append(album_data)
-                    _save_album_to_supabase(album_data)
+                    write_queue.submit(("album", album_data["browseId"]), _save_album_to_supabase, album_data)
             
             # 동영상도 노래와 동일하게 처리 (videoId가 있음)
             elif result_type == "video":
@@ -1364,7 +1752,7 @@ async def smart_search(request: Request, q: str, country: str = None, limit: int
                 }
                 if video_data["videoId"] and not any(x.get("videoId") == video_data["videoId"] for x in songs):
                     songs.append(video_data)  # 비디오도 songs에 포함 (재생 가능)
-                    _save_track_to_supabase(video_data)
+                    write_queue.submit(("track", video_data["videoId"]), _save_track_to_supabase, video_data)
                     
     except Exception as e:
         logger.error(f"YouTube search error: {e}")
@@ -1405,7 +1793,7 @@ def _save_artist_to_supabase(artist_data: dict):
     
     try:
         # 1. music_artists 테이블에 저장
-        supabase_client.table("music_artists").upsert({
+        result = supabase_client.table("music_artists").upsert({
             "browse_id": browse_id,
             "name": artist_name,
             "name_normalized": artist_name.lower() if artist_name else "",
@@ -1413,6 +1801,8 @@ def _save_artist_to_supabase(artist_data: dict):
             "subscribers": artist_data.get("subscribers"),
             "updated_at": datetime.now(timezone.utc).isoformat()
         }, on_conflict="browse_id").execute()
+        for row in result.data or []:
+            catalog_index.add_artist_row(row)
         
         logger.info(f"[SAVE] Artist saved to music_artists: {artist_name}")
         
@@ -1443,7 +1833,7 @@ def _save_track_to_supabase(track_data: dict):
         if track_data.get("thumbnails") and len(track_data["thumbnails"]) > 0:
             thumbnail_url = track_data["thumbnails"][0].get("url", "")
             
-        supabase_client.table("music_tracks").upsert({
+        result = supabase_client.table("music_tracks").upsert({
             "video_id": track_data["videoId"],
             "title": track_data.get("title", ""),
             "title_normalized": (track_data.get("title") or "").lower(),
@@ -1451,6 +1841,8 @@ def _save_track_to_supabase(track_data: dict):
             "thumbnail_url": thumbnail_url,
             "duration": track_data.get("duration")
         }, on_conflict="video_id").execute()
+        for row in result.data or []:
+            catalog_index.add_track_row(row)
     except Exception as e:
         logger.warning(f"Save track error: {e}")
 
@@ -1464,7 +1856,7 @@ def _save_album_to_supabase(album_data: dict):
         if album_data.get("thumbnails") and len(album_data["thumbnails"]) > 0:
             thumbnail_url = album_data["thumbnails"][0].get("url", "")
             
-        supabase_client.table("music_albums").upsert({
+        result = supabase_client.table("music_albums").upsert({
             "browse_id": album_data["browseId"],
             "title": album_data.get("title", ""),
             "title_normalized": (album_data.get("title") or "").lower(),
@@ -1472,6 +1864,8 @@ def _save_album_to_supabase(album_data: dict):
             "year": album_data.get("year"),
             "type": album_data.get("type")
         }, on_conflict="browse_id").execute()
+        for row in result.data or []:
+            catalog_index.add_album_row(row)
     except Exception as e:
         logger.warning(f"Save album error: {e}")
 
@@ -1494,7 +1888,7 @@ def get_charts(request: Request, country: str = None):
     
     try:
         ytmusic = get_ytmusic(country)
-        charts = ytmusic.get_charts(country=country)
+        charts = yt_call_sync(ytmusic.get_charts, country=country, lane="interactive")
         
         # 1시간 캐시
         cache_set(cache_key, charts, ttl=3600)
@@ -1522,7 +1916,7 @@ def get_new_albums(request: Request, country: str = None):
     
     try:
         ytmusic = get_ytmusic(country)
-        albums = ytmusic.get_new_albums()
+        albums = yt_call_sync(ytmusic.get_new_albums, lane="interactive")
         
         # 1시간 캐시
         cache_set(cache_key, albums, ttl=3600)
@@ -1550,7 +1944,7 @@ def get_moods(request: Request, country: str = None):
 
     try:
         ytmusic = get_ytmusic(country)
-        moods = ytmusic.get_mood_categories()
+        moods = yt_call_sync(ytmusic.get_mood_categories, lane="interactive")
 
         # 6시간 캐시
         cache_set(cache_key, moods, ttl=21600)
@@ -1575,7 +1969,7 @@ def get_mood_playlists(params: str, country: str = None, request: Request = None
 
     try:
         ytmusic = get_ytmusic(country)
-        playlists = ytmusic.get_mood_playlists(params)
+        playlists = yt_call_sync(ytmusic.get_mood_playlists, params, lane="interactive")
 
         # 1시간 캐시
         cache_set(cache_key, playlists, ttl=3600)
@@ -1598,41 +1992,42 @@ async def get_home_feed(request: Request, country: str = None, limit: int = 6):
 
     cache_key = f"home_feed:{country}:{limit}"
 
-    cached = cache_get(cache_key)
-    if cached:
-        return {"country": country, "source": "cache", "sections": cached}
-
-    # 재시도 로직 (YTMusic API 간헐적 빈 응답 대응)
-    max_retries = 3
-    last_error = None
+    async def fetch_home():
+        # 재시도 로직 (YTMusic API 간헐적 빈 응답 대응)
+        max_retries = 3
+        last_error = None
 
-    for attempt in range(max_retries):
-        try:
-            ytmusic = get_ytmusic(country)
+        for attempt in range(max_retries):
+            try:
+                ytmusic = get_ytmusic(country)
 
-            # get_home()은 홈 화면의 모든 섹션을 반환
-            home_sections = ytmusic.get_home(limit=limit)
+                # get_home()은 홈 화면의 모든 섹션을 반환
+                home_sections = await yt_call(ytmusic.get_home, limit=limit)
 
-            # 유효한 응답인지 확인
-            if home_sections and isinstance(home_sections, list) and len(home_sections) > 0:
-                # 30분 캐시
-                cache_set(cache_key, home_sections, ttl=1800)
-                return {"country": country, "source": "api", "sections": home_sections}
-            else:
+                # 유효한 응답인지 확인
+                if home_sections and isinstance(home_sections, list) and len(home_sections) > 0:
+                    return home_sections
                 logger.warning(f"Home feed empty response (attempt {attempt + 1}/{max_retries})")
                 last_error = "Empty response from YTMusic API"
 
-        except Exception as e:
-            logger.warning(f"Home feed attempt {attempt + 1}/{max_retries} failed: {e}")
-            last_error = str(e)
+            except Exception as e:
+                logger.warning(f"Home feed attempt {attempt + 1}/{max_retries} failed: {e}")
+                last_error = str(e)
+
+            # 재시도 전 대기 (exponential backoff)
+            if attempt < max_retries - 1:
+                await asyncio.sleep(0.5 * (attempt + 1))
 
-        # 재시도 전 대기 (exponential backoff)
-        if attempt < max_retries - 1:
-            await asyncio.sleep(0.5 * (attempt + 1))
+        raise RuntimeError(f"Home feed failed after {max_retries} attempts: {last_error}")
 
-    # 모든 재시도 실패 시 빈 응답 반환 (500 에러 대신)
-    logger.error(f"Home feed failed after {max_retries} attempts: {last_error}")
-    return {"country": country, "source": "fallback", "sections": [], "error": "Temporary service unavailable"}
+    # stale-while-revalidate: 마지막 정상 응답을 즉시 반환하고 갱신은 백그라운드에서 1회만
+    try:
+        home_sections, source = await feed_store.get_with_source(cache_key, fetch_home, ttl=1800)
+        return {"country": country, "source": source, "sections": home_sections}
+    except Exception as e:
+        # 저장된 응답이 전혀 없을 때만 빈 응답 반환 (500 에러 대신)
+        logger.error(str(e))
+        return {"country": country, "source": "fallback", "sections": [], "error": "Temporary service unavailable"}
 
 
 # =============================================================================
@@ -1704,8 +2099,9 @@ def _extract_albums_from_section(section: dict | None, album_type: str = "Album"
     return albums
 
 
-def _process_and_save_album_section(ytmusic, section: dict | None, artist_id: str, album_type: str) -> None:
-    """Process albums/singles section and save to DB."""
+def _process_and_save_album_section(ytmusic, section: dict | None, artist_id: str, album_type: str,
+                                    writer: BulkWriter, album_fingerprints: dict) -> None:
+    """Process albums/singles section and queue the ones whose fingerprint changed for saving."""
     if not section or not isinstance(section, dict):
         return
 
@@ -1713,13 +2109,16 @@ def _process_and_save_album_section(ytmusic, section: dict | None, artist_id: st
     browse_id = section.get("browseId")
 
     if params and browse_id:
-        items = ytmusic.get_artist_albums(browse_id, params) or []
+        items = yt_call_sync(ytmusic.get_artist_albums, browse_id, params) or []
     else:
         items = section.get("results") or []
 
     for item in items:
         if not isinstance(item, dict) or not item.get("browseId"):
             continue
+        fingerprint = album_fingerprint(item)
+        if album_fingerprints.get(item["browseId"]) == fingerprint:
+            continue
         album_data = {
             "browseId": item.get("browseId"),
             "title": item.get("title") or "",
@@ -1728,7 +2127,9 @@ def _process_and_save_album_section(ytmusic, section: dict | None, artist_id: st
             "thumbnails": item.get("thumbnails") or [],
             "tracks": []
         }
-        db_save_album(album_data, artist_id)
+        row = _album_row(album_data, artist_id)
+        row["content_fingerprint"] = fingerprint
+        writer.add("music_albums", row, on_conflict="browse_id")
 
 
 def save_full_artist_data_background(artist_id: str, artist_info: dict, country: str):
@@ -1753,13 +2154,27 @@ def save_full_artist_data_background(artist_id: str, artist_info: dict, country:
         }
         db_save_artist_full(artist_data)
 
-        # 2. 앨범/싱글 전체 목록 가져오기 & 저장
+        # 2. 앨범/싱글 섹션 fingerprint 비교 (같으면 목록 조회 생략)
+        fingerprint = section_fingerprint(artist_info)
+        stored_fingerprint = db_get_artist_fingerprint(artist_id)
+        if fingerprint == stored_fingerprint:
+            logger.info(f"Background save: discography unchanged for artist: {artist_name}")
+            return
+
+        # 3. 앨범/싱글 전체 목록 가져오기 & 바뀐 앨범만 저장
+        # (저장된 섹션 fingerprint가 없으면 앨범을 모두 저장하므로 조회 생략)
+        album_fingerprints = db_get_album_fingerprints(artist_id) if stored_fingerprint else {}
         try:
-            _process_and_save_album_section(ytmusic, artist_info.get("albums"), artist_id, "Album")
-            _process_and_save_album_section(ytmusic, artist_info.get("singles"), artist_id, "Single")
+            with bulk_writer() as writer:
+                _process_and_save_album_section(ytmusic, artist_info.get("albums"), artist_id, "Album", writer, album_fingerprints)
+                _process_and_save_album_section(ytmusic, artist_info.get("singles"), artist_id, "Single", writer, album_fingerprints)
+            if not writer.failed_rows:
+                supabase_client.table("music_artists").update({
+                    "content_fingerprint": fingerprint
+                }).eq("browse_id", artist_id).execute()
         except Exception as e:
             logger.warning(f"Background album save error: {e}")
-            
+
         logger.info(f"Background save completed for artist: {artist_name}")
 
     except Exception as e:
@@ -1812,8 +2227,11 @@ def _process_db_artists(
     all_tracks = []
     needs_background_update = False
 
+    # 아티스트/앨범/트랙 각 1회 조회 (아티스트 수와 무관)
+    artists_full = db_get_full_artists_data(artist_browse_ids)
+
     for browse_id in artist_browse_ids:
-        artist_full = db_get_full_artist_data(browse_id)
+        artist_full = artists_full.get(browse_id)
         if not artist_full:
             continue
         
@@ -1831,7 +2249,7 @@ def _process_db_artists(
         # Collect all tracks efficiently
         all_tracks.extend(artist_full.get("allTracks", []))
 
-        if db_check_artist_needs_sync(browse_id, days=7):
+        if _is_sync_due(artist_full.get("last_synced_at"), days=7):
             needs_background_update = True
             background_tasks.add_task(background_update_artist, browse_id, country)
 
@@ -1899,7 +2317,7 @@ async def _process_best_artist_for_summary(
         return artists_data, albums_data, songs_search
 
     try:
-        artist_info = await run_in_thread(ytmusic.get_artist, artist_id)
+        artist_info = await yt_call(ytmusic.get_artist, artist_id)
         if not artist_info or not isinstance(artist_info, dict):
             return artists_data, albums_data, songs_search
 
@@ -1925,7 +2343,8 @@ async def _process_best_artist_for_summary(
             albums_data.append(album)
 
         # Schedule background tasks
-        background_tasks.add_task(save_full_artist_data_background, artist_id, artist_info, country)
+        cache_set(f"artist:{artist_id}:{country}", artist_info, ttl=21600)
+        await queue_artist_sync(artist_id, country)
         background_tasks.add_task(db_save_search_keyword, query, country, artist_id)
 
     except Exception as e:
@@ -1991,8 +2410,8 @@ async def _fetch_ytmusic_summary(
     ytmusic = get_ytmusic(country)
 
     # 병렬 검색
-    future_artists = run_in_thread(ytmusic.search, q, filter="artists", limit=5)
-    future_songs = run_in_thread(ytmusic.search, q, filter="songs", limit=20)
+    future_artists = yt_call(ytmusic.search, q, filter="artists", limit=5)
+    future_songs = yt_call(ytmusic.search, q, filter="songs", limit=20)
     artists_results, direct_song_results = await asyncio.gather(
         future_artists, future_songs, return_exceptions=True
     )
@@ -2009,7 +2428,7 @@ async def _fetch_ytmusic_summary(
     artists_search = artists_results or []
     if not artists_search:
         try:
-            general_results = await run_in_thread(ytmusic.search, q, limit=40)
+            general_results = await yt_call(ytmusic.search, q, limit=40)
             artists_search = [r for r in general_results if r.get("resultType") == "artist"][:5]
         except Exception as e:
             logger.warning(f"Fallback general search failed: {e}")
@@ -2103,7 +2522,7 @@ def get_artist_songs_playlist(artist_id: str, country: str = "US"):
 
     try:
         ytmusic = get_ytmusic(country)
-        artist = ytmusic.get_artist(artist_id)
+        artist = yt_call_sync(ytmusic.get_artist, artist_id, lane="interactive")
 
         if not artist:
             raise HTTPException(status_code=404, detail=ERROR_ARTIST_NOT_FOUND)
@@ -2169,7 +2588,7 @@ async def _fetch_all_albums(ytmusic, section: dict, artist_name: str, album_type
 
     if browse_id and params:
         try:
-            all_items = await run_in_thread(ytmusic.get_artist_albums, browse_id, params)
+            all_items = await yt_call(ytmusic.get_artist_albums, browse_id, params)
             for item in (all_items or []):
                 albums.append({
                     "browseId": item.get("browseId"),
@@ -2283,34 +2702,13 @@ def _save_search_albums_to_db(albums: list, artist_browse_id: str) -> int:
     if not supabase_client or not albums or not artist_browse_id:
         return 0
 
-    saved_count = 0
-    for album in albums:
-        if not isinstance(album, dict):
-            continue
-
-        browse_id = album.get("browseId")
-        if not browse_id:
-            continue
-
-        try:
-            album_data = {
-                "browse_id": browse_id,
-                "artist_browse_id": artist_browse_id,
-                "title": album.get("title") or "",
-                "type": album.get("type") or "Album",
-                "year": album.get("year") or "",
-                "thumbnail_url": get_best_thumbnail(album.get("thumbnails", [])),
-                "track_count": len(album.get("tracks", []))
-            }
-
-            supabase_client.table("music_albums").upsert(
-                album_data, on_conflict="browse_id"
-            ).execute()
-            saved_count += 1
-        except Exception as e:
-            logger.warning(f"Album save failed for {browse_id}: {e}")
+    with bulk_writer() as writer:
+        for album in albums:
+            if not isinstance(album, dict) or not album.get("browseId"):
+                continue
+            writer.add("music_albums", _album_row(album, artist_browse_id), on_conflict="browse_id")
 
-    return saved_count
+    return writer.table_rows["music_albums"]
 
 
 def _save_search_tracks_to_db(songs: list, artist_browse_id: str) -> int:
@@ -2318,37 +2716,27 @@ def _save_search_tracks_to_db(songs: list, artist_browse_id: str) -> int:
     if not supabase_client or not songs or not artist_browse_id:
         return 0
 
-    saved_count = 0
-    for song in songs:
-        if not isinstance(song, dict):
-            continue
+    with bulk_writer() as writer:
+        for song in songs:
+            if not isinstance(song, dict):
+                continue
 
-        video_id = song.get("videoId")
-        if not video_id:
-            continue
+            video_id = song.get("videoId")
+            if not video_id:
+                continue
 
-        try:
             duration = song.get("duration") or ""
-            duration_seconds = _parse_duration_to_seconds(duration)
-
-            track_data = {
+            writer.add("music_tracks", {
                 "video_id": video_id,
                 "artist_browse_id": artist_browse_id,
                 "title": song.get("title") or "",
                 "duration": duration,
-                "duration_seconds": duration_seconds,
+                "duration_seconds": _parse_duration_to_seconds(duration),
                 "thumbnail_url": get_best_thumbnail(song.get("thumbnails", [])),
                 "is_explicit": song.get("isExplicit", False)
-            }
-
-            supabase_client.table("music_tracks").upsert(
-                track_data, on_conflict="video_id"
-            ).execute()
-            saved_count += 1
-        except Exception as e:
-            logger.warning(f"Track save failed for {video_id}: {e}")
+            }, on_conflict="video_id")
 
-    return saved_count
+    return writer.table_rows["music_tracks"]
 
 
 def _save_artist_relations_to_db(main_browse_id: str, similar_artists: list) -> int:
@@ -2356,42 +2744,33 @@ def _save_artist_relations_to_db(main_browse_id: str, similar_artists: list) ->
     if not supabase_client or not main_browse_id or not similar_artists:
         return 0
 
-    saved_count = 0
-    for artist in similar_artists:
-        if not isinstance(artist, dict):
-            continue
+    with bulk_writer() as writer:
+        for artist in similar_artists:
+            if not isinstance(artist, dict):
+                continue
 
-        related_id = artist.get("browseId")
-        if not related_id or related_id == main_browse_id:
-            continue
+            related_id = artist.get("browseId")
+            if not related_id or related_id == main_browse_id:
+                continue
 
-        try:
-            relation_data = {
+            writer.add("artist_relations", {
                 "main_artist_browse_id": main_browse_id,
                 "related_artist_browse_id": related_id,
                 "relation_type": "similar"
-            }
-
-            supabase_client.table("artist_relations").upsert(
-                relation_data,
-                on_conflict="main_artist_browse_id,related_artist_browse_id"
-            ).execute()
-            saved_count += 1
+            }, on_conflict="main_artist_browse_id,related_artist_browse_id")
 
             # Also save the related artist to music_artists
             related_name = artist.get("name") or artist.get("artist") or ""
             related_thumb = artist.get("thumbnail") or get_best_thumbnail(artist.get("thumbnails", []))
             if related_name:
-                supabase_client.table("music_artists").upsert({
+                writer.add("music_artists", {
                     "browse_id": related_id,
                     "name": related_name,
                     "thumbnail_url": related_thumb,
                     "updated_at": datetime.now(timezone.utc).isoformat()
-                }, on_conflict="browse_id").execute()
-        except Exception as e:
-            logger.warning(f"Relation save failed for {main_browse_id} -> {related_id}: {e}")
+                }, on_conflict="browse_id")
 
-    return saved_count
+    return writer.table_rows["artist_relations"]
 
 
 def _parse_duration_to_seconds(duration: str) -> int:
@@ -2423,7 +2802,7 @@ async def _process_quick_search_artist(ytmusic, artists_results: list) -> tuple:
 
     if artist_id:
         try:
-            artist_detail = await run_in_thread(ytmusic.get_artist, artist_id)
+            artist_detail = await yt_call(ytmusic.get_artist, artist_id)
             songs_playlist_id = _extract_songs_playlist_id_from_detail(artist_detail)
             artist_name = artist.get("artist") or artist.get("name")
 
@@ -2488,8 +2867,8 @@ async def search_quick(request: Request, q: str, country: str = None):
 
     try:
         ytmusic = get_ytmusic(country)
-        future_artists = run_in_thread(ytmusic.search, q.strip(), filter="artists", limit=11)
-        future_songs = run_in_thread(ytmusic.search, q.strip(), filter="songs", limit=5)
+        future_artists = yt_call(ytmusic.search, q.strip(), filter="artists", limit=11)
+        future_songs = yt_call(ytmusic.search, q.strip(), filter="songs", limit=5)
         artists_results, songs_results = await asyncio.gather(
             future_artists, future_songs, return_exceptions=True
         )
@@ -2596,7 +2975,7 @@ async def get_artist_playlist_id(q: str, country: str = "US"):
 
         # Search via ytmusicapi
         ytmusic = get_ytmusic(country)
-        artists = await run_in_thread(ytmusic.search, q.strip(), filter="artists", limit=1)
+        artists = await yt_call(ytmusic.search, q.strip(), filter="artists", limit=1)
 
         if not artists:
             return {"playlistId": None, "artist": None}
@@ -2609,7 +2988,7 @@ async def get_artist_playlist_id(q: str, country: str = "US"):
             return {"playlistId": None, "artist": artist_name}
 
         # Get artist detail and extract playlist ID
-        artist_detail = await run_in_thread(ytmusic.get_artist, artist_id)
+        artist_detail = await yt_call(ytmusic.get_artist, artist_id)
         playlist_id = _extract_songs_playlist_id_from_detail(artist_detail)
 
         # Save to database
@@ -2683,16 +3062,15 @@ async def get_artist(artist_id: str, country: str = "US", force_refresh: bool =
 
     try:
         ytmusic = get_ytmusic(country)
-        artist = await run_in_thread(ytmusic.get_artist, artist_id)
+        artist = await yt_call(ytmusic.get_artist, artist_id)
+        discography.remember(f"{artist_id}:{country}", artist)
+
+        cache_set(cache_key, artist, ttl=21600)
 
         if should_refresh and artist:
-            try:
-                save_full_artist_data_background(artist_id, artist, country)
-                logger.info(f"[ON-DEMAND] Updated: {artist.get('name', artist_id)}")
-            except Exception as save_err:
-                logger.warning(f"On-demand save failed: {save_err}")
+            await queue_artist_sync(artist_id, country)
+            logger.info(f"[ON-DEMAND] Update queued: {artist.get('name', artist_id)}")
 
-        cache_set(cache_key, artist, ttl=21600)
         return {"source": "api", "artist": artist, "refreshed": should_refresh}
     except Exception as e:
         logger.error(f"Artist error: {e}")
@@ -2732,7 +3110,7 @@ async def _fetch_full_section_items(ytmusic, section: dict, item_type: str) -> l
 
     if browse_id and params:
         try:
-            full_list = await run_in_thread(ytmusic.get_artist_albums, browse_id, params)
+            full_list = await yt_call(ytmusic.get_artist_albums, browse_id, params)
             return _convert_album_list(full_list or [], item_type)
         except Exception as e:
             logger.warning(f"Failed to fetch {item_type}s: {e}")
@@ -2755,14 +3133,20 @@ async def get_artist_all_albums(artist_id: str, country: str = "US"):
 
     try:
         ytmusic = get_ytmusic(country)
-        artist = await run_in_thread(ytmusic.get_artist, artist_id)
 
-        if not artist:
-            raise HTTPException(status_code=404, detail=ERROR_ARTIST_NOT_FOUND)
+        async def fetch_artist(_key):
+            # 방금 /api/artist 로 받은 데이터가 있으면 재사용
+            artist = cache_get(f"artist:{artist_id}:{country}") or await yt_call(ytmusic.get_artist, artist_id)
+            if not artist:
+                raise HTTPException(status_code=404, detail=ERROR_ARTIST_NOT_FOUND)
+            return artist
 
-        all_albums = await _fetch_full_section_items(ytmusic, artist.get("albums"), "Album")
-        singles = await _fetch_full_section_items(ytmusic, artist.get("singles"), "Single")
-        all_albums.extend(singles)
+        async def fetch_section(browse_id, params):
+            return await yt_call(ytmusic.get_artist_albums, browse_id, params)
+
+        # 앨범/싱글 섹션을 동시에 가져와서 browseId 기준 중복 제거
+        items = await discography.fetch(f"{artist_id}:{country}", fetch_artist, fetch_section)
+        all_albums = _convert_album_list(items, "Album")
 
         # 1시간 캐시
         cache_set(cache_key, all_albums, ttl=3600)
@@ -2838,13 +3222,13 @@ def _save_album_to_db(supabase, album_id: str, album: dict) -> None:
     except Exception as e:
         logger.warning(f"Album metadata update error: {e}")
 
-    # Save tracks
-    for idx, track in enumerate(tracks):
-        if not isinstance(track, dict) or not track.get("videoId"):
-            continue
+    # Save tracks (multi-row upserts)
+    with bulk_writer() as writer:
+        for idx, track in enumerate(tracks):
+            if not isinstance(track, dict) or not track.get("videoId"):
+                continue
 
-        try:
-            track_data = {
+            writer.add("music_tracks", {
                 "video_id": track.get("videoId"),
                 "album_browse_id": album_id,
                 "artist_browse_id": artist_browse_id,
@@ -2853,10 +3237,7 @@ def _save_album_to_db(supabase, album_id: str, album: dict) -> None:
                 "track_number": idx + 1,
                 "thumbnail_url": get_best_thumbnail(track.get("thumbnails") or album.get("thumbnails", [])),
                 "is_explicit": track.get("isExplicit", False)
-            }
-            supabase.table("music_tracks").upsert(track_data, on_conflict="video_id").execute()
-        except Exception as e:
-            logger.warning(f"Track save error: {e}")
+            }, on_conflict="video_id")
 
     logger.info(f"Album tracks saved to DB: {album_id} ({len(tracks)} tracks)")
 
@@ -2882,7 +3263,7 @@ async def get_album(album_id: str, country: str = "US"):
     # ytmusicapi에서 가져오기
     try:
         ytmusic = get_ytmusic(country)
-        album = await run_in_thread(ytmusic.get_album, album_id)
+        album = await yt_call(ytmusic.get_album, album_id)
 
         if album and supabase_client:
             _save_album_to_db(supabase_client, album_id, album)
@@ -2902,9 +3283,57 @@ async def get_album(album_id: str, country: str = "US"):
 # 플레이리스트 정보 API
 # =============================================================================
 
+def _fill_track_thumbnails(tracks: list, playlist_thumbnails: list) -> list:
+    """트랙에 썸네일이 없으면 플레이리스트 썸네일 추가"""
+    if playlist_thumbnails:
+        for track in tracks:
+            if not track.get("thumbnails"):
+                track["thumbnails"] = playlist_thumbnails
+    return tracks
+
+
+def _ndjson(obj: dict) -> bytes:
+    return (json.dumps(obj, ensure_ascii=False, default=str) + "\n").encode()
+
+
+async def _stream_playlist(ytmusic, playlist_id: str):
+    """
+    NDJSON 스트림: continuation 페이지가 파싱될 때마다 바로 전송
+    {"type": "playlist", "playlist": {...}}  (첫 페이지 트랙 포함)
+    {"type": "tracks", "tracks": [...]}      (페이지마다)
+    {"type": "done", "trackCount": N}
+    """
+    pages = iter_playlist_pages(ytmusic, playlist_id)
+    count = 0
+    try:
+        # 페이지마다 업스트림 요청이므로 각 next()를 upstream_guard 경유로
+        playlist = await yt_call(next, pages, None)
+        if playlist is None:
+            yield _ndjson({"type": "error", "error": "Playlist not found"})
+            return
+        thumbnails = playlist.get("thumbnails", [])
+        count = len(_fill_track_thumbnails(playlist.get("tracks", []), thumbnails))
+        yield _ndjson({"type": "playlist", "playlist": playlist})
+
+        while (tracks := await yt_call(next, pages, None)) is not None:
+            count += len(tracks)
+            yield _ndjson({"type": "tracks", "tracks": _fill_track_thumbnails(tracks, thumbnails)})
+    except Exception as e:
+        logger.error(f"Playlist stream error: {e}")
+        yield _ndjson({"type": "error", "error": str(e)})
+        return
+    yield _ndjson({"type": "done", "trackCount": count})
+
+
 @app.get("/api/playlist/{playlist_id}")
-async def get_playlist(playlist_id: str, country: str = "US", limit: int = None):
-    """플레이리스트 상세 정보 (트랙 목록 포함) - limit=None이면 전체 트랙"""
+async def get_playlist(playlist_id: str, country: str = "US", limit: int = None, stream: bool = False):
+    """플레이리스트 상세 정보 (트랙 목록 포함) - limit=None이면 전체 트랙
+
+    stream=true: 전체 트랙을 기다리지 않고 페이지 단위 NDJSON으로 전송 (limit 무시)
+    """
+    if stream:
+        return StreamingResponse(_stream_playlist(get_ytmusic(country), playlist_id), media_type="application/x-ndjson")
+
     cache_key = f"playlist:{playlist_id}:{country}:{limit or 'all'}"
 
     cached = cache_get(cache_key)
@@ -2914,13 +3343,9 @@ async def get_playlist(playlist_id: str, country: str = "US", limit: int = None)
     try:
         ytmusic = get_ytmusic(country)
         # limit=None이면 전체 트랙을 가져옴
-        playlist = await run_in_thread(ytmusic.get_playlist, playlist_id, limit=limit)
+        playlist = await yt_call(ytmusic.get_playlist, playlist_id, limit=limit)
 
-        # 트랙에 썸네일이 없으면 플레이리스트 썸네일 추가
-        playlist_thumbnails = playlist.get("thumbnails", [])
-        for track in playlist.get("tracks", []):
-            if not track.get("thumbnails") and playlist_thumbnails:
-                track["thumbnails"] = playlist_thumbnails
+        _fill_track_thumbnails(playlist.get("tracks", []), playlist.get("thumbnails", []))
 
         return {"source": "api", "playlist": playlist}
     except Exception as e:
@@ -2947,8 +3372,7 @@ def clear_search_cache(secret: str = None):
         result = supabase_client.table("music_search_cache").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute()
 
         # 메모리 캐시도 클리어
-        global memory_cache
-        memory_cache = {}
+        local_cache.clear()
 
         deleted_count = len(result.data) if result.data else 0
         logger.info(f"Cleared {deleted_count} cache entries")
@@ -3627,7 +4051,7 @@ async def _process_artist_for_optimized_summary(
     artist_name = best_artist.get("artist") or best_artist.get("name") or ""
 
     try:
-        artist_detail = await run_in_thread(ytmusic.get_artist, artist_id)
+        artist_detail = await yt_call(ytmusic.get_artist, artist_id)
     except Exception as e:
         logger.error(f"Failed to get artist detail: {e}")
         return artists_data, albums_list, songs_search
@@ -3668,19 +4092,29 @@ async def _process_artist_for_optimized_summary(
 
 
 async def _save_artist_summary_background(artist_id: str, artist_detail: dict, query: str, country: str) -> None:
-    """Background task to save artist summary data."""
-    try:
-        await save_full_artist_data_background(artist_id, artist_detail, country)
-        db_save_search_keyword(query, country, artist_id)
-    except Exception as e:
-        logger.warning(f"Background save error: {e}")
+    """Background task to queue the artist summary data for saving."""
+    # 작업 워커가 캐시된 get_artist 결과를 재사용
+    cache_set(f"artist:{artist_id}:{country}", artist_detail, ttl=21600)
+    await queue_artist_sync(artist_id, country)
+    write_queue.submit(
+        ("search_keyword", query.lower(), country, artist_id), db_save_search_keyword, query, country, artist_id
+    )
 
 
 def _check_summary_cache_and_db(
     q: str, country: str, cache_key: str, background_tasks
 ) -> dict | None:
-    """Check database for existing summary data. Cache is currently disabled."""
+    """Serve the materialized summary (result_json) or build it from the artist tables.
+
+    Summaries built while none of their artists needs a sync are materialized; an
+    artist resync clears them (db_invalidate_search_summaries).
+    """
     del cache_key  # Reserved for future cache implementation
+    summary = db_get_search_summary(q, country)
+    if summary:
+        logger.info(f"Materialized summary hit: {q}")
+        return {**summary, "source": "materialized"}
+
     artist_browse_ids = db_get_artists_by_keyword(q, country)
     if not artist_browse_ids:
         return None
@@ -3693,7 +4127,7 @@ def _check_summary_cache_and_db(
     if not db_result:
         return None
 
-    return {
+    result = {
         "keyword": q,
         "country": country,
         "artists": db_result["artists"],
@@ -3704,6 +4138,9 @@ def _check_summary_cache_and_db(
         "source": "database",
         "updating": db_result["updating"]
     }
+    if not db_result["updating"]:
+        background_tasks.add_task(db_save_search_summary, q, country, artist_browse_ids, result)
+    return result
 
 
 @app.get("/api/search/summary")
@@ -3723,10 +4160,14 @@ async def search_summary(
     country = country or request.headers.get("CF-IPCountry", "US")
     cache_key = f"summary:{country}:{q}"
 
+    # 인기 검색어 집계 (메모리는 즉시, DB는 기존 매핑이 있으면 증가 / 새 매핑은 1로 저장)
+    popular_queries.record(q, country)
+
     # 1단계: DB/Redis 확인
     if not force_refresh:
         cached_result = _check_summary_cache_and_db(q, country, cache_key, background_tasks)
         if cached_result:
+            background_tasks.add_task(db_increment_search_count, q, country)
             return cached_result
 
     # 2단계: ytmusicapi (Optimized)
@@ -3735,8 +4176,8 @@ async def search_summary(
         ytmusic = get_ytmusic(country)
 
         # Parallel Search (인기곡 5개만)
-        future_artists = run_in_thread(ytmusic.search, q, filter="artists", limit=5)
-        future_songs = run_in_thread(ytmusic.search, q, filter="songs", limit=5)
+        future_artists = yt_call(ytmusic.search, q, filter="artists", limit=5)
+        future_songs = yt_call(ytmusic.search, q, filter="songs", limit=5)
         artists_results, _ = await asyncio.gather(
             future_artists, future_songs, return_exceptions=True
         )
@@ -3749,7 +4190,7 @@ async def search_summary(
         artists_search = artists_results or []
         if not artists_search:
             try:
-                general_results = await run_in_thread(ytmusic.search, q, limit=40)
+                general_results = await yt_call(ytmusic.search, q, limit=40)
                 artists_search = [r for r in general_results if r.get("resultType") == "artist"][:5]
             except Exception as e:
                 logger.warning(f"Fallback search failed: {e}")
@@ -3801,7 +4242,7 @@ async def provision_artist_agent(request: Request):
         ytmusic = get_ytmusic(country)
         
         # 1. Search Artist
-        search_results = await run_in_thread(ytmusic.search, artist_name, filter="artists", limit=1)
+        search_results = await yt_call(ytmusic.search, artist_name, filter="artists", limit=1)
         if not search_results:
             raise HTTPException(status_code=404, detail=ERROR_ARTIST_NOT_FOUND)
             
@@ -3810,7 +4251,7 @@ async def provision_artist_agent(request: Request):
         name = artist_info.get("artist") or artist_info.get("name")
         
         # 2. Get Details (Description & Songs)
-        details = await run_in_thread(ytmusic.get_artist, browse_id)
+        details = await yt_call(ytmusic.get_artist, browse_id)
         description = details.get("description", "")
         songs_list = details.get("songs", {}).get("results", [])
         
@@ -4008,7 +4449,7 @@ async def create_virtual_member(request: Request):
             if artist_data.get("songs_playlist_id"):
                 # Fetch top songs for persona generation
                 ytmusic = get_ytmusic("US")
-                playlist_data = await run_in_thread(ytmusic.get_playlist, artist_data["songs_playlist_id"])
+                playlist_data = await yt_call(ytmusic.get_playlist, artist_data["songs_playlist_id"])
                 top_songs = playlist_data.get("tracks", [])[:10]
 
             persona = await run_in_thread(
@@ -4358,78 +4799,83 @@ CHART_COUNTRIES = [
 ]
 
 
-def _is_artist_in_db(browse_id: str) -> bool:
-    """Check if artist already exists in database."""
-    existing = supabase_client.table("music_artists").select(
-        "browse_id"
-    ).eq("browse_id", browse_id).limit(1).execute()
-    return bool(existing.data and len(existing.data) > 0)
-
-
-async def _process_chart_artist(
-    ytmusic, artist: dict, all_artist_ids: set, results: dict,
-    background_tasks, use_background: bool = True
-) -> bool:
-    """Process a single artist from chart data. Returns True if saved."""
-    browse_id = artist.get("browseId")
-    artist_name = artist.get("title", "Unknown")
-
-    if not browse_id:
-        return False
-
-    results["artists_found"] += 1
-
-    if browse_id in all_artist_ids:
-        results["artists_skipped"] += 1
-        return False
-    all_artist_ids.add(browse_id)
+# 차트 동시 조회 국가 수 (요청 속도는 upstream_guard 토큰 버킷이 전체적으로 제한)
+CHART_HARVEST_CONCURRENCY = int(os.getenv("CHART_HARVEST_CONCURRENCY", "8"))
+# in_() 한 번에 넣을 browse_id 수 (URL 길이 제한)
+ARTIST_ID_CHUNK = 200
 
-    if _is_artist_in_db(browse_id):
-        results["artists_skipped"] += 1
-        return False
 
-    try:
-        artist_info = ytmusic.get_artist(browse_id)
-        if not artist_info:
-            return False
+def db_get_existing_artist_ids(browse_ids: list) -> set:
+    """Return the browse_ids already in music_artists (one in_() query per chunk)."""
+    existing = set()
+    for start in range(0, len(browse_ids), ARTIST_ID_CHUNK):
+        chunk = browse_ids[start:start + ARTIST_ID_CHUNK]
+        rows = supabase_client.table("music_artists").select(
+            "browse_id"
+        ).in_("browse_id", chunk).execute()
+        existing.update(row["browse_id"] for row in rows.data or [])
+    return existing
 
-        if use_background and background_tasks:
-            background_tasks.add_task(save_full_artist_data_background, browse_id, artist_info, "US")
-        else:
-            save_full_artist_data_background(browse_id, artist_info, "US")
 
-        results["artists_saved"] += 1
-        await asyncio.sleep(0.3 if not use_background else 0.5)
-        return True
-    except Exception as e:
-        results["errors"].append(f"{artist_name}: {str(e)}")
-        return False
+async def _fetch_chart_artists(country: str, artist_limit: int) -> list:
+    """Top chart artists for one country."""
+    ytmusic = get_ytmusic(country)
+    charts = await yt_call(ytmusic.get_charts, country=country, lane="background")
+    if not charts:
+        return []
+    return charts.get("artists", [])[:artist_limit]
 
 
-async def _process_country_charts(
-    country: str, artist_limit: int, all_artist_ids: set,
-    results: dict, background_tasks, use_background: bool = True
-) -> None:
-    """Process chart data for a single country."""
-    ytmusic = get_ytmusic(country)
-    charts = ytmusic.get_charts(country=country)
+async def _harvest_chart_artists(countries: list, artist_limit: int, results: dict) -> None:
+    """
+    차트 아티스트 수집
+    1) 여러 국가 차트를 동시에 조회 (CHART_HARVEST_CONCURRENCY, upstream_guard 속도 제한)
+    2) 국가 간 중복 browse_id 제거 (처음 발견된 차트 국가로 동기화)
+    3) DB 존재 여부를 일괄 조회
+    4) 없는 아티스트만 작업 큐에 등록 (워커가 병렬로 가져와 저장)
+    """
+    semaphore = asyncio.Semaphore(CHART_HARVEST_CONCURRENCY)
 
-    if not charts or "artists" not in charts:
-        return
+    async def fetch(country: str) -> list:
+        async with semaphore:
+            logger.info(f"[CHART] Processing country: {country}")
+            return await _fetch_chart_artists(country, artist_limit)
 
-    artists = charts.get("artists", [])[:artist_limit]
-    results["countries_processed"] = results.get("countries_processed", 0) + 1
+    charts = await asyncio.gather(*(fetch(country) for country in countries), return_exceptions=True)
 
-    for artist in artists:
-        await _process_chart_artist(
-            ytmusic, artist, all_artist_ids, results, background_tasks, use_background
-        )
+    browse_ids = {}  # browse_id -> 처음 발견된 차트 국가 (dict로 순서 유지)
+    for country, artists in zip(countries, charts):
+        if isinstance(artists, BaseException):
+            logger.error(f"Error processing country {country}: {artists}")
+            results["errors"].append(f"{country}: {str(artists)}")
+            continue
+        results["countries_processed"] += 1
+        for artist in artists:
+            browse_id = artist.get("browseId")
+            if browse_id:
+                browse_ids.setdefault(browse_id, country)
+
+    existing = await run_in_pool("background", db_get_existing_artist_ids, list(browse_ids))
+    missing = [(browse_id, {"country": country}) for browse_id, country in browse_ids.items() if browse_id not in existing]
+    queued = await run_in_pool("background", job_queue.enqueue_many, "sync_artist", missing)
+    job_workers.notify()
+
+    # 고유 아티스트 / DB에 이미 있음 / 새로 등록 / 이미 대기 중이거나 최근 완료된 작업
+    results["artists_found"] = len(browse_ids)
+    results["artists_in_db"] = len(existing)
+    results["artists_queued"] = queued
+    results["artists_pending"] = len(missing) - queued
+
+    logger.info(
+        f"[CHART] {results['countries_processed']} countries, {len(browse_ids)} unique artists, "
+        f"{len(existing)} in DB, {queued} queued, {results['artists_pending']} already pending"
+    )
 
 
 @app.post("/api/cron/collect-chart-artists")
-async def collect_chart_artists(request: Request, background_tasks: BackgroundTasks):
+async def collect_chart_artists(request: Request):
     """
-    YouTube Charts에서 국가별 Top 아티스트를 수집하여 DB에 저장
+    YouTube Charts에서 국가별 Top 아티스트를 수집하여 저장 작업 큐에 등록
 
     60개국 × 약 20명(Top Artists) = 약 1,200명
     중복 제거 후 약 500~800명의 유니크 아티스트
@@ -4446,22 +4892,10 @@ async def collect_chart_artists(request: Request, background_tasks: BackgroundTa
 
         countries = body.get("countries", CHART_COUNTRIES)
         artist_limit = body.get("limit", 50)
-        delay_seconds = body.get("delay", 2)
 
-        results = {"countries_processed": 0, "artists_found": 0,
-                   "artists_saved": 0, "artists_skipped": 0, "errors": []}
-        all_artist_ids = set()
-
-        for country in countries:
-            try:
-                logger.info(f"[CHART] Processing country: {country}")
-                await _process_country_charts(
-                    country, artist_limit, all_artist_ids, results, background_tasks, True
-                )
-                await asyncio.sleep(delay_seconds)
-            except Exception as e:
-                logger.error(f"Error processing country {country}: {e}")
-                results["errors"].append(f"{country}: {str(e)}")
+        results = {"countries_processed": 0, "artists_found": 0, "artists_in_db": 0,
+                   "artists_queued": 0, "artists_pending": 0, "errors": []}
+        await _harvest_chart_artists(countries, artist_limit, results)
 
         return {"status": "success", "results": results}
 
@@ -4471,7 +4905,7 @@ async def collect_chart_artists(request: Request, background_tasks: BackgroundTa
 
 
 @app.post("/api/cron/collect-chart-artists-batch")
-async def collect_chart_artists_batch(request: Request, background_tasks: BackgroundTasks):
+async def collect_chart_artists_batch(request: Request):
     """
     국가를 배치로 나눠서 수집 (Rate Limiting 방지)
     Vercel Cron에서 6시간마다 호출, 4일 = 1 사이클
@@ -4497,18 +4931,10 @@ async def collect_chart_artists_batch(request: Request, background_tasks: Backgr
         countries_to_process = CHART_COUNTRIES[start_idx:end_idx]
         logger.info(f"[BATCH {batch}] Processing countries: {countries_to_process}")
 
-        results = {"batch": batch, "countries": countries_to_process,
-                   "artists_found": 0, "artists_saved": 0, "artists_skipped": 0, "errors": []}
-        all_artist_ids = set()
-
-        for country in countries_to_process:
-            try:
-                await _process_country_charts(
-                    country, 30, all_artist_ids, results, background_tasks, False
-                )
-                await asyncio.sleep(2)
-            except Exception as e:
-                results["errors"].append(f"{country}: {str(e)}")
+        results = {"batch": batch, "countries": countries_to_process, "countries_processed": 0,
+                   "artists_found": 0, "artists_in_db": 0, "artists_queued": 0, "artists_pending": 0,
+                   "errors": []}
+        await _harvest_chart_artists(countries_to_process, 30, results)
 
         next_batch = batch + 1 if end_idx < len(CHART_COUNTRIES) else 0
         return {"status": "success", "results": results, "next_batch": next_batch}
@@ -4565,30 +4991,29 @@ def _fetch_active_tier_artists(supabase, seven_days_ago: str, thirty_days_ago: s
     return artists
 
 
-async def _update_single_artist(artist: dict, results: dict) -> None:
-    """Update a single artist and track results."""
-    browse_id = artist["browse_id"]
-    artist_name = artist["name"]
-    tier = artist.get("tier", "UNKNOWN")
-    country_code = LANG_TO_COUNTRY.get(artist.get("primary_language", ""), "US")
+async def _sync_artist_job(browse_id: str, payload: dict) -> None:
+    """Job handler: fetch the artist (or reuse the cached get_artist result) and save its full data."""
+    country = payload.get("country") or "US"
+    artist_info = cache_get(f"artist:{browse_id}:{country}")
+    if not artist_info:
+        ytmusic = get_ytmusic(country)
+        artist_info = await yt_call(ytmusic.get_artist, browse_id, lane="background")
+    if not artist_info:
+        logger.info(f"[JOB] Artist not found: {browse_id}")
+        return
+    await run_in_pool("jobs", save_full_artist_data_background, browse_id, artist_info, country)
 
-    try:
-        ytmusic = get_ytmusic(country_code)
-        artist_info = ytmusic.get_artist(browse_id)
 
-        if artist_info:
-            save_full_artist_data_background(browse_id, artist_info, country_code)
-            if tier == "HOT":
-                results["hot_updated"] += 1
-            else:
-                results["active_updated"] += 1
-            await asyncio.sleep(0.3)
-        else:
-            results["artists_skipped"] += 1
-    except Exception as e:
-        results["errors"].append(f"{artist_name}: {str(e)}")
+# 크론 작업 워커 (동시 JOB_WORKERS개, 업스트림 호출은 upstream_guard background lane)
+job_workers = JobWorkerPool(job_queue, {"sync_artist": _sync_artist_job}, concurrency=JOB_WORKERS)
+
 
-    await asyncio.sleep(0.5)
+async def queue_artist_sync(browse_id: str, country: str = "US") -> bool:
+    """아티스트 전체 동기화(앨범/트랙 저장)를 작업 큐에 등록"""
+    queued = await run_in_pool("background", job_queue.enqueue, "sync_artist", browse_id, {"country": country})
+    if queued:
+        job_workers.notify()
+    return queued
 
 
 @app.post("/api/cron/update-existing-artists")
@@ -4605,7 +5030,7 @@ async def update_existing_artists(request: Request):
     if not supabase_client:
         raise HTTPException(status_code=500, detail=ERROR_DB_NOT_AVAILABLE)
 
-    results = {"hot_updated": 0, "active_updated": 0, "artists_skipped": 0, "errors": []}
+    results = {"hot_queued": 0, "active_queued": 0, "artists_skipped": 0, "errors": []}
 
     try:
         batch_size = body.get("limit", 200)
@@ -4623,13 +5048,21 @@ async def update_existing_artists(request: Request):
             )
             artists_to_update.extend(active_artists)
 
+        jobs = {"hot_queued": [], "active_queued": []}
         for artist in artists_to_update:
-            await _update_single_artist(artist, results)
-
-        total_updated = results["hot_updated"] + results["active_updated"]
+            country_code = LANG_TO_COUNTRY.get(artist.get("primary_language", ""), "US")
+            counter = "hot_queued" if artist.get("tier") == "HOT" else "active_queued"
+            jobs[counter].append((artist["browse_id"], {"country": country_code}))
+        # 티어별로 한 트랜잭션에 등록 (이벤트 루프 밖에서)
+        for counter, tier_jobs in jobs.items():
+            results[counter] = await run_in_pool("background", job_queue.enqueue_many, "sync_artist", tier_jobs)
+            results["artists_skipped"] += len(tier_jobs) - results[counter]
+        job_workers.notify()
+
+        total_queued = results["hot_queued"] + results["active_queued"]
         return {
             "status": "success", "results": results,
-            "message": f"Updated {total_updated} artists (HOT: {results['hot_updated']}, ACTIVE: {results['active_updated']})"
+            "message": f"Queued {total_queued} artists (HOT: {results['hot_queued']}, ACTIVE: {results['active_queued']})"
         }
 
     except Exception as e:
@@ -4758,12 +5191,12 @@ async def create_virtual_members_cron(request: Request):
 # =============================================================================
 
 
-def _extract_browse_id_if_valid(related: dict, existing_ids: set, new_artist_ids: list) -> str | None:
+def _extract_browse_id_if_valid(related: dict, existing_ids: set, new_artists: dict) -> str | None:
     """Extract browse_id from related artist if valid and not a duplicate."""
     if not isinstance(related, dict):
         return None
     browse_id = related.get("browseId")
-    if not browse_id or browse_id in existing_ids or browse_id in new_artist_ids:
+    if not browse_id or browse_id in existing_ids or browse_id in new_artists:
         return None
     return browse_id
 
@@ -4771,54 +5204,30 @@ def _extract_browse_id_if_valid(related: dict, existing_ids: set, new_artist_ids
 def _find_new_related_artists(
     artists_with_related: list, existing_ids: set, related_limit: int, max_discovery: int = 50
 ):
-    """Helper to find new related artists from existing artist data."""
-    new_artist_ids = []
+    """Helper to find new related artists from existing artist data.
+
+    Returns ({browse_id: country}, skipped); a new artist is synced in the country of
+    the artist it was found on (LANG_TO_COUNTRY of its primary_language).
+    """
+    new_artists = {}
     skipped_count = 0
 
     for artist in artists_with_related:
         related_list = artist.get("related_artists_json") or []
         if not isinstance(related_list, list):
             continue
+        country = LANG_TO_COUNTRY.get(artist.get("primary_language") or "", "US")
 
         for related in related_list[:related_limit]:
-            browse_id = _extract_browse_id_if_valid(related, existing_ids, new_artist_ids)
+            browse_id = _extract_browse_id_if_valid(related, existing_ids, new_artists)
             if browse_id:
-                new_artist_ids.append(browse_id)
-                if len(new_artist_ids) >= max_discovery:
-                    return new_artist_ids, skipped_count
+                new_artists[browse_id] = country
+                if len(new_artists) >= max_discovery:
+                    return new_artists, skipped_count
             else:
                 skipped_count += 1
 
-    return new_artist_ids, skipped_count
-
-
-async def _register_discovered_artists(new_artist_ids: list, country: str = "US") -> dict:
-    """Helper to register newly discovered artists."""
-    results = {"registered": 0, "skipped": 0, "errors": []}
-    
-    for browse_id in new_artist_ids:
-        try:
-            # Rate limiting
-            await asyncio.sleep(1)
-
-            ytmusic = get_ytmusic(country)
-            # Use run_in_thread for blocking calls
-            artist_info = await run_in_thread(ytmusic.get_artist, browse_id)
-
-            if artist_info:
-                # Save data (blocking DB call handled in thread if possible, here using direct call as wrapper is sync)
-                save_full_artist_data_background(browse_id, artist_info, country)
-                results["registered"] += 1
-                artist_name = artist_info.get("name", "Unknown")
-                logger.info(f"[EXPAND] Registered: {artist_name}")
-            else:
-                results["skipped"] += 1
-
-        except Exception as e:
-            results["errors"].append(f"{browse_id}: {str(e)}")
-            logger.error(f"[EXPAND] Error registering {browse_id}: {e}")
-            
-    return results
+    return new_artists, skipped_count
 
 
 @app.post("/api/cron/expand-related-artists")
@@ -4843,7 +5252,7 @@ async def expand_related_artists(request: Request):
 
     results = {
         "artists_discovered": 0,
-        "artists_registered": 0,
+        "artists_queued": 0,
         "artists_skipped": 0,
         "errors": []
     }
@@ -4873,25 +5282,26 @@ async def expand_related_artists(request: Request):
         logger.info(f"[EXPAND] Processing {len(artists_with_related.data)} artists, {len(existing_ids)} already exist")
 
         # 각 아티스트의 related 수집
-        new_artist_ids, skipped = _find_new_related_artists(
+        new_artists, skipped = _find_new_related_artists(
             artists_with_related.data, existing_ids, related_limit
         )
-        results["artists_discovered"] = len(new_artist_ids)
+        results["artists_discovered"] = len(new_artists)
         results["artists_skipped"] = skipped
 
-        logger.info(f"[EXPAND] Discovered {len(new_artist_ids)} new artists to register")
+        logger.info(f"[EXPAND] Discovered {len(new_artists)} new artists to register")
 
-        # 새 아티스트 등록
-        reg_results = await _register_discovered_artists(new_artist_ids)
-        
-        results["artists_registered"] = reg_results["registered"]
-        results["artists_skipped"] += reg_results["skipped"]
-        results["errors"] = reg_results["errors"]
+        # 새 아티스트 등록 작업 큐에 추가 (워커가 순차 처리, 실패 시 재시도)
+        jobs = [(browse_id, {"country": country}) for browse_id, country in new_artists.items()]
+        queued = await run_in_pool("background", job_queue.enqueue_many, "sync_artist", jobs)
+        job_workers.notify()
+
+        results["artists_queued"] = queued
+        results["artists_skipped"] += len(new_artists) - queued
 
         return {
             "status": "success",
             "results": results,
-            "message": f"Discovered {results['artists_discovered']}, Registered {results['artists_registered']}"
+            "message": f"Discovered {results['artists_discovered']}, Queued {results['artists_queued']}"
         }
 
     except Exception as e:
@@ -5442,20 +5852,17 @@ async def check_artist_new_releases(request: Request):
         ytmusic = get_ytmusic(country)
 
         # Get current releases from YouTube Music
-        artist_info = await run_in_thread(ytmusic.get_artist, artist_browse_id)
+        artist_info = await yt_call(ytmusic.get_artist, artist_browse_id)
         if not artist_info:
             raise HTTPException(status_code=404, detail=ERROR_ARTIST_NOT_FOUND)
 
-        # Extract albums and singles using helper function
-        albums_data = await _fetch_full_section_items(
-            ytmusic, artist_info.get("albums"), "Album"
+        # Extract albums and singles concurrently using helper function
+        albums_data, singles_data = await asyncio.gather(
+            _fetch_full_section_items(ytmusic, artist_info.get("albums"), "Album"),
+            _fetch_full_section_items(ytmusic, artist_info.get("singles"), "Single"),
         )
         # Map browseId to id for compatibility
         current_albums = [{**item, "id": item["browseId"]} for item in albums_data]
-
-        singles_data = await _fetch_full_section_items(
-            ytmusic, artist_info.get("singles"), "Single"
-        )
         current_singles = [{**item, "id": item["browseId"]} for item in singles_data]
 
         # Get stored release data
@@ -5489,7 +5896,7 @@ async def check_artist_new_releases(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def _check_single_artist_releases(artist: dict) -> bool:
+async def _check_single_artist_releases(artist: dict) -> bool:
     """Check releases for a single artist. Returns True if successful."""
     browse_id = artist.get("browse_id")
     if not browse_id:
@@ -5497,7 +5904,7 @@ def _check_single_artist_releases(artist: dict) -> bool:
 
     try:
         ytmusic = get_ytmusic("US")
-        artist_info = ytmusic.get_artist(browse_id)
+        artist_info = await yt_call(ytmusic.get_artist, browse_id, lane="background")
         if artist_info:
             logger.info(f"Checked releases for {artist.get('name')}")
             return True
@@ -5518,7 +5925,7 @@ async def _process_all_artist_releases(supabase):
             return
 
         for artist in artists_result.data:
-            _check_single_artist_releases(artist)
+            await _check_single_artist_releases(artist)
             await asyncio.sleep(0.5)
 
     except Exception as e:
@@ -5596,7 +6003,7 @@ async def get_explore_data():
     """
     try:
         ytmusic = get_ytmusic("US")
-        explore = await run_in_thread(ytmusic.get_explore)
+        explore = await yt_call(ytmusic.get_explore)
         return {"success": True, "data": explore}
     except Exception as e:
         logger.error(f"Explore fetch error: {e}")
@@ -5611,7 +6018,7 @@ async def get_song_data(video_id: str):
     """
     try:
         ytmusic = get_ytmusic("US")
-        song = await run_in_thread(ytmusic.get_song, video_id)
+        song = await yt_call(ytmusic.get_song, video_id)
         return {"success": True, "data": song}
     except Exception as e:
         logger.error(f"Song fetch error: {e}")
@@ -5650,7 +6057,7 @@ async def get_lyrics_data(browse_id: str):
     """
     try:
         ytmusic = get_ytmusic("US")
-        lyrics = await run_in_thread(ytmusic.get_lyrics, browse_id)
+        lyrics = await yt_call(ytmusic.get_lyrics, browse_id)
         return {"success": True, "data": lyrics}
     except Exception as e:
         logger.error(f"Lyrics fetch error: {e}")
@@ -5665,7 +6072,7 @@ async def get_related_songs(browse_id: str):
     """
     try:
         ytmusic = get_ytmusic("US")
-        related = await run_in_thread(ytmusic.get_song_related, browse_id)
+        related = await yt_call(ytmusic.get_song_related, browse_id)
         return {"success": True, "data": related}
     except Exception as e:
         logger.error(f"Related songs fetch error: {e}")
@@ -5680,7 +6087,7 @@ async def get_podcast_data(playlist_id: str):
     """
     try:
         ytmusic = get_ytmusic("US")
-        podcast = await run_in_thread(ytmusic.get_podcast, playlist_id)
+        podcast = await yt_call(ytmusic.get_podcast, playlist_id)
         return {"success": True, "data": podcast}
     except Exception as e:
         logger.error(f"Podcast fetch error: {e}")
@@ -5695,7 +6102,7 @@ async def get_episode_data(video_id: str):
     """
     try:
         ytmusic = get_ytmusic("US")
-        episode = await run_in_thread(ytmusic.get_episode, video_id)
+        episode = await yt_call(ytmusic.get_episode, video_id)
         return {"success": True, "data": episode}
     except Exception as e:
         logger.error(f"Episode fetch error: {e}")
@@ -5710,7 +6117,7 @@ async def get_channel_data(channel_id: str):
     """
     try:
         ytmusic = get_ytmusic("US")
-        channel = await run_in_thread(ytmusic.get_channel, channel_id)
+        channel = await yt_call(ytmusic.get_channel, channel_id)
         return {"success": True, "data": channel}
     except Exception as e:
         logger.error(f"Channel fetch error: {e}")
@@ -5725,7 +6132,7 @@ async def get_episodes_playlist_data():
     """
     try:
         ytmusic = get_ytmusic("US")
-        episodes = await run_in_thread(ytmusic.get_episodes_playlist)
+        episodes = await yt_call(ytmusic.get_episodes_playlist)
         return {"success": True, "data": episodes}
     except Exception as e:
         logger.error(f"Episodes playlist fetch error: {e}")
@@ -0,0 +1,165 @@
+# VibeStation Backend - Page-by-page access to ytmusicapi continuation results
+#
+# ytmusicapi follows continuations internally until `limit` is reached. The helpers
+# here fetch one page at a time instead: *_first_page() and next_page() return
+# (items, state), where state is a small JSON-able dict describing the next request
+# (None on the last page). cursors.py signs these states for clients.
+import copy
+import json
+import logging
+
+from ytmusicapi.continuations import (
+    CONTINUATION_ITEMS,
+    get_continuation_string,
+    get_continuation_token,
+)
+from ytmusicapi.navigation import (
+    CONTENT,
+    GRID,
+    MUSIC_SHELF,
+    SECTION,
+    SECTION_LIST,
+    SECTION_LIST_ITEM,
+    SINGLE_COLUMN_TAB,
+    TITLE_TEXT,
+    TWO_COLUMN_RENDERER,
+    nav,
+)
+from ytmusicapi.parsers.library import parse_albums
+from ytmusicapi.parsers.playlists import parse_playlist_items
+from ytmusicapi.parsers.search import get_search_params, parse_search_results
+
+logger = logging.getLogger(__name__)
+
+NEXT_CONTINUATION = ["continuations", 0, "nextContinuationData", "continuation"]
+
+
+def _recording_client(ytmusic):
+    """Shallow copy of ytmusic whose _send_request also records each response"""
+    client = copy.copy(ytmusic)
+    responses = []
+    # Bound to the original (or its own override, e.g. the async transport's replay)
+    send = ytmusic._send_request
+
+    def send_request(endpoint, body, additionalParams=""):
+        response = send(endpoint, body, additionalParams)
+        responses.append(response)
+        return response
+
+    client._send_request = send_request
+    return client, responses
+
+
+def playlist_first_page(ytmusic, playlist_id: str) -> tuple[dict, dict | None]:
+    """Playlist dict with its first page of tracks.
+
+    Audio playlists (OLAK) or responses this parser does not recognise fall back to
+    one get_playlist(limit=None) with every track and no further pages.
+    """
+    client, responses = _recording_client(ytmusic)
+    # limit=0: header + first page only, no continuation requests
+    playlist = client.get_playlist(playlist_id, limit=0)
+
+    shelf = nav(
+        responses[0],
+        [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION, *CONTENT, "musicPlaylistShelfRenderer"],
+        True,
+    )
+    if not shelf or "contents" not in shelf:
+        logger.info(f"Playlist {playlist_id}: no paged shelf, fetching all tracks at once")
+        return ytmusic.get_playlist(playlist_id, limit=None), None
+
+    token = get_continuation_token(shelf["contents"])
+    state = {"k": "playlist", "c": token, "x": "collaborators" in playlist} if token else None
+    return playlist, state
+
+
+def artist_section_first_page(
+    ytmusic, browse_id: str, params: str, then: dict | None = None
+) -> tuple[list, dict | None]:
+    """First page of an artist albums/singles section; `then` is the state to continue with after it"""
+    client, responses = _recording_client(ytmusic)
+    items = client.get_artist_albums(browse_id, params, limit=0)
+
+    grid = nav(responses[0], [*SINGLE_COLUMN_TAB, *SECTION_LIST_ITEM, *GRID], True) or {}
+    ctoken = nav(grid, NEXT_CONTINUATION, True)
+    if ctoken:
+        return items, {"k": "grid", "b": {"browseId": browse_id, "params": params}, "c": ctoken, "then": then}
+    return items, then
+
+
+def search_first_page(ytmusic, query: str, filter: str | None = None) -> tuple[list, dict | None]:
+    """First page of search results; only filtered searches have further pages"""
+    client, responses = _recording_client(ytmusic)
+    items = client.search(query, filter=filter, limit=0)
+    if not filter or not responses or "contents" not in responses[0]:
+        return items, None
+
+    contents = responses[0]["contents"]
+    if "tabbedSearchResultsRenderer" in contents:
+        contents = contents["tabbedSearchResultsRenderer"]["tabs"][0]["tabRenderer"]["content"]
+    for section in nav(contents, SECTION_LIST, True) or []:
+        ctoken = nav(section, [*MUSIC_SHELF, *NEXT_CONTINUATION], True)
+        if ctoken:
+            body = {"query": query}
+            params = get_search_params(filter, None, False)
+            if params:
+                body["params"] = params
+            result_type = ("playlists" if "playlists" in filter else filter)[:-1].lower()
+            category = nav(section, [*MUSIC_SHELF, *TITLE_TEXT], True)
+            return items, {"k": "search", "b": body, "c": ctoken, "x": [result_type, category]}
+    return items, None
+
+
+def next_page(ytmusic, state: dict) -> tuple[list, dict | None]:
+    """Fetch the page described by state (one upstream request)"""
+    kind = state["k"]
+
+    if kind == "playlist":
+        response = ytmusic._send_request("browse", {"continuation": state["c"]})
+        items = nav(response, CONTINUATION_ITEMS, True)
+        tracks = parse_playlist_items(items, is_collaborative=state["x"]) if items else []
+        token = get_continuation_token(items) if tracks else None
+        return tracks, ({**state, "c": token} if token else None)
+
+    if kind == "section":
+        return artist_section_first_page(ytmusic, state["b"]["browseId"], state["b"]["params"], state.get("then"))
+
+    if kind == "grid":
+        response = ytmusic._send_request("browse", state["b"], get_continuation_string(state["c"]))
+        results = nav(response, ["continuationContents", "gridContinuation"], True) or {}
+        items = parse_albums(results.get("items", []))
+        ctoken = nav(results, NEXT_CONTINUATION, True) if items else None
+        return items, ({**state, "c": ctoken} if ctoken else state.get("then"))
+
+    if kind == "search":
+        response = ytmusic._send_request("search", state["b"], get_continuation_string(state["c"]))
+        results = nav(response, ["continuationContents", "musicShelfContinuation"], True) or {}
+        result_type, category = state["x"]
+        items = parse_search_results(results.get("contents", []), result_type, category)
+        ctoken = nav(results, NEXT_CONTINUATION, True) if items else None
+        return items, ({**state, "c": ctoken} if ctoken else None)
+
+    raise ValueError(f"Unknown page kind: {kind}")
+
+
+def load_page(ytmusic, page_key: str) -> tuple[list, dict | None]:
+    """next_page() for a state serialized as JSON (hashable, usable as a cache key)"""
+    return next_page(ytmusic, json.loads(page_key))
+
+
+def page_key(state: dict) -> str:
+    return json.dumps(state, sort_keys=True, separators=(",", ":"))
+
+
+def iter_playlist_pages(ytmusic, playlist_id: str):
+    """Yield the playlist dict (with the first page of tracks) then lists of further tracks.
+
+    Blocking: each next() may issue one upstream request.
+    """
+    playlist, state = playlist_first_page(ytmusic, playlist_id)
+    yield playlist
+    while state:
+        tracks, state = next_page(ytmusic, state)
+        if tracks:
+            yield tracks
@@ -0,0 +1,144 @@
+# VibeStation Backend - Popular search completions from search_keywords counts
+#
+# For every country (and "*" for all countries together) keeps, per query prefix,
+# the k most searched keywords starting with it, so /api/search/suggestions can
+# answer common prefixes without asking YouTube. Tables are rebuilt from the DB
+# periodically and bumped locally whenever a search is counted in between.
+import heapq
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from search_normalize import fold
+
+logger = logging.getLogger(__name__)
+
+ALL_COUNTRIES = "*"
+
+# Page size when loading search_keywords
+LOAD_PAGE_SIZE = 1000
+
+
+class PopularQueries:
+    """Top-k completions per (country, folded prefix).
+
+    Prefixes longer than max_prefix share the max_prefix list and are filtered by
+    startswith, so memory stays bounded for long keywords.
+    """
+
+    def __init__(self, k: int = 10, max_prefix: int = 12, min_count: int = 2):
+        self.k = k
+        self.max_prefix = max_prefix
+        # One-off queries are not suggested
+        self.min_count = min_count
+        # country -> folded keyword -> [count, display text]
+        self._counts: dict[str, dict[str, list]] = {}
+        # country -> prefix -> [(count, folded keyword)] most searched first
+        self._top: dict[str, dict[str, list]] = {}
+        self._lock = threading.Lock()
+        self.loaded_at = 0.0
+        self.build_seconds = 0.0
+
+    def _prefixes(self, folded: str):
+        return (folded[:n] for n in range(1, min(len(folded), self.max_prefix) + 1))
+
+    def _build(self, counts: dict[str, list]) -> dict[str, list]:
+        heaps: dict[str, list] = defaultdict(list)
+        for folded, (count, _) in counts.items():
+            if count < self.min_count:
+                continue
+            for prefix in self._prefixes(folded):
+                heap = heaps[prefix]
+                if len(heap) < self.k:
+                    heapq.heappush(heap, (count, folded))
+                elif (count, folded) > heap[0]:
+                    heapq.heapreplace(heap, (count, folded))
+        return {prefix: sorted(heap, reverse=True) for prefix, heap in heaps.items()}
+
+    def load(self, supabase) -> None:
+        """Rebuild every table from search_keywords (blocking; run in a thread)"""
+        started = time.monotonic()
+        counts: dict[str, dict[str, list]] = defaultdict(dict)
+        start = 0
+        while True:
+            rows = supabase.table("search_keywords").select(
+                "keyword, country, search_count"
+            ).order("keyword_normalized").order("country").order("artist_browse_id").range(
+                start, start + LOAD_PAGE_SIZE - 1
+            ).execute().data or []
+            for row in rows:
+                keyword = (row.get("keyword") or "").strip()
+                folded = fold(keyword)
+                if not folded:
+                    continue
+                count = row.get("search_count") or 0
+                # One row per (keyword, country, artist): the keyword's count is the largest
+                entry = counts[(row.get("country") or "").upper()].setdefault(folded, [0, keyword])
+                if count > entry[0]:
+                    entry[0] = count
+            if len(rows) < LOAD_PAGE_SIZE:
+                break
+            start += LOAD_PAGE_SIZE
+
+        for table in list(counts.values()):
+            for folded, (count, keyword) in table.items():
+                counts[ALL_COUNTRIES].setdefault(folded, [0, keyword])[0] += count
+
+        top = {country: self._build(table) for country, table in counts.items()}
+        with self._lock:
+            self._counts, self._top = dict(counts), top
+        self.loaded_at = time.time()
+        self.build_seconds = round(time.monotonic() - started, 2)
+        logger.info(f"Popular queries loaded: {len(counts.get(ALL_COUNTRIES, {}))} keywords in {self.build_seconds}s")
+
+    def record(self, keyword: str, country: str | None) -> None:
+        """Count one search until the next load() picks it up from the DB"""
+        folded = fold(keyword)
+        if not folded:
+            return
+        with self._lock:
+            for table in (country.upper() if country else None, ALL_COUNTRIES):
+                if table is None:
+                    continue
+                entry = self._counts.setdefault(table, {}).setdefault(folded, [0, keyword.strip()])
+                entry[0] += 1
+                if entry[0] >= self.min_count:
+                    self._bump(self._top.setdefault(table, {}), folded, entry[0])
+
+    def _bump(self, top: dict[str, list], folded: str, count: int) -> None:
+        for prefix in self._prefixes(folded):
+            ranked = [item for item in top.get(prefix, []) if item[1] != folded]
+            ranked.append((count, folded))
+            ranked.sort(reverse=True)
+            top[prefix] = ranked[:self.k]
+
+    def top(self, q: str, country: str | None = None, limit: int = 10) -> list[str]:
+        """Most searched keywords starting with q: the country's first, then other countries'"""
+        folded = fold(q)
+        if not folded:
+            return []
+        prefix = folded[:self.max_prefix]
+        results, seen = [], set()
+        with self._lock:
+            for table in (country.upper() if country else None, ALL_COUNTRIES):
+                counts = self._counts.get(table)
+                if not counts:
+                    continue
+                for _, keyword in self._top.get(table, {}).get(prefix, []):
+                    if keyword in seen or not keyword.startswith(folded):
+                        continue
+                    seen.add(keyword)
+                    results.append(counts[keyword][1])
+                    if len(results) >= limit:
+                        return results
+        return results
+
+    def stats(self) -> dict:
+        return {
+            "keywords": len(self._counts.get(ALL_COUNTRIES, {})),
+            "countries": max(len(self._counts) - 1, 0),
+            "prefixes": sum(len(top) for top in self._top.values()),
+            "loaded_at": self.loaded_at,
+            "build_seconds": self.build_seconds,
+        }
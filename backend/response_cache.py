@@ -0,0 +1,177 @@
+# VibeStation Backend - In-process response cache
+import json
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+# Per-endpoint TTLs in seconds (same values the old cache_set calls used)
+CACHE_TTLS = {
+    "search": 1800,
+    "search_suggestions": 1800,
+    "home": 1800,
+    "explore": 3600,
+    "charts": 3600,
+    "moods": 21600,
+    "mood_playlists": 3600,
+    "artist": 21600,
+    "artist_albums": 3600,
+    "album": 21600,
+    "playlist": 3600,
+    "song": 3600,
+    "watch": 1800,
+    "lyrics": 21600,
+    "related": 3600,
+    "podcast": 3600,
+    "episode": 3600,
+    "channel": 3600,
+    "episodes_playlist": 3600,
+}
+
+DEFAULT_TTL = 3600
+
+# HTTP caching per endpoint: (browser max-age, stale-while-revalidate) in seconds.
+# s-maxage is the endpoint TTL above, so CDN edges expire together with our cache.
+HTTP_CACHE_POLICIES = {
+    "home": (60, 86400),
+    "explore": (300, 86400),
+    "charts": (300, 86400),
+    "moods": (3600, 86400),
+    "mood_playlists": (300, 3600),
+    "search": (60, 600),
+    "search_suggestions": (300, 3600),
+    "watch": (60, 600),
+}
+
+DEFAULT_HTTP_CACHE_POLICY = (300, 3600)
+
+
+def cache_control(endpoint: str, shared: bool = True) -> str:
+    """Cache-Control header for a successful response of endpoint.
+
+    shared=False for responses that depend on request headers the CDN does not
+    key on (country detected from geo headers): browser caching only.
+    """
+    max_age, swr = HTTP_CACHE_POLICIES.get(endpoint, DEFAULT_HTTP_CACHE_POLICY)
+    ttl = CACHE_TTLS.get(endpoint, DEFAULT_TTL)
+    max_age = min(max_age, ttl)
+    if not shared:
+        return f"private, max-age={max_age}"
+    return f"public, max-age={max_age}, s-maxage={ttl}, stale-while-revalidate={swr}"
+
+
+def normalize_query(q: str | None) -> str:
+    """Case-fold and collapse whitespace so 'BTS ' and 'bts' share an entry"""
+    if not q:
+        return ""
+    return " ".join(unicodedata.normalize("NFKC", q).casefold().split())
+
+
+def make_key(endpoint: str, *parts, country: str | None = None, query: str | None = None, **params) -> str:
+    """Build a normalized cache key: endpoint:COUNTRY:query:parts:k=v"""
+    segments = [endpoint, (country or "").upper(), normalize_query(query)]
+    segments.extend("" if p is None else str(p) for p in parts)
+    segments.extend(f"{k}={params[k]}" for k in sorted(params) if params[k] is not None)
+    return ":".join(segments)
+
+
+def estimate_size(value) -> int:
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+class TTLCache:
+    """Thread-safe TTL cache with LRU eviction bounded by entry count and bytes.
+
+    Expired entries are kept for stale_grace seconds so get_stale() can still serve
+    them while the upstream is unavailable.
+    """
+
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 256 * 1024 * 1024, stale_grace: int = 86400):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_grace = stale_grace
+        self._data: OrderedDict[str, tuple[float, int, object]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale_hits = 0
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, size, value = entry
+            now = time.monotonic()
+            if expires_at <= now:
+                if expires_at + self.stale_grace <= now:
+                    del self._data[key]
+                    self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def get_stale(self, key: str):
+        """Return the entry even if expired (within stale_grace); None if absent"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] + self.stale_grace <= time.monotonic():
+                return None
+            self.stale_hits += 1
+            return entry[2]
+
+    def set(self, key: str, value, ttl: int = DEFAULT_TTL, size: int | None = None) -> None:
+        if size is None:
+            size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (time.monotonic() + ttl, size, value)
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._data.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is None:
+                return False
+            self._bytes -= entry[1]
+            return True
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._data)
+            self._data.clear()
+            self._bytes = 0
+            return count
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "stale_hits": self.stale_hits,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
@@ -0,0 +1,328 @@
+# VibeStation Backend - In-process search index over the music catalog
+#
+# Replaces `ilike '%q%'` scans on music_artists / music_tracks / music_albums for
+# suggestions and smart search:
+#   - prefix lookups: per-kind sorted term arrays + bisect, one for whole names and
+#     one for the words inside them
+#   - infix lookups: trigram postings, candidates must contain every query trigram
+#   - typo-tolerant lookups: candidates sharing enough trigrams, checked by edit distance
+# Each document is indexed under its name and the variants (aliases, romanizations)
+# given by the variants callable. Rows are loaded once at startup and kept current by
+# the db_save_* functions.
+import bisect
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+
+from response_cache import normalize_query
+from search_normalize import max_typos, prefix_distance
+
+logger = logging.getLogger(__name__)
+
+# Document kinds, in result order for equally good matches
+KINDS = ("artist", "album", "song")
+
+# Page size when loading catalog tables
+LOAD_PAGE_SIZE = 1000
+
+# Documents (most shared trigrams first) checked by edit distance per lookup
+FUZZY_CANDIDATES = 200
+
+# Trigrams in more documents than this are too common to pick fuzzy candidates with
+FUZZY_MAX_POSTINGS = 10000
+
+
+def trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SortedTerms:
+    """(term, key) pairs kept sorted for prefix range scans.
+
+    During bulk loading pairs are appended and sorted once in finish_bulk().
+    """
+
+    def __init__(self):
+        self._entries: list[tuple[str, tuple]] = []
+        self._bulk = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def start_bulk(self) -> None:
+        self._bulk = True
+
+    def finish_bulk(self) -> None:
+        self._entries = sorted(set(self._entries))
+        self._bulk = False
+
+    def add(self, term: str, key: tuple) -> None:
+        if self._bulk:
+            self._entries.append((term, key))
+        else:
+            bisect.insort(self._entries, (term, key))
+
+    def remove(self, term: str, key: tuple) -> None:
+        if self._bulk:
+            self._entries = [entry for entry in self._entries if entry[1] != key]
+            return
+        i = bisect.bisect_left(self._entries, (term, key))
+        if i < len(self._entries) and self._entries[i] == (term, key):
+            del self._entries[i]
+
+    def prefixed(self, prefix: str, limit: int, seen: set) -> list[tuple]:
+        """Up to limit keys (not in seen) having a term that starts with prefix"""
+        keys = []
+        i = bisect.bisect_left(self._entries, (prefix,))
+        while i < len(self._entries) and len(keys) < limit:
+            term, key = self._entries[i]
+            if not term.startswith(prefix):
+                break
+            if key not in seen:
+                seen.add(key)
+                keys.append(key)
+            i += 1
+        return keys
+
+
+class CatalogIndex:
+    """Catalog documents keyed by (kind, id) with prefix and trigram lookups.
+
+    A document is the response-ready dict for its kind; only its name/title (and the
+    variants(name) spellings) is indexed, each passed through normalize.
+    """
+
+    def __init__(self, normalize=normalize_query, variants=None):
+        self.normalize = normalize
+        self.variants = variants
+        self._docs: dict[tuple, dict] = {}
+        # (kind, id) -> normalized forms, the name's own form first
+        self._texts: dict[tuple, tuple[str, ...]] = {}
+        self._names = {kind: SortedTerms() for kind in KINDS}
+        self._words = {kind: SortedTerms() for kind in KINDS}
+        self._trigrams: dict[str, set] = defaultdict(set)
+        self._lock = threading.RLock()
+        self.ready = False
+        self.build_seconds = 0.0
+        self.lookups = 0
+
+    # ---- updates -------------------------------------------------------------
+
+    @staticmethod
+    def _word_terms(normalized: str) -> set[str]:
+        """Every word suffix of the name ("black keys", "keys" for "the black keys")"""
+        words = normalized.split()
+        return {" ".join(words[i:]) for i in range(1, len(words))}
+
+    def _all_word_terms(self, forms: tuple) -> set[str]:
+        return set().union(*map(self._word_terms, forms)) - set(forms)
+
+    @staticmethod
+    def _all_trigrams(forms: tuple) -> set[str]:
+        return set().union(*map(trigrams, forms))
+
+    def add(self, kind: str, doc_id: str, text: str, doc: dict) -> None:
+        """Insert or replace one document"""
+        if not doc_id or not text:
+            return
+        key = (kind, doc_id)
+        spellings = [text, *(self.variants(text) if self.variants else ())]
+        forms = tuple(dict.fromkeys(filter(None, map(self.normalize, spellings))))
+        if not forms:
+            return
+        with self._lock:
+            if key in self._texts:
+                self._unindex(key)
+            self._docs[key] = doc
+            self._texts[key] = forms
+            for form in forms:
+                self._names[kind].add(form, key)
+            for term in self._all_word_terms(forms):
+                self._words[kind].add(term, key)
+            for gram in self._all_trigrams(forms):
+                self._trigrams[gram].add(key)
+
+    def remove(self, kind: str, doc_id: str) -> None:
+        key = (kind, doc_id)
+        with self._lock:
+            if key in self._texts:
+                self._unindex(key)
+                del self._docs[key]
+                del self._texts[key]
+
+    def _unindex(self, key: tuple) -> None:
+        kind, forms = key[0], self._texts[key]
+        for form in forms:
+            self._names[kind].remove(form, key)
+        for term in self._all_word_terms(forms):
+            self._words[kind].remove(term, key)
+        for gram in self._all_trigrams(forms):
+            postings = self._trigrams.get(gram)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self._trigrams[gram]
+
+    # ---- lookups -------------------------------------------------------------
+
+    def _infix(self, query: str, kinds, limit: int, seen: set) -> list[tuple]:
+        grams = sorted(trigrams(query), key=lambda g: len(self._trigrams.get(g, ())))
+        if not grams:
+            return []
+        candidates = self._trigrams.get(grams[0], set())
+        for gram in grams[1:]:
+            if not candidates:
+                return []
+            candidates = candidates & self._trigrams.get(gram, set())
+        hits = [
+            key for key in candidates
+            if key[0] in kinds and key not in seen and any(query in form for form in self._texts[key])
+        ]
+        hits.sort(key=lambda key: len(self._texts[key][0]))
+        hits = hits[:limit]
+        seen.update(hits)
+        return hits
+
+    def _fuzzy(self, query: str, kinds, limit: int, seen: set) -> list[tuple]:
+        """(distance, key) for names or words starting within max_typos(query) edits of query"""
+        bound = max_typos(query)
+        postings = [self._trigrams.get(gram, ()) for gram in trigrams(query)]
+        grams = [keys for keys in postings if len(keys) <= FUZZY_MAX_POSTINGS]
+        if not bound or not grams:
+            return []
+        counts = Counter()
+        for keys in grams:
+            counts.update(keys)
+        # Each edit changes at most 3 of the query's trigrams
+        needed = max(1, len(grams) - 3 * bound)
+        hits = []
+        for key, shared in counts.most_common(FUZZY_CANDIDATES):
+            if shared < needed:
+                break
+            if key[0] not in kinds or key in seen:
+                continue
+            forms = self._texts[key]
+            distance = min(
+                prefix_distance(query, term, bound)
+                for term in (*forms, *self._all_word_terms(forms))
+            )
+            if distance <= bound:
+                seen.add(key)
+                hits.append((distance, len(forms[0]), key))
+        hits.sort()
+        return [(distance, key) for distance, _, key in hits[:limit]]
+
+    def search(self, q: str, limit: int = 10, kinds=KINDS) -> list[dict]:
+        """Ranked copies of the documents: exact name, name prefix, word prefix, infix,
+        then (fewest edits first) typo-tolerant matches.
+
+        Within a tier artists come before albums before songs, shorter names first.
+        """
+        query = self.normalize(q)
+        if not query:
+            return []
+        self.lookups += 1
+        kinds = [kind for kind in KINDS if kind in kinds]
+        with self._lock:
+            seen: set = set()
+            tiers = []
+            for index in (self._names, self._words):
+                keys = []
+                for kind in kinds:
+                    keys += index[kind].prefixed(query, limit, seen)
+                tiers.append(keys)
+            if sum(map(len, tiers)) < limit:
+                tiers.append(self._infix(query, kinds, limit, seen))
+            fuzzy = self._fuzzy(query, kinds, limit, seen) if sum(map(len, tiers)) < limit else []
+
+            ranked = []
+            for tier, keys in enumerate(tiers):
+                for key in keys:
+                    forms = self._texts[key]
+                    exact = tier == 0 and query in forms
+                    ranked.append(((tier if not exact else -1), 0, KINDS.index(key[0]), len(forms[0]), key))
+            for distance, key in fuzzy:
+                ranked.append((len(tiers), distance, KINDS.index(key[0]), len(self._texts[key][0]), key))
+            ranked.sort()
+            return [dict(self._docs[key]) for *_, key in ranked[:limit]]
+
+    # ---- catalog rows ----------------------------------------------------------
+
+    def add_artist_row(self, row: dict) -> None:
+        thumbnails = row.get("thumbnails")
+        thumbnail = row.get("thumbnail_url") or (
+            thumbnails[0].get("url") if isinstance(thumbnails, list) and thumbnails else None
+        )
+        self.add("artist", row.get("browse_id"), row.get("name") or "", {
+            "browseId": row.get("browse_id"),
+            "artist": row.get("name"),
+            "thumbnail": thumbnail,
+            "subscribers": row.get("subscribers"),
+        })
+
+    def add_album_row(self, row: dict) -> None:
+        thumbnail = row.get("thumbnail_url")
+        self.add("album", row.get("browse_id"), row.get("title") or "", {
+            "browseId": row.get("browse_id"),
+            "title": row.get("title"),
+            "thumbnails": [{"url": thumbnail}] if thumbnail else [],
+            "year": row.get("year"),
+            "type": row.get("type") or row.get("album_type") or "Album",
+        })
+
+    def add_track_row(self, row: dict) -> None:
+        thumbnail = row.get("thumbnail_url")
+        artist_name = row.get("artist_name")
+        self.add("song", row.get("video_id"), row.get("title") or "", {
+            "videoId": row.get("video_id"),
+            "title": row.get("title"),
+            "artists": [{"name": artist_name}] if artist_name else [],
+            "thumbnails": [{"url": thumbnail}] if thumbnail else [],
+            "duration": row.get("duration"),
+        })
+
+    def load(self, supabase) -> None:
+        """Load every catalog row (blocking; run in a thread at startup)"""
+        started = time.monotonic()
+        terms = [*self._names.values(), *self._words.values()]
+        with self._lock:
+            for sorted_terms in terms:
+                sorted_terms.start_bulk()
+        # (table, columns, unique key for a stable page order, add_row)
+        tables = (
+            ("music_artists", "browse_id, name, thumbnail_url, thumbnails, subscribers", "browse_id", self.add_artist_row),
+            ("music_albums", "browse_id, title, thumbnail_url, year, type", "browse_id", self.add_album_row),
+            ("music_tracks", "video_id, title, artist_name, thumbnail_url, duration", "video_id", self.add_track_row),
+        )
+        try:
+            for table, columns, key, add_row in tables:
+                start = 0
+                while True:
+                    query = supabase.table(table).select(columns).order(key).range(start, start + LOAD_PAGE_SIZE - 1)
+                    rows = query.execute().data or []
+                    for row in rows:
+                        add_row(row)
+                    if len(rows) < LOAD_PAGE_SIZE:
+                        break
+                    start += LOAD_PAGE_SIZE
+        finally:
+            with self._lock:
+                for sorted_terms in terms:
+                    sorted_terms.finish_bulk()
+        self.ready = True
+        self.build_seconds = round(time.monotonic() - started, 2)
+        logger.info(f"Catalog index loaded: {len(self._docs)} documents in {self.build_seconds}s")
+
+    def stats(self) -> dict:
+        counts = {kind: 0 for kind in KINDS}
+        for kind, _ in list(self._docs):
+            counts[kind] += 1
+        return {
+            "ready": self.ready,
+            "documents": counts,
+            "prefix_terms": sum(len(t) for t in [*self._names.values(), *self._words.values()]),
+            "trigrams": len(self._trigrams),
+            "build_seconds": self.build_seconds,
+            "lookups": self.lookups,
+        }
@@ -0,0 +1,163 @@
+# VibeStation Backend - Text normalization for catalog search
+#
+# fold() maps names and queries to one comparable form:
+#   NFKC (full-width -> ASCII, compatibility jamo -> conjoining jamo), case folding,
+#   katakana -> hiragana, Hangul syllables -> jamo (so "블랙ㅍ" is a prefix of "블랙핑크")
+# name_variants() adds the other spellings a name is searched by: romanized Hangul/kana,
+# a form without punctuation/spaces and known aliases ("BTS" <-> "방탄소년단").
+# prefix_distance() is the bounded edit distance used for typo-tolerant matching.
+import unicodedata
+
+# ---- folding -------------------------------------------------------------------
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+KATAKANA_FIRST = 0x30A1
+KATAKANA_LAST = 0x30F6
+KATAKANA_OFFSET = 0x60  # ア (U+30A2) -> あ (U+3042)
+
+
+def _fold_char(ch: str) -> str:
+    code = ord(ch)
+    if HANGUL_BASE <= code <= HANGUL_LAST:
+        # NFD splits a syllable into leading consonant, vowel and optional final consonant
+        return unicodedata.normalize("NFD", ch)
+    if KATAKANA_FIRST <= code <= KATAKANA_LAST:
+        return chr(code - KATAKANA_OFFSET)
+    return ch
+
+
+def fold(text: str | None) -> str:
+    """Comparable form of a name or query"""
+    if not text:
+        return ""
+    text = " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+    return "".join(map(_fold_char, text))
+
+
+def compact(text: str) -> str:
+    """Letters and digits only ("(G)I-DLE" -> "gidle", "fromis_9" -> "fromis9")"""
+    return "".join(ch for ch in unicodedata.normalize("NFKC", text).casefold() if ch.isalnum())
+
+
+# ---- romanization ----------------------------------------------------------------
+
+# Revised Romanization per jamo (no sound-change rules)
+LEADS = ["g", "kk", "n", "d", "tt", "r", "m", "b", "pp", "s", "ss", "", "j", "jj", "ch", "k", "t", "p", "h"]
+VOWELS = [
+    "a", "ae", "ya", "yae", "eo", "e", "yeo", "ye", "o", "wa", "wae", "oe", "yo",
+    "u", "wo", "we", "wi", "yu", "eu", "ui", "i",
+]
+TAILS = [
+    "", "k", "k", "ks", "n", "nj", "nh", "t", "l", "lk", "lm", "lb", "ls", "lt", "lp", "lh",
+    "m", "p", "ps", "t", "t", "ng", "t", "t", "k", "t", "p", "t",
+]
+
+# Hepburn for hiragana (katakana is folded to hiragana first)
+KANA = dict(zip(
+    "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをん"
+    "がぎぐげござじずぜぞだぢづでどばびぶべぼぱぴぷぺぽぁぃぅぇぉゔ",
+    [
+        "a", "i", "u", "e", "o", "ka", "ki", "ku", "ke", "ko", "sa", "shi", "su", "se", "so",
+        "ta", "chi", "tsu", "te", "to", "na", "ni", "nu", "ne", "no", "ha", "hi", "fu", "he", "ho",
+        "ma", "mi", "mu", "me", "mo", "ya", "yu", "yo", "ra", "ri", "ru", "re", "ro", "wa", "o", "n",
+        "ga", "gi", "gu", "ge", "go", "za", "ji", "zu", "ze", "zo", "da", "ji", "zu", "de", "do",
+        "ba", "bi", "bu", "be", "bo", "pa", "pi", "pu", "pe", "po", "a", "i", "u", "e", "o", "vu",
+    ],
+))
+SMALL_Y = {"ゃ": "a", "ゅ": "u", "ょ": "o"}
+
+
+def _romanize_kana(text: str) -> str:
+    out = []
+    double_next = False
+    for ch in text:
+        if ch == "っ":
+            double_next = True
+            continue
+        if ch in SMALL_Y and out and out[-1][-1:] == "i":
+            # きゃ -> kya, しゃ -> sha, ちゃ -> cha
+            prev = out.pop()
+            stem = prev[:-1] if prev[:-1] in ("sh", "ch", "j") else prev[:-1] + "y"
+            out.append(stem + SMALL_Y[ch])
+            continue
+        if ch == "ー":
+            out.append(out[-1][-1:] if out else "")
+            continue
+        roman = KANA.get(ch, ch)
+        if double_next and roman[:1].isalpha():
+            roman = roman[0] + roman
+        double_next = False
+        out.append(roman)
+    return "".join(out)
+
+
+def romanize(text: str) -> str:
+    """Latin spelling of the Hangul and kana in text; other characters are kept"""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            index = code - HANGUL_BASE
+            out.append(LEADS[index // 588] + VOWELS[(index % 588) // 28] + TAILS[index % 28])
+        elif KATAKANA_FIRST <= code <= KATAKANA_LAST:
+            out.append(chr(code - KATAKANA_OFFSET))
+        else:
+            out.append(ch)
+    return _romanize_kana("".join(out))
+
+
+def has_hangul_or_kana(text: str) -> bool:
+    return any(
+        HANGUL_BASE <= ord(ch) <= HANGUL_LAST or 0x3041 <= ord(ch) <= KATAKANA_LAST for ch in text
+    )
+
+
+# ---- variants ---------------------------------------------------------------------
+
+def alias_table(groups) -> dict[str, tuple[str, ...]]:
+    """{folded name: other names} from groups of names that mean the same artist"""
+    table = {}
+    for group in groups:
+        for name in group:
+            table[fold(name)] = tuple(other for other in group if other != name)
+    return table
+
+
+def name_variants(text: str, aliases: dict | None = None) -> list[str]:
+    """Other spellings to index text under (not folded)"""
+    variants = list((aliases or {}).get(fold(text), ()))
+    for spelling in [text, *variants]:
+        if has_hangul_or_kana(spelling):
+            variants.append(romanize(spelling))
+    stripped = compact(text)
+    if stripped and stripped != text.casefold().replace(" ", ""):
+        variants.append(stripped)
+    return variants
+
+
+# ---- typo tolerance -----------------------------------------------------------------
+
+def max_typos(query: str) -> int:
+    """Edits allowed for a (folded) query: none for short ones, more for longer ones"""
+    if len(query) < 4:
+        return 0
+    return 1 if len(query) < 8 else 2
+
+
+def prefix_distance(query: str, text: str, bound: int) -> int:
+    """Edit distance between query and the closest prefix of text, or bound + 1 if above bound"""
+    previous = list(range(len(text) + 1))
+    for i, qc in enumerate(query, 1):
+        current = [i]
+        for j, tc in enumerate(text, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (qc != tc),
+            ))
+        if min(current) > bound:
+            return bound + 1
+        previous = current
+    return min(min(previous), bound + 1)
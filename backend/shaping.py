@@ -0,0 +1,59 @@
+# VibeStation Backend - Field-selective response shaping
+#
+# /api/artist/{id}?fields=card  -> named profile
+# /api/album/{id}?fields=title,tracks.title,tracks.videoId  -> explicit dotted paths
+
+# Named field sets per payload type (what each frontend view actually renders)
+PROFILES = {
+    "artist": {
+        "card": ["name", "channelId", "thumbnails", "subscribers"],
+        "page": [
+            "name", "channelId", "thumbnails", "subscribers", "description",
+            "songs", "albums", "singles", "videos", "related",
+        ],
+    },
+    "album": {
+        "card": ["title", "type", "year", "thumbnails", "artists", "audioPlaylistId"],
+        "page": [
+            "title", "type", "year", "thumbnails", "artists", "trackCount",
+            "duration", "description", "audioPlaylistId", "tracks",
+        ],
+    },
+}
+
+
+def parse_fields(kind: str, fields: str | None) -> dict | None:
+    """Turn a profile name or comma-separated dotted paths into a projection tree.
+
+    Returns None when no projection is requested. Leaves of the tree are None,
+    meaning "keep the whole value".
+    """
+    if not fields:
+        return None
+    paths = PROFILES.get(kind, {}).get(fields.strip())
+    if paths is None:
+        paths = [p.strip() for p in fields.split(",") if p.strip()]
+    tree: dict = {}
+    for path in paths:
+        node = tree
+        parts = path.split(".")
+        for part in parts[:-1]:
+            child = node.get(part, {})
+            if child is None:
+                # A parent path was already requested whole
+                break
+            node = node.setdefault(part, child)
+        else:
+            node[parts[-1]] = None
+    return tree or None
+
+
+def project(data, tree: dict | None):
+    """Copy only the requested fields; lists apply the subtree to every item"""
+    if tree is None or data is None:
+        return data
+    if isinstance(data, list):
+        return [project(item, tree) for item in data]
+    if not isinstance(data, dict):
+        return data
+    return {key: project(data[key], sub) for key, sub in tree.items() if key in data}
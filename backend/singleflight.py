@@ -0,0 +1,45 @@
+# VibeStation Backend - Request coalescing for identical upstream calls
+import asyncio
+
+
+class SingleFlight:
+    """Share one in-flight task between concurrent callers using the same key.
+
+    The first caller starts the work; callers arriving before it finishes await the
+    same task. A caller being cancelled (client disconnect) does not cancel the
+    shared task for the others.
+    """
+
+    def __init__(self):
+        self._inflight: dict = {}
+        self.calls = 0
+        self.executions = 0
+        self.deduplicated = 0
+
+    async def do(self, key, fn):
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            self.deduplicated += 1
+        return await asyncio.shield(task)
+
+    def _done(self, key, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved when every waiter has gone away
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        return {
+            "inflight": len(self._inflight),
+            "calls": self.calls,
+            "executions": self.executions,
+            "deduplicated": self.deduplicated,
+            "dedup_rate": round(self.deduplicated / self.calls, 4) if self.calls else 0.0,
+        }
@@ -0,0 +1,61 @@
+# Round trip of the shared cache through the redis protocol (fakeredis)
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cache_backend
+from cache_backend import CacheBackend, COMPRESS_MIN_BYTES, create_backend, namespaced_key
+
+pytest.importorskip("fakeredis")
+pytest.importorskip("msgpack")
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend()
+
+
+def test_fakeredis_round_trip_small_and_compressed():
+    async def scenario():
+        backend = create_backend("fakeredis")
+        assert backend is not None and backend.name == "fakeredis"
+
+        small = {"title": "Ditto", "year": 2022}
+        large = {"tracks": [{"videoId": f"v{i}", "title": "곡 " * 10} for i in range(100)]}
+
+        await backend.set("album", "MPREb_small", small, ttl=60)
+        await backend.set("artist", "UC_large", large, ttl=60)
+
+        raw_small = await backend._client.get(namespaced_key("album", "MPREb_small"))
+        raw_large = await backend._client.get(namespaced_key("artist", "UC_large"))
+        assert raw_small[:2] == b"m-"
+        assert raw_large[:2] == b"mz"
+        assert len(cache_backend.msgpack.packb(large)) >= COMPRESS_MIN_BYTES
+        assert len(raw_large) < len(cache_backend.msgpack.packb(large))
+
+        assert await backend.get("album", "MPREb_small") == small
+        assert await backend.get("artist", "UC_large") == large
+        assert await backend.get("album", "missing") is None
+
+        await backend.delete("artist", "UC_large")
+        assert await backend.get("artist", "UC_large") is None
+
+        stats = backend.stats()
+        assert (stats["hits"], stats["misses"], stats["errors"]) == (2, 2, 0)
+        assert stats["serializer"] == "msgpack"
+        await backend.close()
+
+    run(scenario())
+
+
+def test_version_bump_namespaces_keys():
+    assert namespaced_key("artist_albums", "UC1") == "vibestation:artist_albums:v2:UC1"
+    assert namespaced_key("unlisted", "k") == "vibestation:unlisted:v1:k"
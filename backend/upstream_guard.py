@@ -0,0 +1,184 @@
+# VibeStation Backend - Upstream rate limiting and circuit breaking
+import asyncio
+import logging
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Lanes in priority order: a waiting interactive call is always served first
+LANES = ("interactive", "background")
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, retry_in: float):
+        super().__init__(f"Upstream circuit open, retry in {retry_in:.0f}s")
+        self.retry_in = retry_in
+
+
+class TokenBucket:
+    """Global token bucket (rate tokens/sec, up to burst) with priority lanes"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiters: dict[str, deque] = {lane: deque() for lane in LANES}
+        self._drainer: asyncio.Task | None = None
+        self.granted = {lane: 0 for lane in LANES}
+        self.waited = {lane: 0 for lane in LANES}
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _has_waiters(self) -> bool:
+        return any(self._waiters[lane] for lane in LANES)
+
+    async def acquire(self, lane: str = "interactive") -> None:
+        self._refill()
+        if self._tokens >= 1 and not self._has_waiters():
+            self._tokens -= 1
+            self.granted[lane] += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[lane].append(future)
+        self.waited[lane] += 1
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.create_task(self._drain())
+        await future
+
+    async def _drain(self) -> None:
+        while self._has_waiters():
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                continue
+            for lane in LANES:
+                queue = self._waiters[lane]
+                # Drop callers that were cancelled while waiting
+                while queue and queue[0].done():
+                    queue.popleft()
+                if queue:
+                    queue.popleft().set_result(None)
+                    self._tokens -= 1
+                    self.granted[lane] += 1
+                    break
+
+    def stats(self) -> dict:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 2),
+            "queued": {lane: len(self._waiters[lane]) for lane in LANES},
+            "granted": dict(self.granted),
+            "waited": dict(self.waited),
+        }
+
+
+class CircuitBreaker:
+    """closed -> open after N consecutive upstream failures -> half-open after a cool-down.
+
+    In half-open a single trial call is let through; success closes the circuit,
+    failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self.trips = 0
+        self.rejected = 0
+
+    def before_call(self) -> None:
+        if self.state == "open":
+            elapsed = time.monotonic() - self._opened_at
+            if elapsed < self.reset_timeout:
+                self.rejected += 1
+                raise CircuitOpenError(self.reset_timeout - elapsed)
+            self.state = "half_open"
+        if self.state == "half_open":
+            if self._trial_running:
+                self.rejected += 1
+                raise CircuitOpenError(self.reset_timeout)
+            self._trial_running = True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._trial_running = False
+        if self.state != "closed":
+            logger.info("Upstream circuit closed")
+        self.state = "closed"
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._trial_running = False
+        if self.state == "half_open" or self._failures >= self.failure_threshold:
+            if self.state != "open":
+                self.trips += 1
+                logger.warning(f"Upstream circuit opened after {self._failures} failures")
+            self.state = "open"
+            self._opened_at = time.monotonic()
+
+    def record_neutral(self) -> None:
+        """Call finished with a non-upstream error (bad ID, parse error): no verdict"""
+        self._trial_running = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "trips": self.trips,
+            "rejected": self.rejected,
+        }
+
+
+class UpstreamGuard:
+    """Every upstream call: circuit check -> rate-limit token (by lane) -> call -> verdict"""
+
+    def __init__(self, limiter: TokenBucket, breaker: CircuitBreaker, failure_types: tuple):
+        self.limiter = limiter
+        self.breaker = breaker
+        self.failure_types = failure_types
+
+    async def run(self, fetch, lane: str = "interactive"):
+        self.breaker.before_call()
+        try:
+            await self.limiter.acquire(lane)
+            result = await fetch()
+        except self.failure_types:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.record_neutral()
+            raise
+        self.breaker.record_success()
+        return result
+
+    def stats(self) -> dict:
+        return {"rate_limit": self.limiter.stats(), "circuit": self.breaker.stats()}
+
+
+def create_upstream_guard(rate: float, burst: int, failure_threshold: int, reset_timeout: float) -> UpstreamGuard:
+    """Guard counting network errors, HTTP errors and non-JSON (blocked) responses as failures"""
+    import json
+    import requests
+    from ytmusicapi.exceptions import YTMusicServerError
+
+    failure_types = [YTMusicServerError, requests.RequestException, json.JSONDecodeError, TimeoutError]
+    try:
+        import httpx
+        failure_types.append(httpx.TransportError)
+    except ImportError:
+        pass
+    return UpstreamGuard(
+        TokenBucket(rate, burst),
+        CircuitBreaker(failure_threshold, reset_timeout),
+        tuple(failure_types),
+    )
@@ -0,0 +1,113 @@
+# VibeStation Backend - Write-behind queue for DB persistence off the request path
+#
+# Request handlers submit (key, func, args) and return immediately; one worker thread
+# runs the writes in submission order. Submitting a key that is still queued replaces
+# its arguments instead of queueing the same row twice. close() lets the worker finish
+# what is queued (lifespan shutdown).
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class WriteBehindQueue:
+    """Bounded queue of blocking write jobs run by a dedicated thread.
+
+    When max_pending jobs are queued, submit() drops the job (block=False, for
+    request handlers) or waits up to put_timeout seconds for room (block=True,
+    for background producers).
+    """
+
+    def __init__(self, max_pending: int = 2000, put_timeout: float = 5.0, name: str = "write-behind"):
+        self.max_pending = max_pending
+        self.put_timeout = put_timeout
+        self.name = name
+        self._keys: queue.Queue = queue.Queue(maxsize=max_pending)
+        # key -> (func, args, kwargs) for every queued key
+        self._jobs: dict = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self.completed = 0
+        self.failed = 0
+        self.deduped = 0
+        self.rejected = 0
+        self.busy_seconds = 0.0
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def submit(self, key, func, *args, block: bool = False, **kwargs) -> bool:
+        """Queue func(*args, **kwargs) under key; False if it was dropped"""
+        if self._closed:
+            self.rejected += 1
+            return False
+        job = (func, args, kwargs)
+        with self._lock:
+            if key in self._jobs:
+                self._jobs[key] = job
+                self.deduped += 1
+                return True
+            self._jobs[key] = job
+        try:
+            self._keys.put(key, block=block, timeout=self.put_timeout if block else None)
+        except queue.Full:
+            with self._lock:
+                self._jobs.pop(key, None)
+            self.rejected += 1
+            logger.warning(f"Write queue full ({self.max_pending}), dropped {key}")
+            return False
+        return True
+
+    def _run(self) -> None:
+        while True:
+            key = self._keys.get()
+            if key is _STOP:
+                return
+            with self._lock:
+                job = self._jobs.pop(key, None)
+            if job is None:
+                continue
+            func, args, kwargs = job
+            started = time.monotonic()
+            try:
+                func(*args, **kwargs)
+                self.completed += 1
+            except Exception as e:
+                self.failed += 1
+                logger.warning(f"Write-behind job {key} failed: {e}")
+            finally:
+                self.busy_seconds += time.monotonic() - started
+
+    def close(self, timeout: float = 30.0) -> None:
+        """Stop accepting jobs and wait up to timeout seconds for queued ones (blocking)"""
+        self._closed = True
+        if self._thread is None:
+            return
+        deadline = time.monotonic() + timeout
+        try:
+            self._keys.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(max(deadline - time.monotonic(), 0))
+        if self._thread.is_alive():
+            logger.warning(f"Write queue drain timed out with {len(self._jobs)} jobs left")
+        else:
+            logger.info(f"Write queue drained ({self.completed} done, {self.failed} failed)")
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._jobs),
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "deduped": self.deduped,
+            "rejected": self.rejected,
+            "busy_seconds": round(self.busy_seconds, 2),
+        }
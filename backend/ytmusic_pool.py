@@ -0,0 +1,84 @@
+# VibeStation Backend - Pooled YTMusic clients
+import logging
+import threading
+from functools import partial
+
+import requests
+from requests.adapters import HTTPAdapter
+from ytmusicapi import YTMusic
+
+logger = logging.getLogger(__name__)
+
+# Same per-request timeout ytmusicapi applies to the sessions it creates itself
+REQUEST_TIMEOUT = 30
+
+
+class YTMusicRegistry:
+    """Thread-safe registry of warmed YTMusic clients keyed by (language, location).
+
+    Each client owns a keep-alive requests session whose connection pool is sized
+    to the executor, so concurrent calls for the same country reuse open TLS
+    connections instead of building a new client per request.
+    """
+
+    def __init__(self, pool_size: int = 4):
+        self.pool_size = pool_size
+        self._clients: dict[tuple[str, str], YTMusic] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.warmed = 0
+
+    @staticmethod
+    def _key(language: str, location: str | None) -> tuple[str, str]:
+        return (language or "en", (location or "").upper())
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        session.mount("https://", adapter)
+        session.request = partial(session.request, timeout=REQUEST_TIMEOUT)
+        return session
+
+    def get(self, language: str = "en", location: str | None = None) -> YTMusic:
+        key = self._key(language, location)
+        client = self._clients.get(key)
+        if client is not None:
+            self.hits += 1
+            return client
+
+        # YTMusic() calls locale.setlocale, so construction stays under the lock
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                self.misses += 1
+                client = YTMusic(language=key[0], location=key[1], requests_session=self._new_session())
+                self._clients[key] = client
+            else:
+                self.hits += 1
+        return client
+
+    def warm(self, locations: list[str], language: str = "en") -> int:
+        """Create clients and open their upstream connection ahead of traffic"""
+        warmed = 0
+        for location in [None, *locations]:
+            try:
+                client = self.get(language, location)
+                # Resolves the visitor id once, which also opens the pooled connection
+                client.base_headers
+                warmed += 1
+            except Exception as e:
+                logger.warning(f"YTMusic warm-up failed for {location}: {e}")
+        self.warmed += warmed
+        return warmed
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "clients": len(self._clients),
+            "pool_size": self.pool_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "warmed": self.warmed,
+        }
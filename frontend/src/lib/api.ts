@@ -13,6 +13,35 @@ export async function fetchAPI(endpoint: string) {
   }
 }
 
+export type BatchLookup = { id: string; type: string; key: string; fields?: string };
+export type BatchResult = { id: string; success: boolean; data?: unknown; error?: string };
+
+// POST /api/batch: yields one result per lookup as soon as the server has it
+export async function* batchAPI(lookups: BatchLookup[]): AsyncGenerator<BatchResult> {
+  const res = await fetch(`${API_BASE}/api/batch`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ requests: lookups }),
+  });
+  if (!res.ok || !res.body) {
+    for (const lookup of lookups) yield { id: lookup.id, success: false, error: `HTTP ${res.status}` };
+    return;
+  }
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  while (true) {
+    const { done, value } = await reader.read();
+    buffer += decoder.decode(value, { stream: !done });
+    const lines = buffer.split('\n');
+    buffer = lines.pop() ?? '';
+    for (const line of lines) {
+      if (line.trim()) yield JSON.parse(line);
+    }
+    if (done) break;
+  }
+}
+
 export const api = {
   // Home
   getHome: (limit = 5, country?: string) => fetchAPI(`/api/home?limit=${limit}${country ? `&country=${country}` : ''}`),
@@ -20,6 +49,9 @@ export const api = {
   // Search
   search: (query: string, filter?: string) =>
     fetchAPI(`/api/search?q=${encodeURIComponent(query)}${filter ? `&filter=${filter}` : ''}`),
+  // Paged variants: pass the previous response's data.nextCursor to get the next page
+  searchPage: (query: string, filter?: string, cursor?: string) =>
+    fetchAPI(`/api/search?q=${encodeURIComponent(query)}${filter ? `&filter=${filter}` : ''}${cursor ? `&cursor=${encodeURIComponent(cursor)}` : '&paged=true'}`),
   getSuggestions: (query: string) =>
     fetchAPI(`/api/search/suggestions?q=${encodeURIComponent(query)}`),
 
@@ -34,11 +66,13 @@ export const api = {
   getMoodPlaylists: (params: string) => fetchAPI(`/api/mood-playlists?params=${encodeURIComponent(params)}`),
 
   // Artist
-  getArtist: (id: string) => fetchAPI(`/api/artist/${id}`),
+  getArtist: (id: string, fields = 'page') => fetchAPI(`/api/artist/${id}?fields=${fields}`),
   getArtistAlbums: (id: string) => fetchAPI(`/api/artist/${id}/albums`),
+  getArtistAlbumsPage: (id: string, cursor?: string) =>
+    fetchAPI(`/api/artist/${id}/albums?${cursor ? `cursor=${encodeURIComponent(cursor)}` : 'paged=true'}`),
 
   // Album
-  getAlbum: (id: string) => fetchAPI(`/api/album/${id}`),
+  getAlbum: (id: string, fields = 'page') => fetchAPI(`/api/album/${id}?fields=${fields}`),
 
   // Song
   getSong: (videoId: string) => fetchAPI(`/api/song/${videoId}`),
@@ -54,4 +88,9 @@ export const api = {
 
   // Playlist
   getPlaylist: (id: string) => fetchAPI(`/api/playlist/${id}`),
+  getPlaylistPage: (id: string, cursor?: string) =>
+    fetchAPI(`/api/playlist/${id}?${cursor ? `cursor=${encodeURIComponent(cursor)}` : 'paged=true'}`),
+
+  // Batch
+  batch: (lookups: BatchLookup[]) => batchAPI(lookups),
 };
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Compare query count and latency of loading full artist data (artist + albums + tracks)
+per artist (old db_get_full_artist_data + db_check_artist_needs_sync loop) versus one
+batched in_() query per table (db_get_full_artists_data).
+
+Usage:
+  SUPABASE_URL=... SUPABASE_SERVICE_ROLE_KEY=... python scripts/artist_query_bench.py [UCxxxx ...]
+Without IDs, the most recently synced artists in music_artists are used.
+"""
+
+import sys
+import io
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import os
+import time
+import statistics
+from supabase import create_client
+
+SUPABASE_URL = os.getenv("SUPABASE_URL")
+SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+SIZES = [1, 5, 20]
+RUNS = 5
+PAGE_SIZE = 1000
+
+
+class Counter:
+    """Executes queries and counts round trips."""
+
+    def __init__(self):
+        self.queries = 0
+
+    def run(self, query):
+        self.queries += 1
+        return query.execute().data or []
+
+    def run_all(self, build_query):
+        rows = []
+        while True:
+            page = self.run(build_query().range(len(rows), len(rows) + PAGE_SIZE - 1))
+            rows.extend(page)
+            if len(page) < PAGE_SIZE:
+                return rows
+
+
+def per_artist(client, counter: Counter, browse_ids: list) -> int:
+    tracks = 0
+    for browse_id in browse_ids:
+        counter.run(client.table("music_artists").select("*").eq("browse_id", browse_id).limit(1))
+        albums = counter.run(client.table("music_albums").select("*").eq("artist_browse_id", browse_id).order("year", desc=True))
+        rows = counter.run(client.table("music_tracks").select("*").eq("artist_browse_id", browse_id).order("created_at", desc=True))
+        # albumTitle lookup as before: linear scan over albums per track
+        for track in rows:
+            next((a.get("title") for a in albums if a.get("browse_id") == track.get("album_browse_id")), "")
+        counter.run(client.table("music_artists").select("last_synced_at").eq("browse_id", browse_id).limit(1))
+        tracks += len(rows)
+    return tracks
+
+
+def batched(client, counter: Counter, browse_ids: list) -> int:
+    counter.run(client.table("music_artists").select("*").in_("browse_id", browse_ids))
+    albums = counter.run_all(lambda: client.table("music_albums").select("*").in_(
+        "artist_browse_id", browse_ids).order("year", desc=True).order("browse_id"))
+    rows = counter.run_all(lambda: client.table("music_tracks").select("*").in_(
+        "artist_browse_id", browse_ids).order("created_at", desc=True).order("video_id"))
+    titles = {a.get("browse_id"): a.get("title") for a in albums}
+    for track in rows:
+        titles.get(track.get("album_browse_id"))
+    return len(rows)
+
+
+def measure(fn, client, browse_ids: list) -> tuple[int, int, float]:
+    """(queries, tracks, median ms) over RUNS runs."""
+    timings = []
+    for _ in range(RUNS):
+        counter = Counter()
+        started = time.perf_counter()
+        tracks = fn(client, counter, browse_ids)
+        timings.append((time.perf_counter() - started) * 1000)
+    return counter.queries, tracks, statistics.median(timings)
+
+
+def main():
+    if not SUPABASE_URL or not SERVICE_ROLE_KEY:
+        print("ERROR: SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY environment variables must be set!")
+        sys.exit(1)
+    client = create_client(SUPABASE_URL, SERVICE_ROLE_KEY)
+
+    ids = sys.argv[1:]
+    if not ids:
+        rows = client.table("music_artists").select("browse_id").order(
+            "last_synced_at", desc=True).limit(max(SIZES)).execute().data or []
+        ids = [row["browse_id"] for row in rows]
+
+    print(f"{'artists':>7}  {'mode':<10} {'queries':>7} {'tracks':>7} {'median ms':>10}")
+    for size in SIZES:
+        if size > len(ids):
+            break
+        browse_ids = ids[:size]
+        for name, fn in (("per-artist", per_artist), ("batched", batched)):
+            queries, tracks, ms = measure(fn, client, browse_ids)
+            print(f"{size:>7}  {name:<10} {queries:>7} {tracks:>7} {ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
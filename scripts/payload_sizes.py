@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Measure /api/artist and /api/album payload sizes per fields= profile.
+
+Usage:
+  API_BASE=http://localhost:8080 python scripts/payload_sizes.py UCxxxx MPRExxxx ...
+IDs starting with MPRE are measured as albums, everything else as artists.
+"""
+
+import sys
+import io
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import os
+import gzip
+import requests
+
+API_BASE = os.getenv("API_BASE", "http://localhost:8080")
+PROFILES = ["", "page", "card"]
+
+
+def measure(path: str, fields: str) -> tuple[int, int]:
+    """Return (raw bytes, gzip bytes) of one response."""
+    url = f"{API_BASE}{path}" + (f"?fields={fields}" if fields else "")
+    body = requests.get(url, headers={"Accept-Encoding": "identity"}, timeout=60).content
+    return len(body), len(gzip.compress(body))
+
+
+def main():
+    ids = sys.argv[1:]
+    if not ids:
+        print(__doc__)
+        sys.exit(1)
+
+    for item_id in ids:
+        path = f"/api/album/{item_id}" if item_id.startswith("MPRE") else f"/api/artist/{item_id}"
+        full_raw, full_gz = measure(path, "")
+        print(f"\n{path}")
+        for fields in PROFILES:
+            raw, gz = measure(path, fields) if fields else (full_raw, full_gz)
+            saved = 100 - raw * 100 // full_raw if full_raw else 0
+            print(f"  {fields or 'full':<6} {raw:>9,} B  gzip {gz:>8,} B  (-{saved}%)")
+
+
+if __name__ == "__main__":
+    main()
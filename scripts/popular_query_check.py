@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Check that a repeated search shows up as a popular-query suggestion.
+
+Searches the query twice through /api/search/summary (PopularQueries needs
+min_count=2), then asks /api/search/suggestions for its first characters and
+expects the query among the "query" suggestions.
+
+Usage:
+  API_BASE=http://localhost:8080 python scripts/popular_query_check.py "new jeans" [COUNTRY]
+"""
+
+import sys
+import io
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import os
+import requests
+
+API_BASE = os.getenv("API_BASE", "http://localhost:8080")
+SEARCHES = 2
+PREFIX_LENGTH = 3
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    query = sys.argv[1]
+    country = sys.argv[2] if len(sys.argv) > 2 else "US"
+
+    for _ in range(SEARCHES):
+        response = requests.get(f"{API_BASE}/api/search/summary",
+                                params={"q": query, "country": country}, timeout=120)
+        print(f"search {query!r}: {response.status_code} ({response.json().get('source')})")
+
+    prefix = query[:PREFIX_LENGTH]
+    suggestions = requests.get(f"{API_BASE}/api/search/suggestions",
+                               params={"q": prefix, "country": country}, timeout=30).json().get("suggestions", [])
+    texts = [s["text"] for s in suggestions if s.get("type") == "query"]
+    print(f"suggestions for {prefix!r}: {texts}")
+
+    if not any(text.lower() == query.lower() for text in texts):
+        print("FAIL: repeated query is not suggested")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+-- ============================================================================
+-- Materialized /api/search/summary results in music_search_cache
+-- result_json holds the full summary, artist_browse_ids the artists it was built
+-- from so that resyncing an artist can clear every summary containing it
+-- ============================================================================
+
+alter table music_search_cache
+add column if not exists artist_browse_ids text[] default '{}';
+
+-- Index for "summaries containing this artist" (artist_browse_ids @> array[...])
+create index if not exists idx_music_search_cache_artist_browse_ids
+on music_search_cache using gin (artist_browse_ids);
+
+comment on column music_search_cache.artist_browse_ids is 'Artist browse IDs the materialized result_json was built from';
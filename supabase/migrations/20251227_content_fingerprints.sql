@@ -0,0 +1,16 @@
+-- ============================================================================
+-- Content fingerprints for incremental artist sync
+-- music_artists.content_fingerprint: hash of the albums/singles sections on the
+--   artist page (item browse IDs, counts, paging); unchanged = skip the listing
+-- music_albums.content_fingerprint: hash of the album's listing entry; only
+--   albums whose fingerprint changed are fetched/saved again
+-- ============================================================================
+
+alter table music_artists
+add column if not exists content_fingerprint text;
+
+alter table music_albums
+add column if not exists content_fingerprint text;
+
+comment on column music_artists.content_fingerprint is 'Fingerprint of the albums/singles sections at the last complete sync';
+comment on column music_albums.content_fingerprint is 'Fingerprint of the album listing entry at the last save';
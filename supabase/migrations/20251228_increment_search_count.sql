@@ -0,0 +1,17 @@
+-- ============================================================================
+-- increment_search_count RPC (db_increment_search_count)
+-- Counts one search of a keyword in a country on every artist mapping of it;
+-- popular query suggestions use the largest count per keyword
+-- ============================================================================
+
+create or replace function increment_search_count(p_keyword text, p_country text)
+returns void
+language sql
+as $$
+  update search_keywords
+  set search_count = coalesce(search_count, 0) + 1,
+      last_searched_at = now()
+  where keyword_normalized = p_keyword
+    and country = p_country;
+$$;
+